@@ -0,0 +1,77 @@
+"""
+Profiles the time to import the bot's startup path (`main`), the way `python -X importtime`
+does, in fresh interpreters so no module is already loaded.
+
+Prints the median total import time and the packages and project modules that take the
+longest to import. An optional budget in milliseconds makes the run fail when the median
+goes over it, so import-time regressions show up:
+    $ python -m benchmarks.import_time
+    $ python -m benchmarks.import_time 600
+"""
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+TARGET = "main"
+
+
+def profile(target: str) -> List[Tuple[int, int, str]]:
+    """
+    Imports `target` in a fresh interpreter with `-X importtime`.
+
+    Returns
+    -------
+    List[Tuple[int, int, str]]
+        The self and cumulative import time in microseconds, and the name, of every module
+        imported, in the order they finished importing.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, check=True
+    )
+    rows = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+
+    return rows
+
+
+def by_package(rows: List[Tuple[int, int, str]]) -> Dict[str, int]:
+    """
+    Sums the self time of the modules of each top-level package, keeping project modules
+    (under `src`) separate.
+    """
+    totals = defaultdict(int)
+
+    for self_us, _, name in rows:
+        key = name if name.startswith("src.") else name.split(".")[0]
+        totals[key] += self_us
+
+    return totals
+
+
+if __name__ == "__main__":
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else None
+    runs = [profile(TARGET) for _ in range(5)]
+
+    # The target is the last module to finish importing, so its cumulative time is the total
+    totals_ms = [rows[-1][1] / 1e3 for rows in runs]
+    median_ms = statistics.median(totals_ms)
+
+    packages = by_package(runs[totals_ms.index(median_ms)])
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:15]
+
+    print(f"{'import ' + TARGET:>40}: {median_ms:>8.1f} ms (median of {len(runs)})")
+    for name, self_us in slowest:
+        print(f"{name:>40}: {self_us / 1e3:>8.1f} ms")
+
+    if budget_ms is not None and median_ms > budget_ms:
+        print(f"Import time of {median_ms:.1f} ms is over the {budget_ms:.1f} ms budget")
+        sys.exit(1)
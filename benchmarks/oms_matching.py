@@ -0,0 +1,70 @@
+"""
+Counts the order actions (amends, cancels and creates) and measures the time per diff of
+matching resting orders to target quotes level by level versus with the minimum-action
+matching, over a simulated ladder following a random walk mid price.
+
+Run from the project root:
+    $ python -m benchmarks.oms_matching
+"""
+import time
+import numpy as np
+from typing import Callable, List, Tuple
+from src.strategy.orderdiff import diff_orders
+
+
+def level_zip_diff(current: List, new: List, tick_size: float, lot_size: float) -> Tuple:
+    """
+    The previous diff, matching the i-th resting order to the i-th target quote.
+    """
+    tolerance = tick_size * (1 + 1e-6)
+    amends = [
+        [resting[0], target[1], target[2]]
+        for resting, target in zip(current, new)
+        if abs(resting[2] - target[1]) > tolerance or abs(resting[3] - target[2]) > lot_size / 2
+    ]
+    return amends, [resting[0] for resting in current[len(new):]], new[len(current):]
+
+
+def simulate(diff: Callable, mids: np.ndarray, levels: int, spacing: int, tick_size: float) -> Tuple[int, float]:
+    """
+    Requotes a bid ladder of `levels` orders `spacing` ticks apart at every mid, applying each
+    diff, and returns the total number of actions and the mean time per diff in microseconds.
+    """
+    current, next_id, actions, elapsed = [], 0, 0, 0
+
+    for mid in mids:
+        best = np.floor(mid / tick_size) * tick_size
+        new = [["Buy", round(best - i * spacing * tick_size, 2), 0.1] for i in range(levels)]
+
+        start = time.perf_counter_ns()
+        amends, cancels, creates = diff(current, new, tick_size, 0.01)
+        elapsed += time.perf_counter_ns() - start
+        actions += len(amends) + len(cancels) + len(creates)
+
+        orders = {resting[0]: resting for resting in current}
+        for order_id, price, qty in amends:
+            orders[order_id] = [order_id, "Buy", price, qty]
+        for order_id in cancels:
+            orders.pop(order_id)
+        for side, price, qty in creates:
+            next_id += 1
+            orders[str(next_id)] = [str(next_id), side, price, qty]
+
+        current = sorted(orders.values(), key=lambda x: x[2], reverse=True)
+
+    return actions, elapsed / mids.size / 1e3
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    tick_size = 0.01
+    mids = 3000 + np.cumsum(rng.normal(0, 0.05, 10000))
+
+    for spacing in (2, 10):
+        results = {
+            "level zip": simulate(level_zip_diff, mids, 4, spacing, tick_size),
+            "min actions": simulate(diff_orders, mids, 4, spacing, tick_size),
+        }
+
+        for name, (actions, per_diff) in results.items():
+            print(f"{spacing:>3} tick levels, {name:>11}: {actions:>6} actions over {mids.size} requotes | {per_diff:>6.2f} us/diff")
@@ -0,0 +1,123 @@
+"""
+Measures the memory allocated per order book delta message, before and after the
+preallocated book buffers, using tracemalloc.
+
+Run from the project root:
+    $ python -m benchmarks.orderbook_allocations
+"""
+import time
+import tracemalloc
+import numpy as np
+from typing import Dict, List
+from src.exchanges.bybit.websockets.handlers.orderbook import OrderBookBybit
+
+
+class LegacyOrderBookBybit:
+    """
+    The previous mask/vstack/argsort implementation, kept here as the baseline.
+    """
+
+    def __init__(self) -> None:
+        self.asks = np.empty((0, 2), dtype=np.float64)
+        self.bids = np.empty((0, 2), dtype=np.float64)
+
+    def sort_book(self) -> None:
+        self.asks = self.asks[self.asks[:, 0].argsort()][:500]
+        self.bids = self.bids[self.bids[:, 0].argsort()[::-1]][:500]
+
+    def update_book(self, asks_or_bids, data):
+        for price, qty in data:
+            asks_or_bids = asks_or_bids[asks_or_bids[:, 0] != price]
+            if qty > 0:
+                asks_or_bids = np.vstack((asks_or_bids, np.array([price, qty])))
+        return asks_or_bids
+
+    def process(self, recv: Dict) -> None:
+        asks = np.array(recv["data"]["a"], dtype=float)
+        bids = np.array(recv["data"]["b"], dtype=float)
+
+        if recv["type"] == "snapshot":
+            self.asks, self.bids = asks, bids
+            self.sort_book()
+
+        elif recv["type"] == "delta":
+            self.asks = self.update_book(self.asks, asks)
+            self.bids = self.update_book(self.bids, bids)
+            self.sort_book()
+
+
+def generate_messages(num_messages: int, levels_per_side: int=4, seed: int=42) -> List[Dict]:
+    """
+    Generates a 500 level Bybit-style snapshot followed by random delta messages.
+    """
+    rng = np.random.default_rng(seed)
+    mid, tick = 3000.0, 0.01
+
+    def level(price: float, qty: float) -> List[str]:
+        return [f"{price:.2f}", f"{qty:.3f}"]
+
+    snapshot = {
+        "type": "snapshot",
+        "data": {
+            "a": [level(mid + tick * (i + 1), rng.random() * 10) for i in range(500)],
+            "b": [level(mid - tick * i, rng.random() * 10) for i in range(500)],
+            "u": 1,
+        }
+    }
+
+    messages = [snapshot]
+
+    for update_id in range(2, num_messages + 2):
+        offsets = rng.integers(1, 600, size=(2, levels_per_side))
+        qtys = np.where(rng.random((2, levels_per_side)) < 0.3, 0.0, rng.random((2, levels_per_side)) * 10)
+        messages.append({
+            "type": "delta",
+            "data": {
+                "a": [level(mid + tick * o, q) for o, q in zip(offsets[0], qtys[0])],
+                "b": [level(mid - tick * o, q) for o, q in zip(offsets[1], qtys[1])],
+                "u": update_id,
+            }
+        })
+
+    return messages
+
+
+def measure(book, messages: List[Dict]) -> Dict:
+    """
+    Feeds messages to the book, returning the mean bytes allocated and time taken per delta.
+    """
+    book.process(messages[0])
+    book.process(messages[1])  # Ensure any JIT compilation happens before measuring
+
+    deltas = messages[2:]
+    allocated = 0
+
+    tracemalloc.start()
+    for recv in deltas:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        book.process(recv)
+        allocated += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    # Reset the book so the timed deltas are applied again, not dropped as stale
+    book.process(messages[0])
+    book.process(messages[1])
+
+    start = time.perf_counter_ns()
+    for recv in deltas:
+        book.process(recv)
+    elapsed = time.perf_counter_ns() - start
+
+    return {
+        "bytes_per_msg": allocated / len(deltas),
+        "us_per_msg": elapsed / len(deltas) / 1e3,
+    }
+
+
+if __name__ == "__main__":
+    messages = generate_messages(num_messages=5000)
+
+    for name, book in [("legacy", LegacyOrderBookBybit()), ("preallocated", OrderBookBybit())]:
+        result = measure(book, messages)
+        print(f"{name:>14}: {result['bytes_per_msg']:>10.1f} bytes/msg | {result['us_per_msg']:>8.2f} us/msg")
@@ -0,0 +1,61 @@
+"""
+Measures the time to build and sign the create-batch request body of a full 8 order
+ladder, from per-order dicts serialized to a str versus cached JSON templates encoded
+once to bytes.
+
+Run from the project root:
+    $ python -m benchmarks.payload_construction
+"""
+import orjson
+import time
+from typing import Callable, List, Tuple
+from src.exchanges.bybit.post.types import BybitFormats
+from src.exchanges.bybit.signer import BybitSigner
+
+
+def legacy_body(formats: BybitFormats, signer: BybitSigner, orders: List[Tuple]) -> str:
+    """
+    The previous path: stringify each field, build a dict per order, dump to bytes, decode
+    to a str, and have the str re-encoded for signing and sending.
+    """
+    batch_orders = [list(map(str, order)) for order in orders]
+    payload = {
+        "category": "linear",
+        "request": [formats.create_limit(*order) for order in batch_orders]
+    }
+    body = orjson.dumps(payload).decode()
+    signer.sign("1700000000000", body)
+    return body
+
+
+def template_body(formats: BybitFormats, signer: BybitSigner, orders: List[Tuple]) -> bytes:
+    body = formats.create_batch([formats.create_limit_json(*order) for order in orders])
+    signer.sign("1700000000000", body)
+    return body
+
+
+def timeit(func: Callable, iterations: int=100000) -> float:
+    """
+    Returns the mean time per call of `func` in microseconds, after a warmup call.
+    """
+    func()
+
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter_ns() - start
+
+    return elapsed / iterations / 1e3
+
+
+if __name__ == "__main__":
+    formats = BybitFormats("ETHUSDT")
+    signer = BybitSigner("XXXXXXXXXXXXXXXXXX", "YYYYYYYYYYYYYYYYYYYYYYYYYYYYYYYYYYYY")
+    ladder = [("Buy", 3000.0 - i * 0.5, 0.01) for i in range(4)] + [("Sell", 3000.5 + i * 0.5, 0.01) for i in range(4)]
+
+    assert orjson.loads(legacy_body(formats, signer, ladder)) == orjson.loads(template_body(formats, signer, ladder))
+
+    legacy = timeit(lambda: legacy_body(formats, signer, ladder))
+    template = timeit(lambda: template_body(formats, signer, ladder))
+
+    print(f"{'8 order ladder':>16}: {legacy:>6.2f} us dict -> str | {template:>6.2f} us template -> bytes")
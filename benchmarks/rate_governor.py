@@ -0,0 +1,101 @@
+"""
+Sends bursts of cancel requests to a local server enforcing Bybit's 10 requests per second
+window, with and without the rate governor, and counts the requests the server rejected.
+
+Run from the project root:
+    $ python -m benchmarks.rate_governor
+"""
+import asyncio
+import orjson
+import time
+from aiohttp import web
+from types import SimpleNamespace
+from typing import Mapping
+from src.exchanges.bybit.endpoints import PrivatePostLinks, PrivateRateLimits
+from src.exchanges.bybit.post.client import BybitPrivatePostClient
+from src.exchanges.common.httppool import HttpSessionPool
+from src.exchanges.common.ratelimit import RateGovernor
+from src.utils.misc import time_ms
+
+HOST, PORT, LIMIT = "127.0.0.1", 8091, 10
+
+
+class MockLimitedServer:
+    """
+    Answers every request, rejecting with 10006 beyond `LIMIT` requests per second window.
+    """
+
+    def __init__(self) -> None:
+        self.window, self.used, self.rejected = 0, 0, 0
+
+    async def respond(self, request: web.Request) -> web.Response:
+        await request.read()
+        now = time_ms()
+
+        if now // 1000 != self.window:
+            self.window, self.used = now // 1000, 0
+
+        self.used += 1
+        ok = self.used <= LIMIT
+        self.rejected += not ok
+
+        body = {"retCode": 0 if ok else 10006, "retMsg": "OK" if ok else "Too many visits!", "result": {}, "time": now}
+        headers = {
+            "X-Bapi-Limit": str(LIMIT),
+            "X-Bapi-Limit-Status": str(max(LIMIT - self.used, 0)),
+            "X-Bapi-Limit-Reset-Timestamp": str((self.window + 1) * 1000),
+        }
+        return web.Response(body=orjson.dumps(body), content_type="application/json", headers=headers)
+
+
+class UngovernedLimits(RateGovernor):
+    """
+    The previous behaviour, sending every request immediately and ignoring the limit headers.
+    """
+
+    async def acquire(self, endpoint: str) -> None:
+        return None
+
+    def update(self, endpoint: str, headers: Mapping) -> None:
+        return None
+
+
+async def burst(limits: RateGovernor, server: MockLimitedServer, http: HttpSessionPool) -> None:
+    client = BybitPrivatePostClient(SimpleNamespace(api_key="key", api_secret="secret", bybit_rate_limits=limits))
+    client.base_endpoint = http.base_url
+    client.max_retries = 1
+    payload = {"category": "linear", "symbol": "ETHUSDT", "orderId": "1"}
+    server.rejected = 0
+
+    # Five one second cycles, each firing 12 cancels at once
+    start = time.perf_counter()
+    for _ in range(5):
+        await asyncio.gather(
+            *(client.submit(http.session(), PrivatePostLinks.CANCEL_SINGLE, payload) for _ in range(12)),
+            asyncio.sleep(1)
+        )
+    elapsed = time.perf_counter() - start
+
+    bucket = limits.metrics().get(PrivatePostLinks.CANCEL_SINGLE, {})
+    print(f"{type(limits).__name__:>16}: {server.rejected:>3} rejected / 60 sent in {elapsed:.2f}s | bucket {bucket}")
+
+
+async def main() -> None:
+    server = MockLimitedServer()
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", server.respond)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+    http = HttpSessionPool(f"http://{HOST}:{PORT}")
+
+    await burst(UngovernedLimits(PrivateRateLimits), server, http)
+    await asyncio.sleep(1)
+    await burst(RateGovernor(PrivateRateLimits), server, http)
+
+    await http.close()
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""
+Measures the wall time of the startup REST fetches of both venues, awaited one after
+another versus fired concurrently over the shared connection pools, against a local server
+mimicking Bybit's and Binance's response formats with a fixed network delay per request.
+
+Run from the project root:
+    $ python -m benchmarks.startup_fetches
+"""
+import asyncio
+import orjson
+import time
+from aiohttp import web
+from types import SimpleNamespace
+from src.exchanges.binance.get.client import BinancePublicGet
+from src.exchanges.bybit.get.public import BybitPublicClient
+from src.exchanges.common.httppool import HttpSessionPool
+
+HOST, PORT = "127.0.0.1", 8091
+BASE_URL = f"http://{HOST}:{PORT}"
+DELAY = 0.05  # Simulated round trip to the venue, in seconds
+
+BYBIT = {"retCode": 0, "retMsg": "OK", "result": {"list": [{}]}, "time": 0}
+BINANCE = {"/fapi/v1/exchangeInfo": {"symbols": [{"symbol": "ETHUSDT", "filters": []}]}}
+
+
+async def respond(request: web.Request) -> web.Response:
+    await asyncio.sleep(DELAY)
+    body = BINANCE.get(request.path, []) if request.path.startswith("/fapi") else BYBIT
+    return web.Response(body=orjson.dumps(body), content_type="application/json")
+
+
+async def start_server() -> web.AppRunner:
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", respond)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+    return runner
+
+
+def startup_fetches(bybit: BybitPublicClient, binance: BinancePublicGet) -> list:
+    return [
+        bybit.klines(1, 500),
+        bybit.trades(1000),
+        bybit.instrument_info(),
+        binance.orderbook(500),
+        binance.trades(1000),
+        binance.instrument_info(),
+    ]
+
+
+async def main(rounds: int=5) -> None:
+    runner = await start_server()
+    ss = SimpleNamespace(
+        bybit_symbol="ETHUSDT",
+        binance_symbol="ETHUSDT",
+        bybit_http=HttpSessionPool(BASE_URL),
+        binance_http=HttpSessionPool(BASE_URL, size=4),
+    )
+    bybit, binance = BybitPublicClient(ss), BinancePublicGet(ss)
+
+    sequential, concurrent = [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for fetch in startup_fetches(bybit, binance):
+            await fetch
+        sequential.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*startup_fetches(bybit, binance))
+        concurrent.append(time.perf_counter() - start)
+
+    print(
+        f"{'6 startup fetches':>18}: {min(sequential) * 1e3:>6.1f} ms sequential | "
+        f"{min(concurrent) * 1e3:>6.1f} ms concurrent ({DELAY * 1e3:.0f} ms per request)"
+    )
+
+    await ss.bybit_http.close()
+    await ss.binance_http.close()
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+Measures the per-cycle setup cost removed by keeping the MarketMaker, OMS and order
+client alive across quote cycles: constructing them (and opening and closing an HTTP
+session, as each order batch used to) on every cycle versus reusing one set.
+
+Run from the project root:
+    $ python -m benchmarks.strategy_setup
+"""
+import asyncio
+import aiohttp
+import time
+from types import SimpleNamespace
+from src.exchanges.common.httppool import HttpSessionPool
+from src.exchanges.common.ratelimit import RateGovernor
+from src.strategy.marketmaker import MarketMaker
+from src.strategy.oms import OMS
+
+
+def new_state() -> SimpleNamespace:
+    """
+    Builds just the attributes of SharedState read on construction, which otherwise needs API keys and parameters.
+    """
+    return SimpleNamespace(
+        api_key="key",
+        api_secret="secret",
+        bybit_symbol="ETHUSDT",
+        bybit_tick_size=0.01,
+        bybit_lot_size=0.01,
+        base_spread=0.0005,
+        order_transport="REST",
+        bybit_http=HttpSessionPool("http://127.0.0.1"),
+        bybit_rate_limits=RateGovernor({}),
+    )
+
+
+async def per_cycle(ss: SimpleNamespace) -> None:
+    """
+    The previous lifecycle, rebuilding every component and session each cycle.
+    """
+    MarketMaker(ss)
+    OMS(ss)
+    async with aiohttp.ClientSession():
+        pass
+
+
+async def reused(market_maker: MarketMaker, oms: OMS) -> None:
+    """
+    The long-lived lifecycle, where a cycle only touches the existing components.
+    """
+    market_maker.spread = market_maker.ss.base_spread
+    oms.order.http.session()
+
+
+async def timeit(func, iterations: int=2000) -> float:
+    """
+    Returns the mean time per awaited call of `func` in microseconds, after a warmup call.
+    """
+    await func()
+
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        await func()
+    elapsed = time.perf_counter_ns() - start
+
+    return elapsed / iterations / 1e3
+
+
+async def main() -> None:
+    ss = new_state()
+    market_maker, oms = MarketMaker(ss), OMS(ss)
+
+    rebuilt = await timeit(lambda: per_cycle(ss))
+    kept = await timeit(lambda: reused(market_maker, oms))
+
+    await ss.bybit_http.close()
+
+    print(f"{'setup per cycle':>20}: {rebuilt:>9.2f} us rebuilt | {kept:>9.2f} us reused")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+"""
+Compares reading the trades imbalance from the streaming accumulator against unwrapping
+the trades ring buffer and recomputing the windowed trades_imbalance, and checks that
+both agree once the window is full.
+
+Run from the project root:
+    $ python -m benchmarks.trades_imbalance_streaming
+"""
+import time
+import numpy as np
+from src.strategy.features.trades_imbalance import StreamingTradesImbalance, trades_imbalance
+from src.utils.ringbuffer import ColumnarRingBuffer
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    num_trades, window = 5000, 1000
+
+    trades = ColumnarRingBuffer(capacity=window, columns=("time", "side", "price", "qty"))
+    stream = StreamingTradesImbalance(window=window)
+    max_error = 0.0
+
+    for i in range(num_trades):
+        side, qty = float(rng.integers(0, 2)), rng.random() * 10
+        trades.append((1e12 + i, side, 3000.0, qty))
+        stream.update(side, qty)
+
+        if i >= window - 1:
+            max_error = max(max_error, abs(stream.value - trades_imbalance(trades.to_array(), window)))
+
+    print(f"max abs difference over {num_trades - window + 1} full windows: {max_error:.3e}")
+
+    iterations = 20000
+
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        trades_imbalance(trades.to_array(), window)
+    windowed = (time.perf_counter_ns() - start) / iterations / 1e3
+
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        stream.value
+    streaming = (time.perf_counter_ns() - start) / iterations / 1e3
+
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        stream.update(1.0, 0.5)
+    update = (time.perf_counter_ns() - start) / iterations / 1e3
+
+    print(f"  windowed read: {windowed:>8.2f} us/call")
+    print(f" streaming read: {streaming:>8.2f} us/call")
+    print(f"streaming update: {update:>7.2f} us/trade")
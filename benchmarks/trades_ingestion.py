@@ -0,0 +1,99 @@
+"""
+Measures the warm-up time of a 1000 trade REST backfill and the CPU time per multi-trade
+WS message, parsing trade by trade versus in a single batch pass with a bulk append.
+
+Run from the project root:
+    $ python -m benchmarks.trades_ingestion
+"""
+import time
+import numpy as np
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+from src.exchanges.bybit.websockets.handlers.trades import BybitTradesHandler
+from src.strategy.features.trades_imbalance import StreamingTradesImbalance
+from src.utils.ringbuffer import ColumnarRingBuffer
+
+
+def new_state() -> SimpleNamespace:
+    """
+    Builds just the trades attributes of SharedState, which otherwise needs API keys and parameters.
+    """
+    return SimpleNamespace(
+        bybit_trades=ColumnarRingBuffer(capacity=1000, columns=("time", "side", "price", "qty")),
+        bybit_trades_imb=StreamingTradesImbalance(window=1000),
+    )
+
+
+def legacy_initialize(ss: SimpleNamespace, data: List[Dict]) -> None:
+    """
+    The previous trade by trade backfill, with one small array per trade.
+    """
+    for row in data:
+        time = float(row["time"])
+        price = float(row["price"])
+        qty = float(row["size"])
+        side = 0.0 if row["side"] == "Buy" else 1.0
+        ss.bybit_trades.append(np.array([time, side, price, qty]))
+        ss.bybit_trades_imb.update(side, qty)
+
+
+def legacy_process(ss: SimpleNamespace, recv: Dict) -> None:
+    """
+    The previous trade by trade WS message handler, with one small array per trade.
+    """
+    for trade in recv["data"]:
+        time = float(trade["T"])
+        price = float(trade["p"])
+        qty = float(trade["v"])
+        side = 0.0 if trade["S"] == "Buy" else 1.0
+        ss.bybit_trades.append(np.array([time, side, price, qty]))
+        ss.bybit_trades_imb.update(side, qty)
+
+
+def timeit(func: Callable, iterations: int) -> float:
+    """
+    Returns the mean time per call of `func` in microseconds, after a warmup call.
+    """
+    func()
+
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter_ns() - start
+
+    return elapsed / iterations / 1e3
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+
+    rest_page = [
+        {"time": str(1_700_000_000_000 - i), "price": f"{3000 + rng.normal():.2f}",
+         "size": f"{rng.random() * 10:.3f}", "side": "Buy" if rng.random() < 0.5 else "Sell"}
+        for i in range(1000)
+    ]
+
+    ws_message = {
+        "data": [
+            {"T": 1_700_000_000_000 + i, "p": f"{3000 + rng.normal():.2f}",
+             "v": f"{rng.random() * 10:.3f}", "S": "Buy" if rng.random() < 0.5 else "Sell"}
+            for i in range(20)
+        ]
+    }
+
+    legacy_ss, batch_ss = new_state(), new_state()
+    handler = BybitTradesHandler(batch_ss)
+
+    results = {
+        "REST backfill (1000)": (
+            timeit(lambda: legacy_initialize(legacy_ss, rest_page), 200),
+            timeit(lambda: handler.initialize(rest_page), 200),
+        ),
+        "WS message (20)": (
+            timeit(lambda: legacy_process(legacy_ss, ws_message), 5000),
+            timeit(lambda: handler.process(ws_message), 5000),
+        ),
+    }
+
+    for name, (legacy, batch) in results.items():
+        print(f"{name:>20}: {legacy:>9.2f} us legacy | {batch:>9.2f} us batch")
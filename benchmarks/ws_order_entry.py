@@ -0,0 +1,112 @@
+"""
+Measures the round trip of a 10 order create batch over the pooled REST transport versus
+the WebSocket trade stream transport, against local mock servers mimicking Bybit's
+response formats. Also checks that requests fall back to REST until the stream is
+authenticated.
+
+Run from the project root:
+    $ python -m benchmarks.ws_order_entry
+"""
+import asyncio
+import numpy as np
+import orjson
+import time
+import websockets
+from aiohttp import web
+from types import SimpleNamespace
+from src.exchanges.bybit.post.order import Order
+from src.exchanges.bybit.post.wsorder import WsOrder
+from src.exchanges.common.httppool import HttpSessionPool
+from src.exchanges.common.ratelimit import RateGovernor
+
+HOST, REST_PORT, WS_PORT = "127.0.0.1", 8089, 8090
+
+
+async def rest_respond(request: web.Request) -> web.Response:
+    await request.read()
+    body = {"retCode": 0, "retMsg": "OK", "result": {"list": []}, "time": 0}
+    return web.Response(body=orjson.dumps(body), content_type="application/json")
+
+
+async def ws_respond(websocket) -> None:
+    async for message in websocket:
+        recv = orjson.loads(message)
+
+        if recv["op"] == "auth":
+            await websocket.send(orjson.dumps({"op": "auth", "retCode": 0, "retMsg": "OK"}))
+        elif recv["op"] == "ping":
+            await websocket.send(orjson.dumps({"op": "pong", "retCode": 0, "retMsg": "OK"}))
+        else:
+            await websocket.send(orjson.dumps({
+                "reqId": recv["reqId"], "op": recv["op"], "retCode": 0, "retMsg": "OK",
+                "data": {"list": []}, "header": {"Timenow": recv["header"]["X-BAPI-TIMESTAMP"]}
+            }))
+
+
+def new_state() -> SimpleNamespace:
+    """
+    Builds just the attributes of SharedState the order transports read.
+    """
+    return SimpleNamespace(
+        api_key="key",
+        api_secret="secret",
+        bybit_symbol="ETHUSDT",
+        bybit_http=HttpSessionPool(f"http://{HOST}:{REST_PORT}", size=4),
+        bybit_rate_limits=RateGovernor({}, default_limit=1e9),
+    )
+
+
+async def timeit(func, iterations: int=1000) -> np.ndarray:
+    """
+    Returns the time per awaited call of `func` in microseconds, after a warmup call.
+    """
+    await func()
+    times = np.empty(iterations)
+
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        await func()
+        times[i] = (time.perf_counter_ns() - start) / 1e3
+
+    return times
+
+
+async def main() -> None:
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", rest_respond)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, REST_PORT).start()
+    ws_server = await websockets.serve(ws_respond, HOST, WS_PORT)
+
+    ss = new_state()
+    rest = Order(ss)
+    ws = WsOrder(ss, url=f"ws://{HOST}:{WS_PORT}")
+    rest.client.base_endpoint = ws.rest.client.base_endpoint = ss.bybit_http.base_url
+    orders = [("Buy", 3000.0 - i, 0.01) for i in range(10)]
+
+    # Sent before the stream has authenticated, so served over REST
+    await ws.order_limit_batch(orders)
+    assert ws.fallbacks == 1, ws.fallbacks
+
+    while not ws.authenticated:
+        await asyncio.sleep(0.01)
+
+    results = {
+        "REST": await timeit(lambda: rest.order_limit_batch(orders)),
+        "WS": await timeit(lambda: ws.order_limit_batch(orders)),
+    }
+    assert ws.fallbacks == 1, ws.fallbacks
+
+    for name, times in results.items():
+        print(f"{name:>5} batch (10): p50 {np.percentile(times, 50):>7.1f} us | p99 {np.percentile(times, 99):>7.1f} us")
+
+    await ws.close_session()
+    await ss.bybit_http.close()
+    ws_server.close()
+    await ws_server.wait_closed()
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
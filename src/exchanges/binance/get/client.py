@@ -1,11 +1,15 @@
-from binance.client import Client
-from typing import Dict
+import orjson
+from typing import Dict, List
+from src.exchanges.binance.endpoints import PublicGetLinks
 from src.sharedstate import SharedState
 
 class BinancePublicGet:
     """
-    Provides access to public data from Binance such as order books, klines (candlesticks),
-    and recent trades for a specified symbol.
+    Provides access to public data from Binance USD-M futures such as order books, klines
+    (candlesticks), and recent trades for a specified symbol.
+
+    Requests are sent over a shared keep-alive connection pool without blocking the event
+    loop, so several can run concurrently alongside the WS feeds.
 
     Attributes
     ----------
@@ -13,16 +17,16 @@ class BinancePublicGet:
         An instance of SharedState containing configuration and shared data.
     symbol : str
         The trading symbol to query data for.
-    client : Client
-        The Binance client from the python-binance package for making API requests.
+    http : HttpSessionPool
+        The application-scoped keep-alive connection pool for Binance's futures REST API.
 
     Methods
     -------
     orderbook(limit: int) -> Dict:
         Fetches the order book for the symbol up to a specified limit.
-    klines(limit: int, interval: int) -> Dict:
+    klines(limit: int, interval: str) -> List:
         Retrieves klines (candlestick data) for the symbol, given a limit and time interval.
-    trades(limit: int) -> Dict:
+    trades(limit: int) -> List:
         Obtains recent trades for the symbol up to a specified limit.
     instrument_info() -> Dict:
         Gets detailed symbol information.
@@ -30,7 +34,7 @@ class BinancePublicGet:
 
     def __init__(self, ss: SharedState) -> None:
         """
-        Initializes the BinancePublicGet class with shared state and prepares the Binance client.
+        Initializes the BinancePublicGet class with shared state and the shared connection pool.
 
         Parameters
         ----------
@@ -39,7 +43,24 @@ class BinancePublicGet:
         """
         self.ss = ss
         self.symbol: str = self.ss.binance_symbol
-        self.client = Client()
+        self.http = self.ss.binance_http
+
+    async def _get_(self, endpoint: str, params: Dict) -> Dict:
+        """
+        Sends an unauthenticated GET request and returns the decoded response.
+
+        Raises
+        ------
+        Exception
+            If the API returns an error status.
+        """
+        async with self.http.session().get(self.http.base_url + endpoint, params=params) as req:
+            response = orjson.loads(await req.read())
+
+            if req.status != 200:
+                raise Exception(f"Error: {req.status}/{response} | Endpoint: {endpoint}")
+
+        return response
 
     async def orderbook(self, limit: int) -> Dict:
         """
@@ -53,11 +74,12 @@ class BinancePublicGet:
         Returns
         -------
         Dict
-            A dictionary containing the current order book, including bids and asks.
+            A dictionary containing the current order book, including bids, asks and
+            the "lastUpdateId" used to sequence the futures depth stream.
         """
-        return self.client.get_order_book(symbol=self.symbol, limit=limit)
+        return await self._get_(PublicGetLinks.ORDERBOOK, {"symbol": self.symbol, "limit": limit})
 
-    async def klines(self, limit: int, interval: str) -> Dict:
+    async def klines(self, limit: int, interval: str) -> List:
         """
         Retrieves klines (candlestick data) for the specified symbol.
 
@@ -70,12 +92,12 @@ class BinancePublicGet:
 
         Returns
         -------
-        Dict
-            A dictionary containing the kline data.
+        List
+            A list containing the kline data.
         """
-        return self.client.get_klines(symbol=self.symbol, interval=interval, limit=limit)
+        return await self._get_(PublicGetLinks.KLINES, {"symbol": self.symbol, "interval": interval, "limit": limit})
 
-    async def trades(self, limit: int) -> Dict:
+    async def trades(self, limit: int) -> List:
         """
         Obtains a list of recent trades for the specified symbol.
 
@@ -86,11 +108,11 @@ class BinancePublicGet:
 
         Returns
         -------
-        Dict
-            A dictionary containing recent trade data.
+        List
+            A list containing recent trade data.
         """
-        return self.client.get_recent_trades(symbol=self.symbol, limit=limit)
-    
+        return await self._get_(PublicGetLinks.TRADES, {"symbol": self.symbol, "limit": limit})
+
     async def instrument_info(self) -> Dict:
         """
         Gets detailed information about the specified symbol.
@@ -100,4 +122,10 @@ class BinancePublicGet:
         Dict
             A dictionary containing detailed symbol information, such as trading pairs and limits.
         """
-        return self.client.get_symbol_info(symbol=self.symbol)
+        info = await self._get_(PublicGetLinks.EXCHANGE_INFO, {})
+
+        for symbol in info["symbols"]:
+            if symbol["symbol"] == self.symbol:
+                return symbol
+
+        raise Exception(f"Error: {self.symbol} not found | Endpoint: {PublicGetLinks.EXCHANGE_INFO}")
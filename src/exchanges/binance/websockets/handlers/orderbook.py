@@ -1,5 +1,4 @@
-import numpy as np
-from typing import Dict
+from typing import Dict, Tuple
 from src.exchanges.common.localorderbook import BaseOrderBook
 
 class OrderBookBinance(BaseOrderBook):
@@ -7,8 +6,23 @@ class OrderBookBinance(BaseOrderBook):
     Represents the order book for Binance, handling snapshot and real-time updates.
 
     Inherits from BaseOrderBook to implement Binance-specific order book processing.
+
+    Diffs are sequenced with Binance's futures update IDs. After a snapshot, diffs with
+    `u` below the snapshot's `lastUpdateId` are skipped and the first applied diff must
+    span it (`U` <= lastUpdateId <= `u`). Every later diff's `pu` must equal the previous
+    diff's `u`, otherwise a buffered resync from a REST snapshot is triggered.
+
+    Attributes
+    ----------
+    last_update_id : int
+        The final update ID of the last snapshot or diff applied to the book.
     """
 
+    def __init__(self, capacity: int=500, tracked_depths: Tuple[int, ...]=(10,)) -> None:
+        super().__init__(capacity, tracked_depths)
+        self.last_update_id = 0
+        self._awaiting_first_diff_ = True
+
     def process_snapshot(self, snapshot: Dict) -> None:
         """
         Processes the initial snapshot of the order book.
@@ -16,11 +30,47 @@ class OrderBookBinance(BaseOrderBook):
         Parameters
         ----------
         snapshot : Dict
-            A dictionary containing the initial state of the asks and bids in the order book.
+            A dictionary containing the initial state of the asks and bids in the order book,
+            and its "lastUpdateId".
         """
-        self.asks = np.array(snapshot["asks"], dtype=float)
-        self.bids = np.array(snapshot["bids"], dtype=float)
-        self.sort_book()
+        self.load_snapshot(snapshot["asks"], snapshot["bids"])
+        self.last_update_id = int(snapshot["lastUpdateId"])
+        self._awaiting_first_diff_ = True
+        self.synced = True
+
+    def _apply_delta_(self, data: Dict) -> bool:
+        """
+        Applies a diff if it continues the sequence of the last applied snapshot or diff.
+
+        Parameters
+        ----------
+        data : Dict
+            The diff payload, with "a"/"b" lists of [price, quantity] levels and the
+            "U"/"u"/"pu" update IDs.
+
+        Returns
+        -------
+        bool
+            False if the diff does not connect to the last applied update, else True.
+        """
+        first_id, final_id = data["U"], data["u"]
+
+        if final_id < self.last_update_id:
+            if not self._awaiting_first_diff_:
+                self.dropped += 1
+            return True
+
+        if self._awaiting_first_diff_:
+            if first_id > self.last_update_id:
+                return False
+            self._awaiting_first_diff_ = False
+
+        elif data["pu"] != self.last_update_id:
+            return False
+
+        self.update_book(data["a"], data["b"])
+        self.last_update_id = final_id
+        return True
 
     def process(self, recv: Dict) -> None:
         """
@@ -31,11 +81,14 @@ class OrderBookBinance(BaseOrderBook):
         recv : Dict
             A dictionary containing the updates to the asks and bids in the order book.
         """
-        asks = np.array(recv["data"]["a"], dtype=float)
-        bids = np.array(recv["data"]["b"], dtype=float)
-        self.asks = self.update_book(self.asks, asks)
-        self.bids = self.update_book(self.bids, bids)
-        self.sort_book()
+        data = recv["data"]
+
+        if not self.synced:
+            self._queue_delta_(data)
+
+        elif not self._apply_delta_(data):
+            self._queue_delta_(data)
+            self.resync()
 
 
 class BinanceBBAHandler:
@@ -74,3 +127,4 @@ class BinanceBBAHandler:
         self.ss.binance_bba[0, 1] = float(recv["data"]["B"])
         self.ss.binance_bba[1, 0] = float(recv["data"]["a"])
         self.ss.binance_bba[1, 1] = float(recv["data"]["A"])
+        self.ss.signal_market_change()
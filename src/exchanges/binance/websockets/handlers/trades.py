@@ -37,13 +37,19 @@ class BinanceTradesHandler:
         data : List[Dict]
             A list of dictionaries where each dictionary contains information about a single trade.
         """
-        for row in data:
-            time = float(row["time"])
-            price = float(row["price"])
-            qty = float(row["qty"])
-            side = 1.0 if row["isBuyerMaker"] else 0.0
-            new_trade = np.array([[time, side, price, qty]])
-            self.ss.binance_trades.append(new_trade)
+        trades = np.fromiter(
+            (
+                (float(row["time"]), 1.0 if row["isBuyerMaker"] else 0.0, float(row["price"]), float(row["qty"]))
+                for row in data
+            ),
+            dtype=self.ss.binance_trades.dtype,
+            count=len(data)
+        )
+
+        # The REST page is not guaranteed to be oldest first
+        trades = np.sort(trades, kind="stable", order="time")
+        self.ss.binance_trades.extend(trades)
+        self.ss.binance_trades_imb.extend(trades["side"], trades["qty"])
 
     def process(self, recv: Dict) -> None:
         """
@@ -58,6 +64,7 @@ class BinanceTradesHandler:
         price = float(recv["data"]["p"])
         qty = float(recv["data"]["q"])
         side = 1.0 if recv["data"]["m"] else 0.0
-        new_trade = np.array([[time, side, price, qty]])
-        self.ss.binance_trades.append(new_trade)
-        self.ss.binance_last_price = float(price)
\ No newline at end of file
+        self.ss.binance_trades.append((time, side, price, qty))
+        self.ss.binance_trades_imb.update(side, qty)
+        self.ss.binance_last_price = float(price)
+        self.ss.signal_market_change()
\ No newline at end of file
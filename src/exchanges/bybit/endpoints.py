@@ -14,6 +14,15 @@ class WsStreamLinks:
     SPOT_PUBLIC_STREAM = f"wss://{domain}/v5/public/spot"
     FUTURES_PUBLIC_STREAM = f"wss://{domain}/v5/public/linear"
     COMBINED_PRIVATE_STREAM = f"wss://{domain}/v5/private"
+    TRADE_STREAM = f"wss://{domain}/v5/trade"
+
+@dataclass
+class PublicGetLinks:
+    SERVER_TIME = "/v5/market/time"
+    KLINES = "/v5/market/kline"
+    TRADES = "/v5/market/recent-trade"
+    INSTRUMENT_INFO = "/v5/market/instruments-info"
+    ORDERBOOK = "/v5/market/orderbook"
 
 @dataclass
 class PrivateGetLinks:
@@ -30,4 +39,19 @@ class PrivatePostLinks:
     AMEND_BATCH = "/v5/order/amend-batch"
     CANCEL_SINGLE = "/v5/order/cancel"
     CANCEL_BATCH = "/v5/order/cancel-batch"
-    CANCEL_ALL = "/v5/order/cancel-all"
\ No newline at end of file
+    CANCEL_ALL = "/v5/order/cancel-all"
+
+# Default per second limits of a UID, until calibrated from response headers
+PrivateRateLimits = {
+    PrivateGetLinks.OPEN_ORDERS: 50,
+    PrivateGetLinks.CURRENT_POSITION: 50,
+    PrivateGetLinks.CLOSED_PNL: 50,
+    PrivateGetLinks.WALLET_BALANCE: 50,
+    PrivatePostLinks.CREATE_ORDER: 10,
+    PrivatePostLinks.CREATE_BATCH: 10,
+    PrivatePostLinks.AMEND_ORDER: 10,
+    PrivatePostLinks.AMEND_BATCH: 10,
+    PrivatePostLinks.CANCEL_SINGLE: 10,
+    PrivatePostLinks.CANCEL_BATCH: 10,
+    PrivatePostLinks.CANCEL_ALL: 10,
+}
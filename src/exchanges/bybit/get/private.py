@@ -1,10 +1,9 @@
-import hashlib
-import hmac
 import aiohttp
 import orjson
 import asyncio
 from typing import Dict, Union
 from src.utils.misc import time_ms, datetime_now as dt_now
+from src.exchanges.bybit.signer import BybitSigner
 from src.exchanges.bybit.endpoints import BaseEndpoints, PrivateGetLinks
 from src.sharedstate import SharedState
 
@@ -27,6 +26,8 @@ class BybitPrivateGetClient:
         List of error codes that should trigger a retry.
     _skip_ : List[int]
         List of error codes to skip or ignore without retrying.
+    _rate_limited_ : List[int]
+        List of error codes meaning the endpoint's limit was hit, retried once the rate governor allows.
 
     Methods
     -------
@@ -38,7 +39,8 @@ class BybitPrivateGetClient:
     recv_window = "5000"
     _success_ = ["OK", "success", "SUCCESS", ""]
     _retry_ = [100016]  # NOTE: Add more as necessary
-    _skip_ = [10006, 110001, 110012]  # NOTE: Add more as necessary
+    _skip_ = [110001, 110012]  # NOTE: Add more as necessary
+    _rate_limited_ = [10006]
 
     def __init__(self, ss: SharedState) -> None:
         """
@@ -52,6 +54,7 @@ class BybitPrivateGetClient:
         self.ss = ss
         self.key, self.secret = self.ss.api_key, self.ss.api_secret
         self.base_endpoint = BaseEndpoints.MAINNET1
+        self.limits = self.ss.bybit_rate_limits
         self.timestamp = time_ms()
 
         # Predefined headers for requests, except the signature which is calculated per request
@@ -63,7 +66,7 @@ class BybitPrivateGetClient:
             "X-BAPI-SIGN": ""
         }
 
-        self.static_partial_str = "".join([self.key, self.recv_window])
+        self.signer = BybitSigner(self.key, self.secret, self.recv_window)
 
     def _update_timestamp_(self) -> None:
         """
@@ -86,19 +89,14 @@ class BybitPrivateGetClient:
             The headers including the updated timestamp and signature.
         """
         self._update_timestamp_()
-        param_str = "".join([self.timestamp, self.static_partial_str, payload])
-        hash_signature = hmac.new(
-            bytes(self.secret, "utf-8"),
-            param_str.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
         self.static_headers["X-BAPI-TIMESTAMP"] = self.timestamp
-        self.static_headers["X-BAPI-SIGN"] = hash_signature
+        self.static_headers["X-BAPI-SIGN"] = self.signer.sign(self.timestamp, payload)
         return self.static_headers
 
     async def submit(self, session: aiohttp.ClientSession, endpoint: str, payload: str) -> Union[Dict, None]:
         """
-        Asynchronously submits a signed GET request to the specified endpoint.
+        Asynchronously submits a signed GET request to the specified endpoint, once the
+        endpoint's rate limit allows, and calibrates the limit from the response headers.
 
         Parameters
         ----------
@@ -114,13 +112,17 @@ class BybitPrivateGetClient:
         Union[Dict, None]
             The JSON response from the API or None if an error occurs.
         """
-        signed_header = self._sign_(payload)
         full_endpoint = self.base_endpoint + endpoint
         max_retries = self.max_retries
     
         for attempt in range(max_retries):
+            # Sign after any wait for the rate limit, so the timestamp is fresh
+            await self.limits.acquire(endpoint)
+            signed_header = self._sign_(payload)
+
             try:
                 req = await session.request("GET", url=full_endpoint, headers=signed_header)
+                self.limits.update(endpoint, req.headers)
                 response = orjson.loads(await req.text())
                 code, msg = response["retCode"], response["retMsg"]
 
@@ -128,6 +130,16 @@ class BybitPrivateGetClient:
                     return response
                 
                 else:
+                    if code in self._rate_limited_:
+                        # Hold the bucket for a window, as the rejection may not carry limit headers
+                        self.limits.throttle(endpoint)
+
+                        if attempt < max_retries - 1:
+                            continue
+
+                        print(f"{dt_now()}: Rate limited after {max_retries} attempts: {code}/{msg} | Endpoint: {endpoint}")
+                        break
+
                     if code in self._retry_: 
                         raise Exception(f"Error: {code}/{msg} | Endpoint: {endpoint}")
                 
@@ -138,12 +150,10 @@ class BybitPrivateGetClient:
             except Exception as e:
                 if attempt < max_retries - 1:  
                     await asyncio.sleep(attempt)  
-                    signed_header = self._sign_(payload)
                 else:
                     raise e 
 
 
-import aiohttp
 from typing import Dict, Union
 from src.sharedstate import SharedState
 from src.exchanges.bybit.endpoints import PrivateGetLinks
@@ -162,8 +172,8 @@ class BybitPrivateGet:
         Container for API endpoint URLs specific to Bybit's private data retrieval.
     client : BybitPrivateGetClient
         A client configured to interact with Bybit's private API endpoints.
-    session : aiohttp.ClientSession
-        An active session for making HTTP requests asynchronously.
+    http : HttpSessionPool
+        The application-scoped keep-alive connection pool shared with other Bybit REST clients.
 
     Methods
     -------
@@ -171,13 +181,11 @@ class BybitPrivateGet:
         Fetches the current open orders for the specified trading symbol.
     current_position() -> Union[Dict, None]:
         Retrieves the current position for the specified trading symbol.
-    _close_() -> None:
-        Closes the active aiohttp session gracefully.
     """
 
     def __init__(self, ss: SharedState) -> None:
         """
-        Initializes the BybitPrivateGet class with shared state, API endpoints, and a session for HTTP requests.
+        Initializes the BybitPrivateGet class with shared state, API endpoints, and the shared connection pool.
 
         Parameters
         ----------
@@ -188,7 +196,7 @@ class BybitPrivateGet:
         self.symbol = self.ss.bybit_symbol
         self.endpoints = PrivateGetLinks
         self.client = BybitPrivateGetClient(self.ss)
-        self.session = aiohttp.ClientSession()
+        self.http = self.ss.bybit_http
 
     async def open_orders(self) -> Union[Dict, None]:
         """
@@ -201,7 +209,7 @@ class BybitPrivateGet:
         """
         payload = f"category=linear&symbol={self.symbol}&limit=50"
         endpoint = f"{self.endpoints.OPEN_ORDERS}?{payload}"
-        return await self.client.submit(self.session, endpoint, payload)
+        return await self.client.submit(self.http.session(), endpoint, payload)
 
     async def current_position(self) -> Union[Dict, None]:
         """
@@ -214,12 +222,4 @@ class BybitPrivateGet:
         """
         payload = f"category=linear&symbol={self.symbol}"
         endpoint = f"{self.endpoints.CURRENT_POSITION}?{payload}"
-        return await self.client.submit(self.session, endpoint, payload)
- 
-    async def _close_(self) -> None:
-        """
-        Closes the aiohttp session associated with this instance.
-
-        This method should be called to release resources before the instance is discarded.
-        """
-        await self.session.close()
\ No newline at end of file
+        return await self.client.submit(self.http.session(), endpoint, payload)
\ No newline at end of file
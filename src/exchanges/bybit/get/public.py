@@ -1,42 +1,44 @@
-from pybit.unified_trading import HTTP
-from typing import List
+import orjson
+from typing import Dict
+from src.exchanges.bybit.endpoints import PublicGetLinks
 from src.sharedstate import SharedState
 
 class BybitPublicClient:
     """
-    A client for fetching public trading data from Bybit, such as kline (candlestick) data, 
+    A client for fetching public trading data from Bybit, such as kline (candlestick) data,
     recent trades, and instrument information.
 
+    Requests are sent over the shared keep-alive connection pool without blocking the event
+    loop, so several can run concurrently alongside the WS feeds.
+
     Attributes
     ----------
     category : str
         The category of the trading instrument, e.g., "linear".
     ss : SharedState
         An instance of SharedState containing shared application data.
-    key : str
-        The API key obtained from the shared state for authorized requests.
-    secret : str
-        The API secret obtained from the shared state for signing requests.
-    session : HTTP
-        An instance of the HTTP client from pybit for making API requests.
+    http : HttpSessionPool
+        The application-scoped keep-alive connection pool shared with other Bybit REST clients.
     symbol : str
         The trading symbol to query data for, obtained from the shared state.
 
     Methods
     -------
-    klines(interval: int, limit: int) -> List:
+    klines(interval: int, limit: int) -> Dict:
         Fetches kline data for the specified interval and limit.
-    trades(limit: int) -> List:
+    trades(limit: int) -> Dict:
         Retrieves the recent trades up to the specified limit.
-    instrument_info() -> List:
+    instrument_info() -> Dict:
         Gets the instrument information for the specified symbol.
+    orderbook(limit: int) -> Dict:
+        Fetches an order book snapshot up to the specified depth.
     """
 
     category = "linear"
 
     def __init__(self, ss: SharedState) -> None:
         """
-        Initializes the BybitPublicClient with shared state, API credentials, and trading symbol.
+        Initializes the BybitPublicClient with shared state, the shared connection pool, and trading symbol.
 
         Parameters
         ----------
@@ -44,11 +46,41 @@ class BybitPublicClient:
             An instance of SharedState containing shared application data.
         """
         self.ss = ss
-        self.key, self.secret = self.ss.api_key, self.ss.api_secret
-        self.session = HTTP(api_key=self.key, api_secret=self.secret)
+        self.http = self.ss.bybit_http
         self.symbol = self.ss.bybit_symbol
 
-    async def klines(self, interval: int, limit: int) -> List:
+    async def _get_(self, endpoint: str, params: Dict) -> Dict:
+        """
+        Sends an unauthenticated GET request and returns the decoded response.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint to which the request is sent.
+        params : Dict
+            The query parameters of the request.
+
+        Returns
+        -------
+        Dict
+            The API response, with "result" holding the data.
+
+        Raises
+        ------
+        Exception
+            If the API returns a non-zero retCode.
+        """
+        params = {"category": self.category, "symbol": self.symbol, **params}
+
+        async with self.http.session().get(self.http.base_url + endpoint, params=params) as req:
+            response = orjson.loads(await req.read())
+
+        if response["retCode"] != 0:
+            raise Exception(f"Error: {response['retCode']}/{response['retMsg']} | Endpoint: {endpoint}")
+
+        return response
+
+    async def klines(self, interval: int, limit: int) -> Dict:
         """
         Asynchronously fetches kline data for the specified trading symbol, interval, and limit.
 
@@ -61,17 +93,12 @@ class BybitPublicClient:
 
         Returns
         -------
-        List
-            A list of kline data entries.
+        Dict
+            The API response, whose "result" holds the list of kline entries.
         """
-        return self.session.get_kline(
-            category=self.category, 
-            symbol=self.symbol, 
-            interval=str(interval),
-            limit=str(limit)
-        )
-
-    async def trades(self, limit: int) -> List:
+        return await self._get_(PublicGetLinks.KLINES, {"interval": str(interval), "limit": str(limit)})
+
+    async def trades(self, limit: int) -> Dict:
         """
         Asynchronously retrieves recent trade history for the specified trading symbol and limit.
 
@@ -82,25 +109,34 @@ class BybitPublicClient:
 
         Returns
         -------
-        List
-            A list of recent trade data entries.
+        Dict
+            The API response, whose "result" holds the list of recent trades.
         """
-        return self.session.get_public_trade_history(
-            category=self.category, 
-            symbol=self.symbol, 
-            limit=str(limit)
-        )
-    
-    async def instrument_info(self) -> List:
+        return await self._get_(PublicGetLinks.TRADES, {"limit": str(limit)})
+
+    async def instrument_info(self) -> Dict:
         """
         Asynchronously fetches instrument information for the specified trading symbol.
 
         Returns
         -------
-        List
-            A list containing instrument information.
+        Dict
+            The API response, whose "result" holds the instrument information.
+        """
+        return await self._get_(PublicGetLinks.INSTRUMENT_INFO, {})
+
+    async def orderbook(self, limit: int) -> Dict:
+        """
+        Asynchronously fetches an order book snapshot for the specified trading symbol.
+
+        Parameters
+        ----------
+        limit : int
+            The depth of the snapshot on each side of the book.
+
+        Returns
+        -------
+        Dict
+            The API response, whose "result" holds the "a"/"b" levels and the update ID "u".
         """
-        return self.session.get_instruments_info(
-            category=self.category,
-            symbol=self.symbol
-        )
\ No newline at end of file
+        return await self._get_(PublicGetLinks.ORDERBOOK, {"limit": str(limit)})
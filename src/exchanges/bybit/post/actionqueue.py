@@ -0,0 +1,147 @@
+import asyncio
+from typing import List, Tuple, Union
+from src.exchanges.bybit.post.order import Order
+from src.exchanges.bybit.post.wsorder import WsOrder
+
+
+class OrderActionQueue:
+    """
+    Collects create, amend and cancel intents until `flush()` is awaited, then dispatches
+    them as full batches of 10 per action, concurrently.
+
+    The queue is a synchronous batcher: nothing is sent until the owner flushes, so intents
+    queued by separate callers merge only if they are queued before the same flush. Intents
+    on the same orderId are merged before dispatch: a later amend replaces an earlier one,
+    and a cancel supersedes any amend of that order, whichever came first.
+
+    Attributes
+    ----------
+    order : Union[Order, WsOrder]
+        The order transport the batches are sent through.
+    deduped : int
+        The number of intents merged into another instead of being sent.
+
+    Methods
+    -------
+    create(order: Tuple[str, float, float]) -> asyncio.Future:
+        Queues a limit order.
+    amend(order: Tuple[str, float, float]) -> asyncio.Future:
+        Queues an amend of an existing order.
+    cancel(order_id: str) -> asyncio.Future:
+        Queues a cancel of an existing order.
+    flush() -> None:
+        Dispatches every queued intent, concurrently per action.
+    """
+
+    batch_size = 10
+
+    def __init__(self, order: Union[Order, WsOrder]) -> None:
+        self.order = order
+        self.deduped = 0
+
+        self._creates_ = []
+        self._amends_ = {}
+        self._cancels_ = {}
+
+    def _future_(self) -> asyncio.Future:
+        return asyncio.get_running_loop().create_future()
+
+    def create(self, order: Tuple[str, float, float]) -> asyncio.Future:
+        future = self._future_()
+        self._creates_.append((order, future))
+        return future
+
+    def amend(self, order: Tuple[str, float, float]) -> asyncio.Future:
+        order_id = order[0]
+        future = self._future_()
+
+        if order_id in self._cancels_:
+            self.deduped += 1
+            self._cancels_[order_id][1].append(future)
+            return future
+
+        if order_id in self._amends_:
+            self.deduped += 1
+            _, futures = self._amends_[order_id]
+            self._amends_[order_id] = (order, futures + [future])
+            return future
+
+        self._amends_[order_id] = (order, [future])
+        return future
+
+    def cancel(self, order_id: str) -> asyncio.Future:
+        future = self._future_()
+        futures = [future]
+
+        if order_id in self._amends_:
+            self.deduped += 1
+            futures += self._amends_.pop(order_id)[1]
+
+        if order_id in self._cancels_:
+            self.deduped += 1
+            self._cancels_[order_id][1].extend(futures)
+            return future
+
+        self._cancels_[order_id] = (order_id, futures)
+        return future
+
+    def _resolve_(self, futures: List[List[asyncio.Future]], results: List) -> None:
+        """
+        Resolves each intent's futures with its own ack from the batch results, or with the
+        whole batch result if it carries no per-order acks.
+
+        A batch is accepted as a whole even if some of its orders are rejected, so each ack
+        is merged with its order's "code" and "msg" from the batch's retExtInfo.
+        """
+        for k, waiting in enumerate(futures):
+            batch, index = divmod(k, self.batch_size)
+            result = results[batch] if batch < len(results) else None
+            outcome = result
+
+            if isinstance(result, dict) and isinstance(result.get("result"), dict):
+                acks = result["result"].get("list", [])
+                errors = (result.get("retExtInfo") or {}).get("list", [])
+
+                if index < len(acks):
+                    outcome = acks[index]
+
+                    if index < len(errors):
+                        outcome = {**outcome, "code": errors[index].get("code"), "msg": errors[index].get("msg")}
+
+            for future in waiting:
+                if future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+    async def _dispatch_(self, send, items: List, futures: List[List[asyncio.Future]]) -> None:
+        try:
+            results = await send(items)
+        except Exception as e:
+            results = [e] * len(items)
+
+        self._resolve_(futures, results)
+
+    async def flush(self) -> None:
+        creates, amends, cancels = self._creates_, self._amends_, self._cancels_
+        self._creates_, self._amends_, self._cancels_ = [], {}, {}
+        tasks = []
+
+        if cancels:
+            tasks.append(self._dispatch_(
+                self.order.cancel_batch, list(cancels), [futures for _, futures in cancels.values()]
+            ))
+
+        if amends:
+            tasks.append(self._dispatch_(
+                self.order.amend_batch, [order for order, _ in amends.values()], [futures for _, futures in amends.values()]
+            ))
+
+        if creates:
+            tasks.append(self._dispatch_(
+                self.order.order_limit_batch, [order for order, _ in creates], [[future] for _, future in creates]
+            ))
+
+        await asyncio.gather(*tasks)
@@ -1,10 +1,9 @@
-import hashlib
-import hmac
 import aiohttp
 import orjson
 import asyncio
-from typing import Dict
+from typing import Dict, Union
 from src.utils.misc import time_ms, datetime_now as dt_now
+from src.exchanges.bybit.signer import BybitSigner
 from src.exchanges.bybit.endpoints import BaseEndpoints
 from src.sharedstate import SharedState
 
@@ -27,14 +26,16 @@ class BybitPrivatePostClient:
         A list of error codes that should trigger a retry of the request.
     _skip_ : List[int]
         A list of error codes that should not trigger a retry and instead skip the request.
+    _rate_limited_ : List[int]
+        A list of error codes meaning the endpoint's limit was hit, retried once the rate governor allows.
 
     Methods
     -------
     _update_timestamp_() -> None:
         Updates the timestamp for request signing.
-    _sign_(payload: str) -> Dict:
+    _sign_(payload: bytes) -> Dict:
         Signs the request payload for authentication.
-    submit(session: aiohttp.ClientSession, endpoint: str, payload: dict) -> asyncio.Future:
+    submit(session: aiohttp.ClientSession, endpoint: str, payload: Union[dict, bytes]) -> asyncio.Future:
         Asynchronously submits a POST request to the specified Bybit API endpoint.
     """
 
@@ -42,7 +43,8 @@ class BybitPrivatePostClient:
     recv_window = "5000"
     _success_ = ["OK", "success", "SUCCESS", ""]
     _retry_ = [100016] # NOTE: Add more
-    _skip_ = [10006, 110001, 110012] # NOTE: Add more
+    _skip_ = [110001, 110012] # NOTE: Add more
+    _rate_limited_ = [10006]
 
     def __init__(self, ss: SharedState) -> None:
         """
@@ -56,16 +58,18 @@ class BybitPrivatePostClient:
         self.ss = ss
         self.key, self.secret = self.ss.api_key, self.ss.api_secret
         self.base_endpoint = BaseEndpoints.MAINNET1
+        self.limits = self.ss.bybit_rate_limits
         self.timestamp = time_ms()
 
         self.static_headers = {
             "X-BAPI-TIMESTAMP": self.timestamp,
             "X-BAPI-RECV-WINDOW": self.recv_window,
             "X-BAPI-API-KEY": self.key, 
-            "X-BAPI-SIGN": ""
+            "X-BAPI-SIGN": "",
+            "Content-Type": "application/json"
         }
 
-        self.static_partial_str = "".join([self.key, self.recv_window])
+        self.signer = BybitSigner(self.key, self.secret, self.recv_window)
 
     def _update_timestamp_(self) -> None:
         """
@@ -73,14 +77,14 @@ class BybitPrivatePostClient:
         """
         self.timestamp = str(time_ms())
 
-    def _sign_(self, payload: str) -> Dict:
+    def _sign_(self, payload: bytes) -> Dict:
         """
         Generates a signature for the given payload and updates request headers.
 
         Parameters
         ----------
-        payload : str
-            The request payload to be signed.
+        payload : bytes
+            The exact request body to be signed.
 
         Returns
         -------
@@ -88,19 +92,14 @@ class BybitPrivatePostClient:
             The updated headers containing the signature.
         """
         self._update_timestamp_()
-        param_str = "".join([self.timestamp, self.static_partial_str, payload])
-        hash_signature = hmac.new(
-            bytes(self.secret, "utf-8"), 
-            param_str.encode("utf-8"), 
-            hashlib.sha256
-        ).hexdigest()
         self.static_headers["X-BAPI-TIMESTAMP"] = self.timestamp
-        self.static_headers["X-BAPI-SIGN"] = hash_signature
+        self.static_headers["X-BAPI-SIGN"] = self.signer.sign(self.timestamp, payload)
         return self.static_headers
 
-    async def submit(self, session: aiohttp.ClientSession, endpoint: str, payload: dict) -> Dict:
+    async def submit(self, session: aiohttp.ClientSession, endpoint: str, payload: Union[dict, bytes]) -> Dict:
         """
-        Asynchronously submits a signed POST request to Bybit.
+        Asynchronously submits a signed POST request to Bybit, once the endpoint's rate
+        limit allows, and calibrates the limit from the response headers.
 
         Parameters
         ----------
@@ -108,8 +107,9 @@ class BybitPrivatePostClient:
             The session used to send the request.
         endpoint : str
             The API endpoint to which the request is sent.
-        payload : dict
-            The payload of the request.
+        payload : Union[dict, bytes]
+            The payload of the request, either a dict or an already serialized JSON body,
+            which is signed and sent without being re-encoded.
 
         Returns
         -------
@@ -119,24 +119,38 @@ class BybitPrivatePostClient:
         Raises
         ------
         Exception
-            If the request fails after the maximum number of retries.
+            If the request fails after the maximum number of retries, including when every
+            attempt was rejected by the endpoint's rate limit.
         """
-        str_payload = orjson.dumps(payload).decode()
-        signed_header = self._sign_(str_payload)
+        body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
         full_endpoint = self.base_endpoint + endpoint
         max_retries = self.max_retries
         
         for attempt in range(max_retries):
+            # Sign after any wait for the rate limit, so the timestamp is fresh
+            await self.limits.acquire(endpoint)
+            signed_header = self._sign_(body)
+
             try:
-                req = await session.request("POST", full_endpoint, headers=signed_header, data=str_payload)
-                response = orjson.loads(await req.text())
+                req = await session.request("POST", full_endpoint, headers=signed_header, data=body)
+                self.limits.update(endpoint, req.headers)
+                response = orjson.loads(await req.read())
                 code, msg = response["retCode"], response["retMsg"]
 
                 if msg in self._success_:
                     return {
                         "result": response["result"],
+                        "retExtInfo": response.get("retExtInfo", {}),
                         "latency": int(response["time"]) - int(self.timestamp)
                     }
+                elif code in self._rate_limited_:
+                    # Hold the bucket for a window, as the rejection may not carry limit headers
+                    self.limits.throttle(endpoint)
+
+                    if attempt < max_retries - 1:
+                        continue
+
+                    raise Exception(f"Rate limited after {max_retries} attempts: {code}/{msg} | Endpoint: {endpoint}")
                 elif code in self._retry_: 
                     raise Exception(f"Error: {code}/{msg} | Endpoint: {endpoint}")
                 else:            
@@ -145,6 +159,5 @@ class BybitPrivatePostClient:
             except Exception as e:
                 if attempt < max_retries - 1:
                     await asyncio.sleep(attempt + 1)  # Incremental back-off
-                    signed_header = self._sign_(str_payload)
                 else:
                     raise e
\ No newline at end of file
@@ -1,5 +1,4 @@
 import asyncio
-import aiohttp
 from typing import List, Dict, Tuple, Union
 from src.exchanges.bybit.post.client import BybitPrivatePostClient
 from src.exchanges.bybit.endpoints import PrivatePostLinks
@@ -25,8 +24,8 @@ class Order:
         Container for Bybit's API endpoint URLs.
     client : BybitPrivatePostClient
         A client configured for executing signed POST requests to Bybit.
-    session : aiohttp.ClientSession
-        A session for making HTTP requests.
+    http : HttpSessionPool
+        The application-scoped keep-alive connection pool shared with other Bybit REST clients.
 
     Methods
     -------
@@ -59,7 +58,7 @@ class Order:
         self.formats = BybitFormats(self.ss.bybit_symbol)
         self.endpoints = PrivatePostLinks
         self.client = BybitPrivatePostClient(self.ss)
-        self.session = aiohttp.ClientSession()
+        self.http = self.ss.bybit_http
 
     def _order_to_str_(self, order: List) -> List[str]:
         """
@@ -77,7 +76,7 @@ class Order:
         """
         return list(map(str, order))
 
-    async def _submit_(self, endpoint: str, payload: Dict) -> Union[Dict, None]:
+    async def _submit_(self, endpoint: str, payload: Union[Dict, bytes]) -> Union[Dict, None]:
         """
         Submits an order to a specified endpoint with the given payload.
 
@@ -85,34 +84,34 @@ class Order:
         ----------
         endpoint : str
             The API endpoint to submit the order to.
-        payload : Dict
-            The payload of the order.
+        payload : Union[Dict, bytes]
+            The payload of the order, or its serialized JSON body.
 
         Returns
         -------
         Union[Dict, None]
             The response from the API if successful; otherwise, None.
         """
-        async with self.session:
-            return await self.client.submit(self.session, endpoint, payload)
+        return await self.client.submit(self.http.session(), endpoint, payload)
 
-    async def _sessionless_submit_(self, endpoint: str, payload: Dict) -> Union[Dict, None]:
+    async def _sessionless_submit_(self, endpoint: str, payload: Union[Dict, bytes]) -> Union[Dict, None]:
         """
-        Submits an order without managing the session lifecycle, assuming the session is already active.
+        Submits an order over the shared connection pool. Kept as an alias of `_submit_`, as
+        the session is no longer closed after each request.
 
         Parameters
         ----------
         endpoint : str
             The API endpoint to submit the order to.
-        payload : Dict
-            The payload of the order.
+        payload : Union[Dict, bytes]
+            The payload of the order, or its serialized JSON body.
 
         Returns
         -------
         Union[Dict, None]
             The response from the API if successful; otherwise, None.
         """
-        return await self.client.submit(self.session, endpoint, payload)
+        return await self._submit_(endpoint, payload)
 
     # async def order_market(self, order: Tuple[str, float]) -> Union[Dict, None]:
     #     """
@@ -235,14 +234,10 @@ class Order:
         tasks = []
 
         for i in range(0, len(orders), 10):
-            batch_orders = [self._order_to_str_(order) for order in orders[i:i+10]]
-            batch_payload = {
-                "category": self.category, 
-                "request": [
-                    self.formats.create_limit(*order)
-                    for order in batch_orders
-                ]
-            }
+            batch_payload = self.formats.create_batch([
+                self.formats.create_limit_json(*order)
+                for order in orders[i:i+10]
+            ])
             try: 
                 task = asyncio.create_task(self._sessionless_submit_(batch_endpoint, batch_payload))
                 tasks.append(task)
@@ -251,7 +246,6 @@ class Order:
                 asyncio.create_task(log_event('API_ERROR', message))
 
         result = await asyncio.gather(*tasks)
-        await self.close_session()
         return result 
          
     # async def amend(self, order: Tuple[str, float, float]) -> Union[Dict, None]:
@@ -335,14 +329,10 @@ class Order:
         tasks = []
 
         for i in range(0, len(orders), 10):
-            batch_orders = [self._order_to_str_(order) for order in orders[i:i+10]]
-            batch_payload = {
-                "category": self.category, 
-                "request": [
-                    self.formats.create_amend(*order)
-                    for order in batch_orders
-                ]
-            }
+            batch_payload = self.formats.create_batch([
+                self.formats.create_amend_json(*order)
+                for order in orders[i:i+10]
+            ])
             try:
                 task = asyncio.create_task(self._sessionless_submit_(batch_endpoint, batch_payload))
                 tasks.append(task)
@@ -351,7 +341,6 @@ class Order:
                 asyncio.create_task(log_event('RUNTIME_ERROR', message))
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        await self.close_session()
 
         for i, result in enumerate(results):
             if isinstance(result, Exception):
@@ -440,13 +429,10 @@ class Order:
         tasks = []
 
         for i in range(0, len(order_ids), 10):
-            batch_payload = {
-                "category": self.category, 
-                "request": [
-                    self.formats.create_cancel(order_id)
-                    for order_id in order_ids[i:i+10]
-                ]
-            }
+            batch_payload = self.formats.create_batch([
+                self.formats.create_cancel_json(order_id)
+                for order_id in order_ids[i:i+10]
+            ])
             try:
                 task = asyncio.create_task(self._sessionless_submit_(batch_endpoint, batch_payload))
                 tasks.append(task)
@@ -455,7 +441,6 @@ class Order:
                 asyncio.create_task(log_event('RUNTIME_ERROR', message))
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        await self.close_session()
 
         for i, result in enumerate(results):
             if isinstance(result, Exception):
@@ -497,12 +482,4 @@ class Order:
         except Exception as e:
             message = f"Error in cancel_all: {e}, Payload: {payload}"
             asyncio.create_task(log_event('RUNTIME_ERROR', message))
-            return None
-        
-
-        
-    async def close_session(self) -> None:
-        """
-        Asynchronously close the current session
-        """
-        await self.session.close()
\ No newline at end of file
+            return None
\ No newline at end of file
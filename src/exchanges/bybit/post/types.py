@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 class BybitFormats:
     """
@@ -23,6 +23,14 @@ class BybitFormats:
         Formats a payload for canceling a specific order.
     create_cancel_all() -> Dict:
         Formats a payload for canceling all orders for the symbol.
+    create_limit_json(side: str, price: float, qty: float) -> str:
+        Formats a limit order as JSON, from a cached template.
+    create_amend_json(orderId: str, price: float, qty: float) -> str:
+        Formats an amend as JSON, from a cached template.
+    create_cancel_json(orderId: str) -> str:
+        Formats a cancel as JSON, from a cached template.
+    create_batch(requests: List[str]) -> bytes:
+        Wraps JSON formatted orders into an encoded batch request body.
     """
 
     category = "linear"
@@ -42,6 +50,13 @@ class BybitFormats:
             "symbol": self.symbol,
         }
 
+        # Fields are interpolated unescaped, which holds for sides, decimal numbers and order IDs
+        base = f'"category":"{self.category}","symbol":"{self.symbol}"'
+        self._limit_template_ = "{" + base + ',"side":"%s","orderType":"Limit","price":"%s","qty":"%s","timeInForce":"PostOnly"}'
+        self._amend_template_ = "{" + base + ',"orderId":"%s","price":"%s","qty":"%s"}'
+        self._cancel_template_ = "{" + base + ',"orderId":"%s"}'
+        self._batch_prefix_ = f'{{"category":"{self.category}","request":['
+
     def create_limit(self, side: str, price: str, qty: str) -> Dict:
         """
         Creates a dictionary payload for a limit order.
@@ -145,4 +160,46 @@ class BybitFormats:
         Dict
             A dictionary formatted for a cancel all orders request.
         """
-        return self._base_
\ No newline at end of file
+        return self._base_
+
+    def create_limit_json(self, side: str, price: float, qty: float) -> str:
+        """
+        Formats a limit order as JSON, identical to serializing `create_limit`.
+
+        Parameters
+        ----------
+        side : str
+            The side of the order, either "Buy" or "Sell".
+        price : float
+            The price at which to place the order, formatted with `str`.
+        qty : float
+            The quantity of the order, formatted with `str`.
+
+        Returns
+        -------
+        str
+            The JSON formatted limit order.
+        """
+        return self._limit_template_ % (side, price, qty)
+
+    def create_amend_json(self, orderId: str, price: float, qty: float) -> str:
+        return self._amend_template_ % (orderId, price, qty)
+
+    def create_cancel_json(self, orderId: str) -> str:
+        return self._cancel_template_ % orderId
+
+    def create_batch(self, requests: List[str]) -> bytes:
+        """
+        Wraps JSON formatted orders into a batch request body, encoded once.
+
+        Parameters
+        ----------
+        requests : List[str]
+            Orders formatted by the `*_json` methods.
+
+        Returns
+        -------
+        bytes
+            The request body, to be signed and sent as is.
+        """
+        return (self._batch_prefix_ + ",".join(requests) + "]}").encode()
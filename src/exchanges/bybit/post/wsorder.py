@@ -0,0 +1,291 @@
+import asyncio
+import orjson
+import websockets
+from typing import Coroutine, Dict, List, Tuple, Union
+from src.utils.misc import time_ms, datetime_now as dt_now
+from src.exchanges.bybit.endpoints import WsStreamLinks
+from src.exchanges.bybit.post.order import Order
+from src.exchanges.bybit.post.types import BybitFormats
+from src.exchanges.bybit.websockets.private import BybitPrivateWs
+from src.sharedstate import SharedState
+from src.strategy.ws_feeds.bybitprivatedata import log_event
+
+
+class WsOrder:
+    """
+    Creates, amends and cancels orders over Bybit's authenticated WebSocket trade API, with
+    the same interface as Order, falling back to REST whenever the socket is unavailable.
+
+    Each request carries a `reqId`, and its response is matched back to the awaiting future
+    by the reader task. A request is only retried over REST if it could not be sent, as a
+    request that was sent but timed out or lost its connection may already have been executed.
+
+    Attributes
+    ----------
+    ss : SharedState
+        An instance of SharedState containing shared application data.
+    url : str
+        The trade stream URL, overridable to point at a mock server.
+    formats : BybitFormats
+        A helper object for formatting order payloads according to Bybit's API requirements.
+    rest : Order
+        The REST transport, used for fallbacks and for actions the trade stream does not support.
+    auth : BybitPrivateWs
+        Builds the authentication message sent on every (re)connection.
+    authenticated : bool
+        Whether the socket is connected and authenticated, so requests can be sent over it.
+    fallbacks : int
+        The number of requests sent over REST because the socket was unavailable.
+
+    Methods
+    -------
+    start() -> None:
+        Starts the connection task, if not already running.
+    order_limit(order: Tuple) -> Union[Dict, None]:
+        Submits a limit order.
+    order_limit_batch(orders: List) -> List:
+        Submits a batch of limit orders.
+    amend(order: Tuple) -> Union[Dict, None]:
+        Amends an existing order.
+    amend_batch(orders: List) -> List:
+        Amends a batch of existing orders.
+    cancel(orderId: str) -> Union[Dict, None]:
+        Cancels an existing order by its ID.
+    cancel_batch(orderIds: List) -> List:
+        Cancels a batch of orders by their IDs.
+    cancel_all() -> Union[Dict, None]:
+        Cancels all orders for the trading symbol, over REST.
+    close_session() -> None:
+        Closes the socket, on shutdown. The shared REST pool is closed by SharedState.
+    """
+
+    category = "linear"
+    recv_window = "5000"
+    request_timeout = 2.0
+    ping_interval = 20.0
+    _success_ = ["OK", "success", "SUCCESS", ""]
+
+    def __init__(self, ss: SharedState, url: str=WsStreamLinks.TRADE_STREAM) -> None:
+        """
+        Initializes the WsOrder object, without connecting until the first request or `start()`.
+
+        Parameters
+        ----------
+        ss : SharedState
+            An instance of SharedState containing shared application data.
+        url : str, optional
+            The trade stream URL, by default Bybit's.
+        """
+        self.ss = ss
+        self.url = url
+        self.formats = BybitFormats(self.ss.bybit_symbol)
+        self.rest = Order(self.ss)
+        self.limits = self.ss.bybit_rate_limits
+        self.auth = BybitPrivateWs(self.ss.api_key, self.ss.api_secret)
+        self.authenticated = False
+        self.fallbacks = 0
+
+        self._websocket_ = None
+        self._task_ = None
+        self._req_id_ = 0
+        self._pending_ = {}
+
+    def _order_to_str_(self, order: List) -> List[str]:
+        return list(map(str, order))
+
+    def start(self) -> None:
+        if self._task_ is None or self._task_.done():
+            self._task_ = asyncio.create_task(self._connect_())
+
+    async def _connect_(self) -> Coroutine:
+        """
+        Keeps an authenticated connection open, reconnecting whenever it drops.
+        """
+        async for websocket in websockets.connect(self.url, ping_interval=None):
+            try:
+                self._websocket_ = websocket
+                await websocket.send(self.auth.authentication())
+                heartbeat = asyncio.create_task(self._heartbeat_(websocket))
+
+                try:
+                    async for message in websocket:
+                        self._dispatch_(orjson.loads(message))
+                finally:
+                    heartbeat.cancel()
+
+            except websockets.ConnectionClosed:
+                pass
+
+            except Exception as e:
+                asyncio.create_task(log_event('API_ERROR', f"Bybit Trade Stream - General Error: {e}"))
+
+            finally:
+                self.authenticated = False
+                self._websocket_ = None
+                self._fail_pending_(ConnectionError("Bybit trade stream disconnected"))
+
+    async def _heartbeat_(self, websocket) -> Coroutine:
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            await websocket.send(b'{"op":"ping"}')
+
+    def _dispatch_(self, recv: Dict) -> None:
+        """
+        Routes a message from the trade stream to the future awaiting its `reqId`.
+        """
+        op = recv.get("op")
+
+        if op == "auth":
+            self.authenticated = recv.get("retCode") == 0
+            if not self.authenticated:
+                print(f"{dt_now()}: Bybit trade stream authentication failed: {recv.get('retMsg')}")
+            return
+
+        future = self._pending_.pop(recv.get("reqId"), None)
+
+        if future is not None and not future.done():
+            future.set_result(recv)
+
+    def _fail_pending_(self, exception: Exception) -> None:
+        for future in self._pending_.values():
+            if not future.done():
+                future.set_exception(exception)
+
+        self._pending_.clear()
+
+    async def _request_(self, op: str, payload: Union[Dict, bytes], endpoint: str) -> Union[Dict, None]:
+        """
+        Sends a request over the trade stream and awaits its response, or submits it over
+        REST if the stream is not authenticated or the request cannot be sent.
+
+        Parameters
+        ----------
+        op : str
+            The trade stream operation, e.g. "order.create-batch".
+        payload : Union[Dict, bytes]
+            The request payload, identical to the REST body, which is spliced into the
+            request as is if already serialized.
+        endpoint : str
+            The equivalent REST endpoint, used for the fallback.
+
+        Returns
+        -------
+        Union[Dict, None]
+            The result and latency if successful; otherwise, None.
+        """
+        self.start()
+
+        if not self.authenticated:
+            self.fallbacks += 1
+            return await self.rest._submit_(endpoint, payload)
+
+        # The trade stream shares the REST limits of the equivalent endpoint
+        await self.limits.acquire(endpoint)
+
+        self._req_id_ += 1
+        req_id = str(self._req_id_)
+        timestamp = time_ms()
+        future = asyncio.get_running_loop().create_future()
+        self._pending_[req_id] = future
+
+        if not isinstance(payload, bytes):
+            payload = orjson.dumps(payload)
+
+        try:
+            await self._websocket_.send(b"".join((
+                b'{"reqId":"', req_id.encode(),
+                b'","header":{"X-BAPI-TIMESTAMP":"', str(timestamp).encode(),
+                b'","X-BAPI-RECV-WINDOW":"', self.recv_window.encode(),
+                b'"},"op":"', op.encode(),
+                b'","args":[', payload, b"]}"
+            )))
+        except Exception:
+            self._pending_.pop(req_id, None)
+            self.fallbacks += 1
+            return await self.rest._submit_(endpoint, payload)
+
+        try:
+            response = await asyncio.wait_for(future, self.request_timeout)
+        finally:
+            self._pending_.pop(req_id, None)
+
+        self.limits.update(endpoint, response.get("header", {}))
+        code, msg = response.get("retCode"), response.get("retMsg")
+
+        if msg in self._success_:
+            return {
+                "result": response.get("data"),
+                "retExtInfo": response.get("retExtInfo", {}),
+                "latency": int(response.get("header", {}).get("Timenow", timestamp)) - timestamp
+            }
+
+        print(f"{dt_now()}: Error: {code}/{msg} | Op: {op}")
+        return None
+
+    async def _single_(self, op: str, payload: Dict, endpoint: str, name: str) -> Union[Dict, None]:
+        try:
+            return await self._request_(op, payload, endpoint)
+
+        except Exception as e:
+            message = f"Error in {name}: {e}, Payload: {payload}"
+            asyncio.create_task(log_event('RUNTIME_ERROR', message))
+            return None
+
+    async def _batch_(self, op: str, requests: List[str], endpoint: str, name: str) -> List:
+        """
+        Splits JSON formatted requests into batches of 10, sends them concurrently and logs any failures.
+        """
+        tasks = []
+
+        for i in range(0, len(requests), 10):
+            batch_payload = self.formats.create_batch(requests[i:i+10])
+            tasks.append(asyncio.create_task(self._request_(op, batch_payload, endpoint)))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                message = f"Error in {name} task {i}: {result}"
+                asyncio.create_task(log_event('API_ERROR', message))
+            elif result is None:
+                message = f"Error in {name} response {i}: {requests[i*10:i*10+10]}"
+                asyncio.create_task(log_event('API_ERROR', message))
+
+        return results
+
+    async def order_limit(self, order: Tuple[str, float, float]) -> Union[Dict, None]:
+        payload = self.formats.create_limit(*self._order_to_str_(order))
+        return await self._single_("order.create", payload, self.rest.endpoints.CREATE_ORDER, "order_limit")
+
+    async def order_limit_batch(self, orders: List[Tuple[str, float, float]]) -> List:
+        requests = [self.formats.create_limit_json(*order) for order in orders]
+        return await self._batch_("order.create-batch", requests, self.rest.endpoints.CREATE_BATCH, "order_limit_batch")
+
+    async def amend(self, order: Tuple[str, float, float]) -> Union[Dict, None]:
+        payload = self.formats.create_amend(*self._order_to_str_(order))
+        return await self._single_("order.amend", payload, self.rest.endpoints.AMEND_ORDER, "amend")
+
+    async def amend_batch(self, orders: List[Tuple[str, float, float]]) -> List:
+        requests = [self.formats.create_amend_json(*order) for order in orders]
+        return await self._batch_("order.amend-batch", requests, self.rest.endpoints.AMEND_BATCH, "amend_batch")
+
+    async def cancel(self, order_id: str) -> Union[Dict, None]:
+        payload = self.formats.create_cancel(order_id)
+        return await self._single_("order.cancel", payload, self.rest.endpoints.CANCEL_SINGLE, "cancel")
+
+    async def cancel_batch(self, order_ids: List[str]) -> List:
+        requests = [self.formats.create_cancel_json(order_id) for order_id in order_ids]
+        return await self._batch_("order.cancel-batch", requests, self.rest.endpoints.CANCEL_BATCH, "cancel_batch")
+
+    async def cancel_all(self) -> Union[Dict, None]:
+        """
+        Cancels all orders for the trading symbol over REST, as the trade stream has no cancel-all operation.
+        """
+        return await self.rest.cancel_all()
+
+    async def close_session(self) -> None:
+        if self._task_ is not None:
+            self._task_.cancel()
+
+        if self._websocket_ is not None:
+            await self._websocket_.close()
@@ -9,9 +9,10 @@ class BybitKlineHandler:
         self.ss = ss
 
     def _update_volatility_(self) -> None:
+        older, newer = self.ss.bybit_klines.last("close", self.ss.bb_length)
         self.ss.volatility_value = bbw(
-            klines=self.ss.bybit_klines._unwrap(), 
-            length=self.ss.bb_length, 
+            older=older,
+            newer=newer,
             multiplier=self.ss.bb_std
         )
 
@@ -21,9 +22,8 @@ class BybitKlineHandler:
         """
         Initialize the klines array and update volatility value
         """
-        for candle in data:
-            arr = np.array(candle, dtype=np.float64)
-            self.ss.bybit_klines.appendleft(arr)
+        # Candles are returned newest first
+        self.ss.bybit_klines.extend(np.array(data[::-1], dtype=np.float64))
 
         self._update_volatility_()
 
@@ -32,7 +32,7 @@ class BybitKlineHandler:
         Used to attain close values and calculate volatility
         """
         for candle in recv["data"]:
-            new = np.array([
+            new = (
                 float(candle["start"]),
                 float(candle["open"]),
                 float(candle["high"]),
@@ -40,10 +40,10 @@ class BybitKlineHandler:
                 float(candle["close"]),
                 float(candle["volume"]),
                 float(candle["turnover"]),
-            ])
+            )
 
             # If previous time same, then overwrite, else append
-            if self.ss.bybit_klines[-1][0] != new[0]:
+            if self.ss.bybit_klines.latest("start") != new[0]:
                 self.ss.bybit_klines.append(new)
 
             else:
@@ -1,33 +1,77 @@
-import numpy as np
-from typing import Dict, List
+from typing import Dict, Tuple
 from src.exchanges.common.localorderbook import BaseOrderBook
 
 class OrderBookBybit(BaseOrderBook):
     """
     Order book class for Bybit, extending the BaseOrderBook for handling Bybit-specific order book data.
 
+    Deltas are sequenced by their update ID (`u`), which increments by one per message.
+    A stale or duplicate delta is dropped, and a skipped ID triggers a buffered resync
+    from a REST snapshot. A snapshot pushed by the exchange (e.g. `u` = 1 after a
+    service restart) always resets the book, and cancels a REST resync still in flight.
+
+    Attributes
+    ----------
+    last_update_id : int
+        The update ID of the last snapshot or delta applied to the book.
+    last_seq : int
+        The cross sequence of the last snapshot or delta applied to the book.
+
     Methods
     -------
-    process_snapshot(asks: List[List[float]], bids: List[List[float]]) -> None:
-        Processes the initial snapshot of the order book.
+    process_snapshot(snapshot: Dict) -> None:
+        Processes a full snapshot of the order book.
     process(recv: Dict) -> None:
         Processes incoming messages from Bybit to update the order book.
     """
 
-    def process_snapshot(self, asks: List[List[float]], bids: List[List[float]]) -> None:
+    def __init__(self, capacity: int=500, tracked_depths: Tuple[int, ...]=(10,)) -> None:
+        super().__init__(capacity, tracked_depths)
+        self.last_update_id = 0
+        self.last_seq = 0
+
+    def process_snapshot(self, snapshot: Dict) -> None:
         """
         Processes and initializes the order book with a snapshot of asks and bids.
 
         Parameters
         ----------
-        asks : List[List[float]]
-            A list of ask orders, each represented as [price, quantity].
-        bids : List[List[float]]
-            A list of bid orders, each represented as [price, quantity].
+        snapshot : Dict
+            The snapshot payload from the WebSocket or REST API, with "a"/"b" lists of
+            [price, quantity] levels and its update ID "u".
         """
-        self.asks = np.array(asks, dtype=float)
-        self.bids = np.array(bids, dtype=float)
-        self.sort_book()
+        self.load_snapshot(snapshot["a"], snapshot["b"])
+        self.last_update_id = int(snapshot["u"])
+        self.last_seq = int(snapshot.get("seq", 0))
+        self.synced = True
+
+    def _apply_delta_(self, data: Dict) -> bool:
+        """
+        Applies a delta if it directly follows the last applied update ID.
+
+        Parameters
+        ----------
+        data : Dict
+            The delta payload, with "a"/"b" lists of [price, quantity] levels and its update ID "u".
+
+        Returns
+        -------
+        bool
+            False if one or more updates were skipped, else True.
+        """
+        update_id = int(data["u"])
+
+        if update_id <= self.last_update_id:
+            self.dropped += 1
+            return True
+
+        if update_id != self.last_update_id + 1:
+            return False
+
+        self.update_book(data["a"], data["b"])
+        self.last_update_id = update_id
+        self.last_seq = int(data.get("seq", self.last_seq))
+        return True
 
     def process(self, recv: Dict) -> None:
         """
@@ -38,16 +82,21 @@ class OrderBookBybit(BaseOrderBook):
         recv : Dict
             The incoming message containing either a snapshot or delta update of the order book.
         """
-        asks = np.array(recv["data"]["a"], dtype=float)
-        bids = np.array(recv["data"]["b"], dtype=float)
+        data = recv["data"]
 
         if recv["type"] == "snapshot":
-            self.process_snapshot(asks, bids)
-            
+            # Supersedes a REST snapshot still being fetched, which would be older
+            self._cancel_resync_()
+            self.process_snapshot(data)
+            self._resync_queue_.clear()
+
         elif recv["type"] == "delta":
-            self.asks = self.update_book(self.asks, asks)
-            self.bids = self.update_book(self.bids, bids)
-            self.sort_book()
+            if not self.synced:
+                self._queue_delta_(data)
+
+            elif not self._apply_delta_(data):
+                self._queue_delta_(data)
+                self.resync()
 
 
 class BybitBBAHandler:
@@ -98,4 +147,6 @@ class BybitBBAHandler:
             price, qty = list(map(float, best_ask[0]))
             if qty > 0:
                 self.ss.bybit_bba[1, 0] = price
-                self.ss.bybit_bba[1, 1] = qty
\ No newline at end of file
+                self.ss.bybit_bba[1, 1] = qty
+
+        self.ss.signal_market_change()
\ No newline at end of file
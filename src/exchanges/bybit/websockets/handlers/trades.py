@@ -1,4 +1,5 @@
 import numpy as np
+from numpy.typing import NDArray
 from typing import Dict, List
 from src.sharedstate import SharedState
 
@@ -13,6 +14,8 @@ class BybitTradesHandler:
 
     Methods
     -------
+    _ingest_(trades: NDArray) -> None:
+        Bulk appends a batch of parsed trades.
     initialize(data: List[Dict]) -> None:
         Initializes the handler with historical trades data.
     process(recv: List[Dict]) -> None:
@@ -30,6 +33,18 @@ class BybitTradesHandler:
         """
         self.ss = ss
 
+    def _ingest_(self, trades: NDArray) -> None:
+        """
+        Bulk appends a batch of parsed trades to the trades buffer and imbalance accumulator.
+
+        Parameters
+        ----------
+        trades : NDArray
+            A structured array of trades, oldest first, with the trades buffer's dtype.
+        """
+        self.ss.bybit_trades.extend(trades)
+        self.ss.bybit_trades_imb.extend(trades["side"], trades["qty"])
+
     def initialize(self, data: List[Dict]) -> None:
         """
         Initializes the shared state with historical trades data.
@@ -39,13 +54,17 @@ class BybitTradesHandler:
         data : List[Dict]
             A list of dictionaries, each representing a trade with time, price, size, and side information.
         """
-        for row in data:
-            time = float(row["time"])
-            price = float(row["price"])
-            qty = float(row["size"])
-            side = 0.0 if row["side"] == "Buy" else 1.0
-            new_trade = np.array([[time, side, price, qty]])
-            self.ss.bybit_trades.append(new_trade)
+        trades = np.fromiter(
+            (
+                (float(row["time"]), 0.0 if row["side"] == "Buy" else 1.0, float(row["price"]), float(row["size"]))
+                for row in data
+            ),
+            dtype=self.ss.bybit_trades.dtype,
+            count=len(data)
+        )
+
+        # The REST page is not guaranteed to be oldest first
+        self._ingest_(np.sort(trades, kind="stable", order="time"))
 
     def process(self, recv: List[Dict]) -> None:
         """
@@ -56,10 +75,26 @@ class BybitTradesHandler:
         recv : List[Dict]
             A list of dictionaries, each representing a trade with time, price, quantity, and side information.
         """
-        for trade in recv["data"]:
-            time = float(trade["T"])
-            price = float(trade["p"])
-            qty = float(trade["v"])
+        data = recv["data"]
+
+        # Most messages carry a single trade, which is cheaper to append directly
+        if len(data) == 1:
+            trade = data[0]
             side = 0.0 if trade["S"] == "Buy" else 1.0
-            new_trade = np.array([[time, side, price, qty]])
-            self.ss.bybit_trades.append(new_trade)
\ No newline at end of file
+            qty = float(trade["v"])
+            self.ss.bybit_trades.append((float(trade["T"]), side, float(trade["p"]), qty))
+            self.ss.bybit_trades_imb.update(side, qty)
+            self.ss.signal_market_change()
+            return
+
+        trades = np.fromiter(
+            (
+                (float(trade["T"]), 0.0 if trade["S"] == "Buy" else 1.0, float(trade["p"]), float(trade["v"]))
+                for trade in data
+            ),
+            dtype=self.ss.bybit_trades.dtype,
+            count=len(data)
+        )
+
+        self._ingest_(trades)
+        self.ss.signal_market_change()
@@ -1,8 +1,7 @@
 import json
-import hmac
-import hashlib
 from typing import List, Tuple
 from src.utils.misc import time_ms
+from src.exchanges.bybit.signer import BybitSigner
 
 class BybitPrivateWs:
     """
@@ -15,7 +14,9 @@ class BybitPrivateWs:
     secret : str
         The API secret for authentication.
     expires : str
-        The expiry time for the authentication message.
+        The expiry time of the last authentication message.
+    signer : BybitSigner
+        Signs the authentication message from a pre-keyed HMAC state.
 
     Methods
     -------
@@ -27,7 +28,7 @@ class BybitPrivateWs:
 
     def __init__(self, key: str, secret: str) -> None:
         """
-        Initializes the BybitPrivateWs with API credentials and an expiry time for the authentication.
+        Initializes the BybitPrivateWs with API credentials and a signer keyed with the secret.
 
         Parameters
         ----------
@@ -39,21 +40,20 @@ class BybitPrivateWs:
         self.key = key
         self.secret = secret
         self.expires = str(time_ms() + 5000)
+        self.signer = BybitSigner(key, secret)
 
     def authentication(self) -> str:
         """
-        Constructs the authentication payload for establishing a private WebSocket connection.
+        Constructs the authentication payload for establishing a private WebSocket connection,
+        expiring 5 seconds from now so it stays valid across reconnections.
 
         Returns
         -------
         str
             The authentication payload as a JSON string.
         """
-        signature = hmac.new(
-            key=bytes(self.secret, "utf-8"),
-            msg=bytes(f"GET/realtime{self.expires}", "utf-8"),
-            digestmod=hashlib.sha256,
-        ).hexdigest()
+        self.expires = str(time_ms() + 5000)
+        signature = self.signer.sign_auth(self.expires)
 
         return json.dumps({
             "op": "auth",
@@ -0,0 +1,131 @@
+import asyncio
+import aiohttp
+from collections import deque
+from time import perf_counter_ns
+from types import SimpleNamespace
+from src.utils.misc import datetime_now as dt_now
+
+
+class HttpSessionPool:
+    """
+    An application-scoped, keep-alive connection pool shared by every REST client of a venue.
+
+    The underlying session is created lazily inside the running event loop, and reuses its
+    TCP/TLS connections and cached DNS lookups across requests instead of opening a new
+    connection for every order action.
+
+    Attributes
+    ----------
+    base_url : str
+        The venue's REST base URL, used to pre-warm connections.
+    size : int
+        The maximum number of concurrent connections held open.
+    prewarm_path : str
+        A cheap, unauthenticated endpoint requested to open connections ahead of time.
+    keepalive_timeout : float
+        Seconds an idle connection is kept open before being released.
+    dns_ttl : int
+        Seconds a resolved host address is cached for.
+    connections_created : int
+        The number of new connections (TCP and, for https, TLS handshakes) opened.
+    connections_reused : int
+        The number of requests served over an already open connection.
+    request_latency_ns : deque
+        The round trip time of the most recent requests, in nanoseconds.
+
+    Methods
+    -------
+    session() -> aiohttp.ClientSession:
+        Returns the shared session, creating it on first use.
+    prewarm(count: int) -> None:
+        Opens `count` connections concurrently so the first orders skip the handshake.
+    close() -> None:
+        Closes the session and every pooled connection, on shutdown.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        size: int=16,
+        prewarm_path: str="/",
+        keepalive_timeout: float=60.0,
+        dns_ttl: int=300
+    ) -> None:
+        self.base_url = base_url
+        self.size = size
+        self.prewarm_path = prewarm_path
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.request_latency_ns = deque(maxlen=1000)
+
+        self._session_ = None
+
+    def _trace_config_(self) -> aiohttp.TraceConfig:
+        """
+        Counts new versus reused connections and times every request on the session.
+        """
+        async def on_request_start(session, ctx: SimpleNamespace, params) -> None:
+            ctx.start_ns = perf_counter_ns()
+
+        async def on_request_end(session, ctx: SimpleNamespace, params) -> None:
+            self.request_latency_ns.append(perf_counter_ns() - ctx.start_ns)
+
+        async def on_connection_create_end(session, ctx: SimpleNamespace, params) -> None:
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx: SimpleNamespace, params) -> None:
+            self.connections_reused += 1
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace
+
+    def session(self) -> aiohttp.ClientSession:
+        if self._session_ is None or self._session_.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.size,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_ttl,
+                use_dns_cache=True
+            )
+            self._session_ = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[self._trace_config_()]
+            )
+
+        return self._session_
+
+    async def prewarm(self, count: int) -> None:
+        """
+        Opens up to `count` pooled connections by sending concurrent requests to `prewarm_path`.
+
+        Parameters
+        ----------
+        count : int
+            The number of connections to open, capped at the pool size.
+        """
+        session = self.session()
+        url = self.base_url + self.prewarm_path
+
+        async def touch() -> None:
+            async with session.get(url) as response:
+                await response.read()
+
+        results = await asyncio.gather(
+            *(touch() for _ in range(min(count, self.size))),
+            return_exceptions=True
+        )
+
+        failed = sum(isinstance(result, Exception) for result in results)
+        if failed:
+            print(f"{dt_now()}: Failed to pre-warm {failed}/{len(results)} connections to {self.base_url}")
+
+    async def close(self) -> None:
+        if self._session_ is not None:
+            await self._session_.close()
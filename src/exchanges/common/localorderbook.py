@@ -1,67 +1,443 @@
+import asyncio
 import numpy as np
+from collections import deque
+from decimal import Decimal
 from numpy.typing import NDArray
-from typing import Dict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from src.exchanges.common.sortedbook import depth_sums, load_levels, reset_depth_sums, update_levels
+from src.exchanges.common.tickladder import BASE, BEST_ASK, BEST_BID, ladder_depth_sums, ladder_levels, ladder_recenter, ladder_update
 
 class BaseOrderBook:
     """
     A base class for maintaining and updating an order book with ask and bid orders.
 
+    Each side is held in a fixed (capacity, 2) float64 buffer with a live-length counter,
+    kept sorted by price and updated in place by numba-compiled kernels. Incoming levels
+    are staged in reusable buffers, so a delta message does not allocate new arrays.
+
+    Alternatively, once the instrument's tick size is known, the book can switch to a
+    tick-indexed ladder: a dense quantity array around the mid, indexed by integer price
+    ticks. Updates are then O(1) array writes, and the sorted asks/bids views are only
+    rebuilt from the ladder when they are read.
+
+    In sorted mode, running quantity and price * quantity sums over the top N levels
+    of each side are maintained as deltas arrive, for every depth in `tracked_depths`,
+    so reading the VAMP at those depths is O(1).
+
     Attributes
     ----------
+    capacity : int
+        The maximum number of levels kept on each side of the book.
+    tracked_depths : Tuple[int, ...]
+        The top-N depths whose quantity and notional sums are maintained incrementally.
+    tick_size : float
+        The tick size used by the ladder, or None while the book is in sorted mode.
     asks : NDArray
-        A NumPy array to store ask orders. Each order is represented by a [price, quantity] pair.
+        A view of the live ask orders, sorted by ascending price. Each order is a [price, quantity] pair.
     bids : NDArray
-        A NumPy array to store bid orders. Each order is represented by a [price, quantity] pair.
+        A view of the live bid orders, sorted by descending price. Each order is a [price, quantity] pair.
+    ask_cumqty : NDArray
+        The cumulative ask quantity from the best ask outwards, aligned with `asks`.
+    bid_cumqty : NDArray
+        The cumulative bid quantity from the best bid outwards, aligned with `bids`.
+    best_bid : float
+        The best bid price, or 0 if the side is empty.
+    best_ask : float
+        The best ask price, or 0 if the side is empty.
+    synced : bool
+        False until a snapshot is loaded, and while a sequence gap is being resynced.
+    snapshot_fetcher : Optional[Callable[[], Awaitable[Dict]]]
+        Coroutine function returning a REST snapshot, used to resync after a gap.
+    resyncs : int
+        The number of resyncs triggered by sequence gaps.
+    dropped : int
+        The number of messages discarded as stale, out of order or overflowing the resync queue.
 
     Methods
     -------
-    sort_book():
-        Sorts the ask and bid arrays by price in ascending and descending order, respectively.
-    update_book(asks_or_bids: NDArray, data: NDArray) -> NDArray:
-        Updates the order book (asks or bids) with new data.
+    resync() -> None:
+        Marks the book out of sync, queueing deltas while a REST snapshot is fetched and replayed.
+    vamp(depth: int) -> float:
+        Calculates the volume-weighted average mid price over the top `depth` levels.
+    use_tick_ladder(tick_size: float, ladder_size: int) -> None:
+        Switches the book to the tick-indexed ladder representation.
+    load_snapshot(asks: Union[NDArray, List], bids: Union[NDArray, List]) -> None:
+        Replaces both sides of the book with a full snapshot.
+    update_book(asks: Union[NDArray, List], bids: Union[NDArray, List]) -> None:
+        Applies delta updates to both sides of the book.
     process(recv):
         Abstract method for processing incoming data. To be implemented by derived classes.
     """
 
-    def __init__(self) -> None:
+    max_queued = 1000
+    max_resync_backoff = 60
+    rebase_interval = 10000
+
+    def __init__(self, capacity: int=500, tracked_depths: Tuple[int, ...]=(10,)) -> None:
         """
-        Initializes the BaseOrderBook with empty asks and bids arrays.
+        Initializes the BaseOrderBook with empty, preallocated asks and bids buffers.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The maximum number of levels kept on each side of the book, by default 500.
+        tracked_depths : Tuple[int, ...], optional
+            The top-N depths whose sums are maintained incrementally, by default (10,).
         """
-        self.asks = np.empty((0, 2), dtype=np.float64)
-        self.bids = np.empty((0, 2), dtype=np.float64)
+        self.capacity = capacity
+        self.tracked_depths = tuple(sorted(set(min(int(d), capacity) for d in tracked_depths)))
+        self._asks_ = np.zeros((capacity, 2), dtype=np.float64)
+        self._bids_ = np.zeros((capacity, 2), dtype=np.float64)
+        self._asks_len_ = 0
+        self._bids_len_ = 0
+
+        # Reusable staging buffers for incoming levels
+        self._ask_levels_ = np.zeros((capacity, 2), dtype=np.float64)
+        self._bid_levels_ = np.zeros((capacity, 2), dtype=np.float64)
+
+        self._asks_view_ = self._asks_[:0]
+        self._bids_view_ = self._bids_[:0]
+
+        # Running [quantity, price * quantity] sums over the tracked top-N depths
+        self._depths_ = np.array(self.tracked_depths, dtype=np.int64)
+        self._depth_index_ = {depth: i for i, depth in enumerate(self.tracked_depths)}
+        self._ask_sums_ = np.zeros((self._depths_.size, 2), dtype=np.float64)
+        self._bid_sums_ = np.zeros((self._depths_.size, 2), dtype=np.float64)
+        self._updates_since_rebase_ = 0
+
+        # Cumulative quantity prefixes, rebuilt lazily after the book changes
+        self._asks_cum_ = np.zeros(capacity, dtype=np.float64)
+        self._bids_cum_ = np.zeros(capacity, dtype=np.float64)
+        self._cum_stale_ = True
+
+        # Tick ladder state, only allocated once use_tick_ladder() is called
+        self.tick_size = None
+        self._tick_decimals_ = 0
+        self._ladder_ = None
+        self._ladder_state_ = None
+        self._ladder_stale_ = False
+
+        # Sequence tracking and gap resync state
+        self.synced = False
+        self.snapshot_fetcher: Optional[Callable[[], Awaitable[Dict]]] = None
+        self.resyncs = 0
+        self.dropped = 0
+        self._resync_queue_ = deque(maxlen=self.max_queued)
+        self._resync_task_ = None
+
+    @property
+    def asks(self) -> NDArray:
+        if self._ladder_stale_:
+            self._materialize_ladder_()
+        return self._asks_view_
 
-    def sort_book(self) -> None:
+    @property
+    def bids(self) -> NDArray:
+        if self._ladder_stale_:
+            self._materialize_ladder_()
+        return self._bids_view_
+
+    @property
+    def ask_cumqty(self) -> NDArray:
+        if self._cum_stale_:
+            self._refresh_cumqty_()
+        return self._asks_cum_[:self._asks_len_]
+
+    @property
+    def bid_cumqty(self) -> NDArray:
+        if self._cum_stale_:
+            self._refresh_cumqty_()
+        return self._bids_cum_[:self._bids_len_]
+
+    def _refresh_cumqty_(self) -> None:
         """
-        Sorts the ask orders in ascending order and bid orders in descending order by price.
-        Only keeps the top 500 orders in each.
+        Rebuilds the cumulative quantity prefixes of both sides into their preallocated buffers.
         """
-        self.asks = self.asks[self.asks[:, 0].argsort()][:500]
-        self.bids = self.bids[self.bids[:, 0].argsort()[::-1]][:500]
+        asks, bids = self.asks, self.bids
+        np.cumsum(asks[:, 1], out=self._asks_cum_[:asks.shape[0]])
+        np.cumsum(bids[:, 1], out=self._bids_cum_[:bids.shape[0]])
+        self._cum_stale_ = False
+
+    @property
+    def best_bid(self) -> float:
+        if self._ladder_ is not None:
+            idx = self._ladder_state_[BEST_BID]
+            return round((self._ladder_state_[BASE] + idx) * self.tick_size, self._tick_decimals_) if idx >= 0 else 0.0
+        return self._bids_[0, 0] if self._bids_len_ else 0.0
 
-    def update_book(self, asks_or_bids: NDArray, data: NDArray) -> NDArray:
+    @property
+    def best_ask(self) -> float:
+        if self._ladder_ is not None:
+            idx = self._ladder_state_[BEST_ASK]
+            return round((self._ladder_state_[BASE] + idx) * self.tick_size, self._tick_decimals_) if idx >= 0 else 0.0
+        return self._asks_[0, 0] if self._asks_len_ else 0.0
+
+    def use_tick_ladder(self, tick_size: float, ladder_size: int=16384) -> None:
         """
-        Updates the specified order book (asks or bids) with new data.
+        Switches the book to a tick-indexed ladder, carrying over any levels already held.
 
         Parameters
         ----------
-        asks_or_bids : NDArray
-            The current state of either the asks or bids in the order book.
-        data : NDArray
-            New data to be integrated into the asks or bids. Each element is a [price, quantity] pair.
+        tick_size : float
+            The instrument's minimum price increment, used to convert prices to tick indices.
+        ladder_size : int, optional
+            The number of ticks covered by the ladder window, by default 16384.
+        """
+        asks = self.asks.copy()
+        bids = self.bids.copy()
+
+        self.tick_size = tick_size
+        self._tick_decimals_ = max(0, -Decimal(str(tick_size)).as_tuple().exponent)
+        self._ladder_ = np.zeros((ladder_size, 2), dtype=np.float64)
+        self._ladder_state_ = np.array([0, -1, -1], dtype=np.int64)
+        self.load_snapshot(asks, bids)
+
+    def _materialize_ladder_(self) -> None:
+        """
+        Rebuilds the sorted asks/bids buffers from the ladder, best levels first.
+        """
+        self._bids_len_ = ladder_levels(self._ladder_, self._ladder_state_, 0, self.tick_size, self._tick_decimals_, self._bids_)
+        self._asks_len_ = ladder_levels(self._ladder_, self._ladder_state_, 1, self.tick_size, self._tick_decimals_, self._asks_)
+        self._ladder_stale_ = False
+        self._refresh_views_()
+
+    def _stage_levels_(self, levels: Union[NDArray, List], buffer: NDArray) -> Tuple[NDArray, int]:
+        """
+        Converts incoming levels into a float64 array, reusing the staging buffer where possible.
+
+        Parameters
+        ----------
+        levels : Union[NDArray, List]
+            Either an array of [price, quantity] rows, or a list of [price, quantity] pairs
+            as received from the exchange (numeric strings are accepted).
+        buffer : NDArray
+            The staging buffer to write list levels into.
 
         Returns
         -------
-        NDArray
-            The updated asks or bids array.
+        Tuple[NDArray, int]
+            The array holding the levels and the number of valid rows in it.
+        """
+        if isinstance(levels, np.ndarray):
+            levels = levels.reshape(-1, 2)
+            return levels, levels.shape[0]
+
+        count = len(levels)
+
+        # Only snapshots larger than the book itself fall back to a fresh array
+        if count > buffer.shape[0]:
+            return np.array(levels, dtype=np.float64).reshape(-1, 2), count
+
+        for i in range(count):
+            price, qty = levels[i]
+            buffer[i, 0] = price  # NOTE: NumPy parses numeric strings on assignment
+            buffer[i, 1] = qty
+
+        return buffer, count
+
+    def _refresh_views_(self) -> None:
         """
-        for price, qty in data:
-            # Remove orders with the specified price
-            asks_or_bids = asks_or_bids[asks_or_bids[:, 0] != price]
-            # Add new or updated order if quantity is greater than zero
-            if qty > 0:
-                asks_or_bids = np.vstack((asks_or_bids, np.array([price, qty])))
+        Re-slices the public asks/bids views, only when the number of live levels has changed.
+        """
+        if self._asks_view_.shape[0] != self._asks_len_:
+            self._asks_view_ = self._asks_[:self._asks_len_]
+
+        if self._bids_view_.shape[0] != self._bids_len_:
+            self._bids_view_ = self._bids_[:self._bids_len_]
+
+    def load_snapshot(self, asks: Union[NDArray, List], bids: Union[NDArray, List]) -> None:
+        """
+        Replaces both sides of the book with a full snapshot, sorting and truncating to capacity.
+
+        Parameters
+        ----------
+        asks : Union[NDArray, List]
+            The [price, quantity] ask levels, in any order.
+        bids : Union[NDArray, List]
+            The [price, quantity] bid levels, in any order.
+        """
+        asks, num_asks = self._stage_levels_(asks, self._ask_levels_)
+        bids, num_bids = self._stage_levels_(bids, self._bid_levels_)
+        self._cum_stale_ = True
+
+        if self._ladder_ is not None:
+            self._ladder_[:, :] = 0.0
+            self._ladder_state_[BEST_BID] = self._ladder_state_[BEST_ASK] = -1
+
+            if num_bids and num_asks:
+                mid = (bids[:num_bids, 0].max() + asks[:num_asks, 0].min()) / 2
+                ladder_recenter(self._ladder_, self._ladder_state_, int(round(mid / self.tick_size)))
+
+            ladder_update(self._ladder_, self._ladder_state_, bids, num_bids, 0, self.tick_size)
+            ladder_update(self._ladder_, self._ladder_state_, asks, num_asks, 1, self.tick_size)
+            self._ladder_stale_ = True
+            return
+
+        self._asks_len_ = load_levels(self._asks_, asks, num_asks, False)
+        self._bids_len_ = load_levels(self._bids_, bids, num_bids, True)
+        self._rebase_depth_sums_()
+        self._refresh_views_()
+
+    def update_book(self, asks: Union[NDArray, List], bids: Union[NDArray, List]) -> None:
+        """
+        Applies delta updates to both sides of the book in place.
+
+        Parameters
+        ----------
+        asks : Union[NDArray, List]
+            The [price, quantity] ask deltas. Zero quantities delete the level.
+        bids : Union[NDArray, List]
+            The [price, quantity] bid deltas. Zero quantities delete the level.
+        """
+        asks, num_asks = self._stage_levels_(asks, self._ask_levels_)
+        bids, num_bids = self._stage_levels_(bids, self._bid_levels_)
+        self._cum_stale_ = True
+
+        if self._ladder_ is not None:
+            ladder_update(self._ladder_, self._ladder_state_, bids, num_bids, 0, self.tick_size)
+            ladder_update(self._ladder_, self._ladder_state_, asks, num_asks, 1, self.tick_size)
+            self._ladder_stale_ = True
+            return
+
+        if num_asks:
+            self._asks_len_ = update_levels(self._asks_, self._asks_len_, asks, num_asks, False, self._depths_, self._ask_sums_)
 
-        return asks_or_bids
+        if num_bids:
+            self._bids_len_ = update_levels(self._bids_, self._bids_len_, bids, num_bids, True, self._depths_, self._bid_sums_)
+
+        self._updates_since_rebase_ += 1
+
+        # Periodically recompute the running sums to bound floating point drift
+        if self._updates_since_rebase_ >= self.rebase_interval:
+            self._rebase_depth_sums_()
+
+        self._refresh_views_()
+
+    def _rebase_depth_sums_(self) -> None:
+        """
+        Recomputes the tracked top-N sums of both sides from the sorted buffers.
+        """
+        reset_depth_sums(self._asks_, self._asks_len_, self._depths_, self._ask_sums_)
+        reset_depth_sums(self._bids_, self._bids_len_, self._depths_, self._bid_sums_)
+        self._updates_since_rebase_ = 0
+
+    def vamp(self, depth: int=10) -> float:
+        """
+        Calculates the Volume-Weighted Average Mid-Price (VAMP) over the top `depth` levels.
+
+        Tracked depths are read from the running sums in O(1). Other depths, and books in
+        tick ladder mode, are summed by a compiled kernel instead. An empty side contributes
+        a fair price of zero.
+
+        Parameters
+        ----------
+        depth : int, optional
+            The number of levels on each side to consider, by default 10.
+
+        Returns
+        -------
+        float
+            The average of the quantity-weighted bid and ask prices.
+        """
+        if self._ladder_ is not None:
+            bid_qty, bid_notional = ladder_depth_sums(self._ladder_, self._ladder_state_, 0, self.tick_size, depth)
+            ask_qty, ask_notional = ladder_depth_sums(self._ladder_, self._ladder_state_, 1, self.tick_size, depth)
+
+        elif depth in self._depth_index_:
+            i = self._depth_index_[depth]
+            bid_qty, bid_notional = self._bid_sums_[i]
+            ask_qty, ask_notional = self._ask_sums_[i]
+
+        else:
+            bid_qty, bid_notional = depth_sums(self._bids_, self._bids_len_, depth)
+            ask_qty, ask_notional = depth_sums(self._asks_, self._asks_len_, depth)
+
+        bid_fair = bid_notional / bid_qty if bid_qty > 0 else 0.0
+        ask_fair = ask_notional / ask_qty if ask_qty > 0 else 0.0
+
+        return (bid_fair + ask_fair) / 2
+
+    def _queue_delta_(self, data: Dict) -> None:
+        """
+        Buffers a delta received while the book is resyncing, to be replayed over the snapshot.
+        """
+        if len(self._resync_queue_) == self.max_queued:
+            self.dropped += 1
+
+        self._resync_queue_.append(data)
+
+    def resync(self) -> None:
+        """
+        Marks the book out of sync and, if a snapshot fetcher is set, starts a buffered resync.
+
+        Deltas received until the resync completes are queued, then replayed over the
+        snapshot. Without a fetcher, the book waits for the exchange to push a snapshot.
+        """
+        self.synced = False
+
+        if self._resync_task_ is not None and not self._resync_task_.done():
+            return
+
+        self.resyncs += 1
+
+        if self.snapshot_fetcher is not None:
+            self._resync_task_ = asyncio.create_task(self._resync_())
+
+    def _cancel_resync_(self) -> None:
+        """
+        Cancels a pending resync, once the exchange has pushed a newer snapshot than it would fetch.
+        """
+        if self._resync_task_ is not None and not self._resync_task_.done():
+            self._resync_task_.cancel()
+
+        self._resync_task_ = None
+
+    async def _resync_(self) -> None:
+        """
+        Fetches a REST snapshot, then replays the deltas queued since the gap was detected.
+
+        Retries until the queued deltas connect to a snapshot's sequence, backing off
+        exponentially from 1s up to `max_resync_backoff` seconds between attempts, and
+        logging every failed attempt.
+        """
+        backoff = 1
+
+        while True:
+            try:
+                snapshot = await self.snapshot_fetcher()
+                self.process_snapshot(snapshot)
+
+                while self._resync_queue_:
+                    if not self._apply_delta_(self._resync_queue_.popleft()):
+                        raise ValueError("Queued deltas do not connect to the snapshot")
+
+                self.synced = True
+                return
+
+            except Exception as e:
+                # Imported here, as the logging module imports the shared state and so this book
+                from src.strategy.ws_feeds.bybitprivatedata import log_event
+
+                self.synced = False
+                asyncio.create_task(log_event('API_ERROR', f"{self.__class__.__name__} - Resync failed, retrying in {backoff}s: {e}"))
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_resync_backoff)
+
+    def _apply_delta_(self, data: Dict) -> bool:
+        """
+        Abstract method for applying a sequenced delta. To be implemented by derived classes.
+
+        Parameters
+        ----------
+        data : Dict
+            The delta payload, including the exchange's update IDs.
+
+        Returns
+        -------
+        bool
+            False if the delta does not follow the last applied update (a gap), else True.
+        """
+        raise NotImplementedError("Derived classes should implement this method")
 
     def process(self, recv: Dict) -> Exception:
         """
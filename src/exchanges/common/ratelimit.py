@@ -0,0 +1,182 @@
+import asyncio
+from time import monotonic
+from typing import Dict, Mapping, Union
+from src.utils.misc import time_ms
+
+
+class TokenBucket:
+    """
+    A token bucket refilled continuously at `rate` tokens per second, up to `capacity`.
+
+    Callers wait in FIFO order for a token instead of being rejected, and the bucket can be
+    recalibrated from the exchange's own view of the remaining limit.
+
+    Attributes
+    ----------
+    rate : float
+        Tokens added per second.
+    capacity : float
+        The maximum number of tokens held, i.e. the largest allowed burst.
+    tokens : float
+        The tokens currently available.
+    blocked_until : float
+        A monotonic time before which no token is handed out, set when the exchange reports the limit is exhausted.
+    waits : int
+        The number of acquisitions that had to wait for a token.
+    """
+
+    def __init__(self, rate: float, capacity: float=None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+        self.waits = 0
+
+        self._updated_ = monotonic()
+        self._lock_ = asyncio.Lock()
+
+    def _refill_(self) -> float:
+        now = monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_) * self.rate)
+        self._updated_ = now
+        return now
+
+    @property
+    def level(self) -> float:
+        self._refill_()
+        return self.tokens
+
+    async def acquire(self) -> None:
+        """
+        Takes one token, waiting in line until one is available.
+        """
+        async with self._lock_:
+            waited = False
+
+            while True:
+                now = self._refill_()
+                delay = self.blocked_until - now
+
+                if delay <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+                    break
+
+                waited = True
+                await asyncio.sleep(max(delay, (1 - self.tokens) / self.rate))
+
+            self.waits += waited
+
+    def calibrate(self, limit: Union[int, None], remaining: int, reset_ms: Union[int, None]) -> None:
+        """
+        Aligns the bucket with the limit state reported by the exchange.
+
+        Parameters
+        ----------
+        limit : Union[int, None]
+            The endpoint's limit per second, if reported, which becomes the rate and capacity.
+        remaining : int
+            The requests left in the current window, which caps the available tokens.
+        reset_ms : Union[int, None]
+            The exchange timestamp at which the window resets, in milliseconds.
+        """
+        if limit:
+            self.rate = self.capacity = float(limit)
+
+        self._refill_()
+        self.tokens = min(self.tokens, float(remaining))
+
+        if remaining <= 0 and reset_ms:
+            # Bybit's windows are one second long, which also bounds any clock skew
+            self.blocked_until = monotonic() + min(max(0, reset_ms - time_ms()), 1000) / 1000
+
+    def throttle(self) -> None:
+        """
+        Empties the bucket and holds it for a full one second window, after the exchange
+        rejected a request for exceeding the limit (with or without limit headers).
+        """
+        self._refill_()
+        self.tokens = 0.0
+        self.blocked_until = max(self.blocked_until, monotonic() + 1.0)
+
+
+class RateGovernor:
+    """
+    Keeps one token bucket per endpoint, so requests are paced below the exchange's limits
+    instead of being throttled.
+
+    Attributes
+    ----------
+    limits : Dict[str, float]
+        The default limit per second of each endpoint, before any calibration.
+    default_limit : float
+        The limit per second of endpoints missing from `limits`.
+    buckets : Dict[str, TokenBucket]
+        The buckets, created on first use of each endpoint.
+
+    Methods
+    -------
+    acquire(endpoint: str) -> None:
+        Waits for a token of the endpoint's bucket.
+    update(endpoint: str, headers: Mapping) -> None:
+        Calibrates the endpoint's bucket from the rate limit headers of a response.
+    throttle(endpoint: str) -> None:
+        Holds the endpoint's bucket for a window, after a rate limit rejection.
+    metrics() -> Dict[str, Dict[str, float]]:
+        Returns the level, capacity and wait count of every bucket.
+    """
+
+    _limit_header_ = "X-Bapi-Limit"
+    _status_header_ = "X-Bapi-Limit-Status"
+    _reset_header_ = "X-Bapi-Limit-Reset-Timestamp"
+
+    def __init__(self, limits: Dict[str, float], default_limit: float=10) -> None:
+        self.limits = limits
+        self.default_limit = default_limit
+        self.buckets = {}
+
+    def _bucket_(self, endpoint: str) -> TokenBucket:
+        # Query strings of GET requests are not part of the limited path
+        path = endpoint.split("?", 1)[0]
+        bucket = self.buckets.get(path)
+
+        if bucket is None:
+            bucket = self.buckets[path] = TokenBucket(self.limits.get(path, self.default_limit))
+
+        return bucket
+
+    async def acquire(self, endpoint: str) -> None:
+        await self._bucket_(endpoint).acquire()
+
+    def update(self, endpoint: str, headers: Mapping) -> None:
+        """
+        Calibrates the endpoint's bucket, if the response carries Bybit's rate limit headers.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint the response came from.
+        headers : Mapping
+            The response headers, matched case-insensitively for HTTP responses.
+        """
+        remaining = headers.get(self._status_header_)
+
+        if remaining is None:
+            return
+
+        limit = headers.get(self._limit_header_)
+        reset_ms = headers.get(self._reset_header_)
+
+        self._bucket_(endpoint).calibrate(
+            limit=int(limit) if limit else None,
+            remaining=int(remaining),
+            reset_ms=int(reset_ms) if reset_ms else None
+        )
+
+    def throttle(self, endpoint: str) -> None:
+        self._bucket_(endpoint).throttle()
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        return {
+            path: {"level": bucket.level, "capacity": bucket.capacity, "waits": bucket.waits}
+            for path, bucket in self.buckets.items()
+        }
@@ -0,0 +1,246 @@
+import numpy as np
+from numba import njit
+from numpy.typing import NDArray
+from typing import Tuple
+
+@njit(cache=True)
+def find_level(book: NDArray, n: int, price: float, descending: bool) -> int:
+    """
+    Binary searches a price-sorted book side for the position of a price level.
+
+    Parameters
+    ----------
+    book : NDArray
+        A (capacity, 2) array of [price, quantity] rows, where the first `n` rows are live.
+    n : int
+        The number of live levels in `book`.
+    price : float
+        The price level to search for.
+    descending : bool
+        True if the side is sorted by descending price (bids), False for ascending (asks).
+
+    Returns
+    -------
+    int
+        The index of `price` if it exists, otherwise the index at which it should be inserted.
+    """
+    lo, hi = 0, n
+
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        level_price = book[mid, 0]
+
+        if (level_price > price) if descending else (level_price < price):
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return lo
+
+@njit(cache=True)
+def update_level(book: NDArray, n: int, price: float, qty: float, descending: bool, depths: NDArray, sums: NDArray) -> int:
+    """
+    Inserts, replaces or deletes a single price level in a price-sorted book side, in place.
+
+    The level is located with a binary search, live rows after it are shifted by one
+    position for inserts/deletes, and the side is truncated at the buffer capacity
+    (worst levels are dropped first).
+
+    The running [quantity, price * quantity] sums over the top `depths[j]` levels are
+    adjusted for the change, including the level pushed out of (or pulled into) the
+    top N by the shift.
+
+    Parameters
+    ----------
+    book : NDArray
+        A (capacity, 2) array of [price, quantity] rows, where the first `n` rows are live.
+    n : int
+        The number of live levels in `book`.
+    price : float
+        The price of the level to update.
+    qty : float
+        The new quantity at the price level. A quantity of zero deletes the level.
+    descending : bool
+        True if the side is sorted by descending price (bids), False for ascending (asks).
+    depths : NDArray
+        An int64 array of the top-N depths whose sums are tracked.
+    sums : NDArray
+        A (len(depths), 2) array of the [quantity, price * quantity] sums for each depth.
+
+    Returns
+    -------
+    int
+        The number of live levels after the update.
+    """
+    capacity = book.shape[0]
+    i = find_level(book, n, price, descending)
+
+    if i < n and book[i, 0] == price:
+        old_qty = book[i, 1]
+
+        if qty > 0:
+            book[i, 1] = qty
+
+            for d in range(depths.size):
+                if i < depths[d]:
+                    sums[d, 0] += qty - old_qty
+                    sums[d, 1] += price * (qty - old_qty)
+
+        else:
+            for j in range(i, n - 1):
+                book[j, 0] = book[j + 1, 0]
+                book[j, 1] = book[j + 1, 1]
+            n -= 1
+
+            for d in range(depths.size):
+                depth = depths[d]
+                if i < depth:
+                    sums[d, 0] -= old_qty
+                    sums[d, 1] -= price * old_qty
+
+                    # The level that was just outside the top N moves into it
+                    if depth - 1 < n:
+                        sums[d, 0] += book[depth - 1, 1]
+                        sums[d, 1] += book[depth - 1, 0] * book[depth - 1, 1]
+
+    elif qty > 0 and i < capacity:
+        # The level at the edge of the top N is about to be pushed out of it
+        for d in range(depths.size):
+            depth = depths[d]
+            if i < depth:
+                if depth - 1 < n:
+                    sums[d, 0] -= book[depth - 1, 1]
+                    sums[d, 1] -= book[depth - 1, 0] * book[depth - 1, 1]
+                sums[d, 0] += qty
+                sums[d, 1] += price * qty
+
+        last = n if n < capacity else capacity - 1
+        for j in range(last, i, -1):
+            book[j, 0] = book[j - 1, 0]
+            book[j, 1] = book[j - 1, 1]
+        book[i, 0] = price
+        book[i, 1] = qty
+        n = last + 1
+
+    return n
+
+@njit(cache=True)
+def update_levels(book: NDArray, n: int, levels: NDArray, count: int, descending: bool, depths: NDArray, sums: NDArray) -> int:
+    """
+    Applies a batch of [price, quantity] deltas to a price-sorted book side, in place.
+
+    Only the first `count` rows of `levels` are applied, which lets callers stage deltas
+    in a reusable buffer instead of allocating an array per message.
+
+    Parameters
+    ----------
+    book : NDArray
+        A (capacity, 2) array of [price, quantity] rows, where the first `n` rows are live.
+    n : int
+        The number of live levels in `book`.
+    levels : NDArray
+        A (k, 2) array of [price, quantity] deltas. Zero quantities delete the level.
+    count : int
+        The number of rows of `levels` to apply.
+    descending : bool
+        True if the side is sorted by descending price (bids), False for ascending (asks).
+    depths : NDArray
+        An int64 array of the top-N depths whose sums are tracked.
+    sums : NDArray
+        A (len(depths), 2) array of the [quantity, price * quantity] sums for each depth.
+
+    Returns
+    -------
+    int
+        The number of live levels after all deltas are applied.
+    """
+    for k in range(count):
+        n = update_level(book, n, levels[k, 0], levels[k, 1], descending, depths, sums)
+
+    return n
+
+@njit(cache=True)
+def depth_sums(book: NDArray, n: int, depth: int) -> Tuple[float, float]:
+    """
+    Sums the quantity and price * quantity over the top `depth` levels of a book side.
+
+    Parameters
+    ----------
+    book : NDArray
+        A (capacity, 2) array of [price, quantity] rows, sorted best first.
+    n : int
+        The number of live levels in `book`.
+    depth : int
+        The number of levels to sum over.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The total quantity and the total price * quantity.
+    """
+    qty, notional = 0.0, 0.0
+
+    for i in range(min(n, depth)):
+        qty += book[i, 1]
+        notional += book[i, 0] * book[i, 1]
+
+    return qty, notional
+
+@njit(cache=True)
+def reset_depth_sums(book: NDArray, n: int, depths: NDArray, sums: NDArray) -> None:
+    """
+    Recomputes the tracked top-N sums of a book side from scratch, in place.
+
+    Parameters
+    ----------
+    book : NDArray
+        A (capacity, 2) array of [price, quantity] rows, sorted best first.
+    n : int
+        The number of live levels in `book`.
+    depths : NDArray
+        An int64 array of the top-N depths whose sums are tracked.
+    sums : NDArray
+        A (len(depths), 2) array to write the [quantity, price * quantity] sums into.
+    """
+    for d in range(depths.size):
+        sums[d, 0], sums[d, 1] = depth_sums(book, n, depths[d])
+
+@njit(cache=True)
+def load_levels(book: NDArray, levels: NDArray, count: int, descending: bool) -> int:
+    """
+    Overwrites a book side with a full snapshot of levels, sorted and truncated to capacity.
+
+    Parameters
+    ----------
+    book : NDArray
+        A (capacity, 2) array to write the sorted [price, quantity] rows into.
+    levels : NDArray
+        A (k, 2) array of [price, quantity] snapshot levels, in any order.
+    count : int
+        The number of rows of `levels` that make up the snapshot.
+    descending : bool
+        True if the side is sorted by descending price (bids), False for ascending (asks).
+
+    Returns
+    -------
+    int
+        The number of live levels after loading the snapshot.
+    """
+    capacity = book.shape[0]
+    order = np.argsort(levels[:count, 0])
+    n = 0
+
+    for k in range(order.size):
+        idx = order[order.size - 1 - k] if descending else order[k]
+
+        if levels[idx, 1] <= 0:
+            continue
+
+        book[n, 0] = levels[idx, 0]
+        book[n, 1] = levels[idx, 1]
+        n += 1
+
+        if n == capacity:
+            break
+
+    return n
@@ -0,0 +1,236 @@
+import numpy as np
+from numba import njit
+from numpy.typing import NDArray
+from typing import Tuple
+
+# Indices into the ladder state array
+BASE, BEST_BID, BEST_ASK = 0, 1, 2
+
+@njit(cache=True)
+def _scan_best_(ladder: NDArray, col: int) -> int:
+    """
+    Finds the best occupied index of a ladder side by a full scan, or -1 if the side is empty.
+    """
+    size = ladder.shape[0]
+
+    if col == 0:
+        for j in range(size - 1, -1, -1):
+            if ladder[j, 0] > 0:
+                return j
+    else:
+        for j in range(size):
+            if ladder[j, 1] > 0:
+                return j
+
+    return -1
+
+@njit(cache=True)
+def ladder_recenter(ladder: NDArray, state: NDArray, center_tick: int) -> None:
+    """
+    Shifts the ladder window in place so that `center_tick` sits in its middle.
+
+    Levels that fall outside the new window are dropped, and the best bid/ask
+    indices are recomputed.
+
+    Parameters
+    ----------
+    ladder : NDArray
+        A (size, 2) array of quantities, where column 0 holds bids and column 1 holds asks.
+    state : NDArray
+        An int64 array of [base tick, best bid index, best ask index].
+    center_tick : int
+        The tick index to center the window on.
+    """
+    size = ladder.shape[0]
+    new_base = center_tick - size // 2
+    shift = new_base - state[BASE]
+
+    if shift == 0:
+        return
+
+    if shift >= size or -shift >= size:
+        ladder[:, :] = 0.0
+
+    elif shift > 0:
+        for j in range(size - shift):
+            ladder[j, 0] = ladder[j + shift, 0]
+            ladder[j, 1] = ladder[j + shift, 1]
+        ladder[size - shift:, :] = 0.0
+
+    else:
+        for j in range(size - 1, -shift - 1, -1):
+            ladder[j, 0] = ladder[j + shift, 0]
+            ladder[j, 1] = ladder[j + shift, 1]
+        ladder[:-shift, :] = 0.0
+
+    state[BASE] = new_base
+    state[BEST_BID] = _scan_best_(ladder, 0)
+    state[BEST_ASK] = _scan_best_(ladder, 1)
+
+@njit(cache=True)
+def ladder_update(ladder: NDArray, state: NDArray, levels: NDArray, count: int, col: int, tick_size: float) -> None:
+    """
+    Applies [price, quantity] deltas to one side of a tick-indexed ladder, in place.
+
+    Each price is converted to an integer tick index, so an update is a single array
+    write. The best index of the side is tracked incrementally and only rescanned
+    (downwards for bids, upwards for asks) when the best level itself is removed.
+
+    A level outside the window is only kept if it would become the new best of its
+    side, in which case the window is first recentered between it and the opposite
+    touch. Deeper out-of-window levels are dropped. The window is also recentered
+    whenever the mid drifts into the outer quarters of the ladder.
+
+    Parameters
+    ----------
+    ladder : NDArray
+        A (size, 2) array of quantities, where column 0 holds bids and column 1 holds asks.
+    state : NDArray
+        An int64 array of [base tick, best bid index, best ask index].
+    levels : NDArray
+        A (k, 2) array of [price, quantity] deltas. Zero quantities delete the level.
+    count : int
+        The number of rows of `levels` to apply.
+    col : int
+        The side to update, 0 for bids and 1 for asks.
+    tick_size : float
+        The instrument's minimum price increment.
+    """
+    size = ladder.shape[0]
+    is_bid = col == 0
+    best_key = BEST_BID if is_bid else BEST_ASK
+
+    for k in range(count):
+        price, qty = levels[k, 0], levels[k, 1]
+        idx = int(round(price / tick_size)) - state[BASE]
+
+        if idx < 0 or idx >= size:
+            if qty <= 0:
+                continue
+
+            best = state[best_key]
+            improves = best < 0 or (idx > best if is_bid else idx < best)
+
+            if not improves:
+                continue
+
+            # Center between the new level and the opposite touch, so neither side is dropped
+            opposite = state[BEST_ASK if is_bid else BEST_BID]
+            center = idx if opposite < 0 else (idx + opposite) // 2
+            ladder_recenter(ladder, state, state[BASE] + center)
+            idx = int(round(price / tick_size)) - state[BASE]
+
+            if idx < 0 or idx >= size:
+                continue
+
+        if qty > 0:
+            ladder[idx, col] = qty
+            best = state[best_key]
+
+            if best < 0 or (idx > best if is_bid else idx < best):
+                state[best_key] = idx
+
+        else:
+            ladder[idx, col] = 0.0
+
+            if idx == state[best_key]:
+                step = -1 if is_bid else 1
+                j = idx + step
+                while 0 <= j < size and ladder[j, col] <= 0:
+                    j += step
+                state[best_key] = j if 0 <= j < size else -1
+
+    best_bid, best_ask = state[BEST_BID], state[BEST_ASK]
+
+    if best_bid >= 0 and best_ask >= 0:
+        mid = (best_bid + best_ask) // 2
+        if mid < size // 4 or mid > (3 * size) // 4:
+            ladder_recenter(ladder, state, state[BASE] + mid)
+
+@njit(cache=True)
+def ladder_levels(ladder: NDArray, state: NDArray, col: int, tick_size: float, decimals: int, out: NDArray) -> int:
+    """
+    Writes the occupied levels of one ladder side into a [price, quantity] array, best first.
+
+    Parameters
+    ----------
+    ladder : NDArray
+        A (size, 2) array of quantities, where column 0 holds bids and column 1 holds asks.
+    state : NDArray
+        An int64 array of [base tick, best bid index, best ask index].
+    col : int
+        The side to read, 0 for bids and 1 for asks.
+    tick_size : float
+        The instrument's minimum price increment.
+    decimals : int
+        The number of decimals in the tick size, used to round reconstructed prices.
+    out : NDArray
+        A (capacity, 2) array to write the levels into.
+
+    Returns
+    -------
+    int
+        The number of levels written, at most the capacity of `out`.
+    """
+    size, capacity = ladder.shape[0], out.shape[0]
+    step = -1 if col == 0 else 1
+    j = state[BEST_BID if col == 0 else BEST_ASK]
+    n = 0
+
+    if j < 0:
+        return 0
+
+    while 0 <= j < size and n < capacity:
+        qty = ladder[j, col]
+
+        if qty > 0:
+            out[n, 0] = round((state[BASE] + j) * tick_size, decimals)
+            out[n, 1] = qty
+            n += 1
+
+        j += step
+
+    return n
+
+@njit(cache=True)
+def ladder_depth_sums(ladder: NDArray, state: NDArray, col: int, tick_size: float, depth: int) -> Tuple[float, float]:
+    """
+    Sums the quantity and price * quantity over the best `depth` occupied levels of one ladder side.
+
+    Parameters
+    ----------
+    ladder : NDArray
+        A (size, 2) array of quantities, where column 0 holds bids and column 1 holds asks.
+    state : NDArray
+        An int64 array of [base tick, best bid index, best ask index].
+    col : int
+        The side to read, 0 for bids and 1 for asks.
+    tick_size : float
+        The instrument's minimum price increment.
+    depth : int
+        The number of occupied levels to sum over.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The total quantity and the total price * quantity.
+    """
+    size = ladder.shape[0]
+    step = -1 if col == 0 else 1
+    j = state[BEST_BID if col == 0 else BEST_ASK]
+    qty_sum, notional, n = 0.0, 0.0, 0
+
+    if j < 0:
+        return qty_sum, notional
+
+    while 0 <= j < size and n < depth:
+        qty = ladder[j, col]
+
+        if qty > 0:
+            qty_sum += qty
+            notional += (state[BASE] + j) * tick_size * qty
+            n += 1
+
+        j += step
+
+    return qty_sum, notional
@@ -0,0 +1,214 @@
+import orjson
+from time import perf_counter_ns
+from typing import Callable, Dict, Optional, Tuple, Union
+
+
+class TopicStats:
+    """
+    The message count, handler errors and processing time histogram of a single topic.
+
+    Processing times are bucketed by powers of two nanoseconds, bucket i holding times in
+    [2^(i-1), 2^i) ns, so a time's bucket is its bit length.
+
+    Attributes
+    ----------
+    count : int
+        The number of messages handled.
+    errors : int
+        The number of messages whose handler raised.
+    total_ns : int
+        The total processing time, in nanoseconds.
+    histogram : List[int]
+        The number of messages in each processing time bucket.
+
+    Methods
+    -------
+    percentile_us(q: float) -> float:
+        Estimates a processing time percentile from the histogram.
+    """
+
+    buckets = 64
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.histogram = [0] * self.buckets
+
+    def percentile_us(self, q: float) -> float:
+        """
+        Estimates the `q`th percentile processing time as the upper bound of its bucket.
+
+        Parameters
+        ----------
+        q : float
+            The percentile, in [0, 100].
+
+        Returns
+        -------
+        float
+            The upper bound of the percentile's bucket, in microseconds.
+        """
+        rank, seen = q / 100 * self.count, 0
+
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                return 2 ** bucket / 1e3
+
+        return 2 ** self.buckets / 1e3
+
+
+class WsDispatcher:
+    """
+    Decodes WebSocket messages and routes them to their topic's handler, shared by every feed.
+
+    Messages without a topic (subscription/auth acks and heartbeats) are counted and dropped
+    after a single lookup. Topics are routed by exact match, falling back to the longest
+    matching prefix, and every resolved route is memoized with its stats so later messages
+    of the topic cost a single lookup. A handler raising is counted and reported to
+    `on_error`, without tearing down the connection.
+
+    Attributes
+    ----------
+    key : str
+        The message field holding the topic, e.g. "topic" or "stream".
+    payload : Optional[str]
+        The message field passed to handlers, or None to pass the whole message.
+    on_error : Optional[Callable[[str, Exception], None]]
+        Called with the topic and exception when a handler raises.
+    stats : Dict[str, TopicStats]
+        The stats of every routed topic.
+    control : int
+        The number of messages without a topic (acks & heartbeats).
+    unrouted : int
+        The number of messages whose topic has no handler.
+
+    Methods
+    -------
+    dispatch(raw: Union[str, bytes]) -> None:
+        Decodes a message and routes it to its handler.
+    metrics() -> Dict[str, Dict]:
+        Summarizes the stats of every topic.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        routes: Dict[str, Callable],
+        prefixes: Optional[Dict[str, Callable]]=None,
+        payload: Optional[str]=None,
+        on_error: Optional[Callable[[str, Exception], None]]=None
+    ) -> None:
+        """
+        Initializes the dispatcher with its routes.
+
+        Parameters
+        ----------
+        key : str
+            The message field holding the topic.
+        routes : Dict[str, Callable]
+            Handlers by exact topic.
+        prefixes : Dict[str, Callable], optional
+            Handlers by topic prefix, for topics not routed exactly.
+        payload : str, optional
+            The message field passed to handlers. If None, handlers get the whole message.
+        on_error : Callable[[str, Exception], None], optional
+            Called with the topic and exception when a handler raises.
+        """
+        self.key = key
+        self.payload = payload
+        self.on_error = on_error
+        self.stats: Dict[str, TopicStats] = {}
+        self.control = 0
+        self.unrouted = 0
+
+        # Longest prefix first, so the most specific route wins
+        self._prefixes_ = sorted((prefixes or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self._routes_: Dict[str, Optional[Tuple[Callable, TopicStats]]] = {}
+
+        for topic, handler in routes.items():
+            self._routes_[topic] = (handler, self._stats_(topic))
+
+    def _stats_(self, topic: str) -> TopicStats:
+        if topic not in self.stats:
+            self.stats[topic] = TopicStats()
+
+        return self.stats[topic]
+
+    def _resolve_(self, topic: str) -> Optional[Tuple[Callable, TopicStats]]:
+        """
+        Resolves a topic not seen before by prefix, memoizing the result (including no match).
+        """
+        route = None
+
+        for prefix, handler in self._prefixes_:
+            if topic.startswith(prefix):
+                route = (handler, self._stats_(topic))
+                break
+
+        self._routes_[topic] = route
+        return route
+
+    def dispatch(self, raw: Union[str, bytes]) -> None:
+        """
+        Decodes a message and routes it to its topic's handler, timing the handler.
+
+        Parameters
+        ----------
+        raw : Union[str, bytes]
+            The message as received from the WebSocket.
+        """
+        recv = orjson.loads(raw)
+        topic = recv.get(self.key)
+
+        if topic is None:
+            self.control += 1
+            return
+
+        try:
+            route = self._routes_[topic]
+        except KeyError:
+            route = self._resolve_(topic)
+
+        if route is None:
+            self.unrouted += 1
+            return
+
+        handler, stats = route
+        payload = self.payload
+        start = perf_counter_ns()
+
+        try:
+            handler(recv if payload is None else recv[payload])
+        except Exception as e:
+            stats.errors += 1
+
+            if self.on_error is not None:
+                self.on_error(topic, e)
+
+        elapsed_ns = perf_counter_ns() - start
+        stats.count += 1
+        stats.total_ns += elapsed_ns
+        stats.histogram[elapsed_ns.bit_length()] += 1
+
+    def metrics(self) -> Dict[str, Dict]:
+        """
+        Summarizes the stats of every topic that has received messages.
+
+        Returns
+        -------
+        Dict[str, Dict]
+            By topic, the message count, handler errors, mean processing time, and the
+            estimated p50/p99 processing times in microseconds.
+        """
+        return {
+            topic: {
+                "count": stats.count,
+                "errors": stats.errors,
+                "mean_us": stats.total_ns / stats.count / 1e3,
+                "p50_us": stats.percentile_us(50),
+                "p99_us": stats.percentile_us(99),
+            }
+            for topic, stats in self.stats.items() if stats.count
+        }
@@ -3,16 +3,19 @@ from numba import njit
 from numpy.typing import NDArray
 
 @njit(cache=True)
-def bbw(klines: NDArray, length: int, multiplier: float) -> float:
+def bbw(older: NDArray, newer: NDArray, multiplier: float) -> float:
     """
-    Calculates the Bollinger Band Width (BBW) for a given set of klines.
+    Calculates the Bollinger Band Width (BBW) for the close prices of a window of klines.
+
+    The window is passed as two chronological slices, as returned by a ring buffer
+    read, so the closes never need to be copied into one array.
 
     Parameters
     ----------
-    klines : NDArray
-        The klines data array, where each row represents a kline and the 5th column contains the close prices.
-    length : int
-        The number of periods to use for calculating the EMA and the standard deviation.
+    older : NDArray
+        The older close prices of the window, empty unless the window wraps around the buffer.
+    newer : NDArray
+        The newer close prices of the window.
     multiplier : float
         The multiplier for the standard deviation to calculate the width of the bands.
 
@@ -23,9 +26,18 @@ def bbw(klines: NDArray, length: int, multiplier: float) -> float:
 
     Notes
     -----
-    - The function assumes that the input `klines` array's 5th column (index 4) contains the closing prices.
+    - The caller selects the window, e.g. the last `length` closes of the klines buffer.
     - This implementation is optimized for performance with Numba's JIT compiler.
     """
-    closes = klines[:, 4]
-    dev = multiplier * np.std(closes[-length:])
-    return 2 * dev 
\ No newline at end of file
+    n = older.size + newer.size
+    mean = (np.sum(older) + np.sum(newer)) / n
+    sq_dev = 0.0
+
+    for close in older:
+        sq_dev += (close - mean) ** 2
+
+    for close in newer:
+        sq_dev += (close - mean) ** 2
+
+    dev = multiplier * np.sqrt(sq_dev / n)
+    return 2 * dev
@@ -3,12 +3,17 @@ import numpy as np
 import os
 import yaml
 from collections import deque
-from numpy_ringbuffer import RingBuffer
+from time import time_ns
 from typing import Dict
 from numpy.typing import NDArray
 from src.exchanges.common.localorderbook import BaseOrderBook
-from src.exchanges.binance.websockets.handlers.orderbook import OrderBookBinance
+from src.exchanges.common.httppool import HttpSessionPool
+from src.exchanges.common.ratelimit import RateGovernor
+from src.exchanges.bybit.endpoints import BaseEndpoints, PublicGetLinks, PrivateRateLimits
 from src.exchanges.bybit.websockets.handlers.orderbook import OrderBookBybit
+from src.strategy.features.trades_imbalance import StreamingTradesImbalance
+from src.strategy.startup import StartupPhases
+from src.utils.ringbuffer import ColumnarRingBuffer
 
 class SharedState:
     """
@@ -34,15 +39,24 @@ class SharedState:
         Calculates the weighted mid-price based on best bid and ask quantities.
     calculate_vamp(book: BaseOrderBook, depth=10) -> float:
         Calculates the volume-weighted average mid-price (VAMP) based on the specified depth.
+    signal_market_change() -> None:
+        Notifies the event-driven strategy loop that market data has changed.
+    close_http() -> Coroutine:
+        Closes the REST connection pools shared by every client, on shutdown.
     """
 
     PARAM_PATH = os.path.dirname(os.path.realpath(__file__)) + "/../parameters.yaml"  
+    TRADES_COLUMNS = ("time", "side", "price", "qty")
+    KLINES_COLUMNS = ("start", "open", "high", "low", "close", "volume", "turnover")
 
     def __init__(self) -> None:
         """
         Initializes the SharedState with paths to configuration and parameters files,
         loads initial configurations and settings, and initializes market data attributes.
         """
+        # Readiness barrier & timings of the cold-start phases, timed from here
+        self.startup = StartupPhases()
+
         self.api_key = os.getenv("API_KEY")
         self.api_secret = os.getenv("API_SECRET")
         if not self.api_key or not self.api_secret:
@@ -54,18 +68,39 @@ class SharedState:
 
         # Initialize market data attributes for Binance and Bybit
         self.binance_ws_connected = False
-        self.binance_trades = RingBuffer(capacity=1000, dtype=(float, 4))
+        self.binance_trades = ColumnarRingBuffer(capacity=1000, columns=self.TRADES_COLUMNS)
+        self.binance_trades_imb = StreamingTradesImbalance(window=1000)
         self.binance_bba = np.ones((2, 2), dtype=np.float64)
-        self.binance_book = OrderBookBinance()
         self.binance_last_price = 0
+        self.binance_book = None
+        self.binance_http = None
+
+        if self.primary_data_feed == "BINANCE":
+            self._init_binance_()
 
         self.bybit_ws_connected = False
-        self.bybit_klines = RingBuffer(capacity=500, dtype=(float, 7))
-        self.bybit_trades = RingBuffer(capacity=1000, dtype=(float, 4))
+        self.bybit_klines = ColumnarRingBuffer(capacity=500, columns=self.KLINES_COLUMNS)
+        self.bybit_trades = ColumnarRingBuffer(capacity=1000, columns=self.TRADES_COLUMNS)
+        self.bybit_trades_imb = StreamingTradesImbalance(window=1000)
         self.bybit_bba = np.ones((2, 2), dtype=np.float64)
         self.bybit_book = OrderBookBybit()
         self.bybit_mark_price = 0
 
+        # Keep-alive connection pool shared by every Bybit REST client
+        self.bybit_http = HttpSessionPool(
+            base_url=BaseEndpoints.MAINNET1,
+            size=self.http_pool_size,
+            prewarm_path=PublicGetLinks.SERVER_TIME
+        )
+
+        # Paces private requests per endpoint, shared by the REST and WS order transports
+        self.bybit_rate_limits = RateGovernor(PrivateRateLimits)
+
+        # Event-driven quoting, set by market data handlers and awaited by the strategy loop
+        self.market_changed = asyncio.Event()
+        self.market_changed_ns = 0
+        self.requote_latency_ns = deque(maxlen=1000)
+
         # Other shared attributes
         self.current_orders = {}
         self.execution_feed = deque(maxlen=100)
@@ -73,6 +108,23 @@ class SharedState:
         self.inventory_delta = 0
 
 
+    def _init_binance_(self) -> None:
+        """
+        Creates Binance's local book and REST connection pool, importing its modules only when
+        Binance is the primary data feed.
+        """
+        from src.exchanges.binance import endpoints as binance_endpoints
+        from src.exchanges.binance.websockets.handlers.orderbook import OrderBookBinance
+
+        self.binance_book = OrderBookBinance()
+
+        # Keep-alive connection pool for Binance's public futures REST API
+        self.binance_http = HttpSessionPool(
+            base_url=binance_endpoints.BaseEndpoints.FUTURES,
+            size=4,
+            prewarm_path=binance_endpoints.PublicGetLinks.SERVER_TIME
+        )
+
     def _load_settings_(self, settings: Dict, reload: bool=False) -> None:
         """
         Updates trading parameters and settings from a dictionary of settings.
@@ -81,6 +133,10 @@ class SharedState:
             self.primary_data_feed = str(settings["primary_data_feed"]).upper()
             self.binance_symbol = str(settings["binance_symbol"])
             self.bybit_symbol = str(settings["bybit_symbol"])
+            self.orderbook_mode = str(settings.get("orderbook_mode", "Sorted")).upper()
+            self.http_pool_size = int(settings.get("http_pool_size", 16))
+            self.http_prewarm_connections = int(settings.get("http_prewarm_connections", 4))
+            self.order_transport = str(settings.get("order_transport", "Rest")).upper()
 
         self.account_size = float(settings["account_size"])
         self.bb_length = int(settings["bollinger_band_length"])
@@ -92,6 +148,10 @@ class SharedState:
         self.min_order_size = float(settings["min_order_size"])
         self.max_order_size = float(settings["max_order_size"])
         self.inventory_extreme = float(settings["inventory_extreme"])
+        self.quote_mode = str(settings.get("quote_mode", "Timer")).upper()
+        self.requote_threshold_bps = float(settings.get("requote_threshold_bps", 0.5))
+        self.min_requote_interval_ms = float(settings.get("min_requote_interval_ms", 100))
+        self.max_quote_staleness_ms = float(settings.get("max_quote_staleness_ms", 1000))
 
     def _load_initial_settings_(self) -> None:
         """
@@ -111,6 +171,25 @@ class SharedState:
                 settings = yaml.safe_load(f)
                 self._load_settings_(settings, reload=True)
 
+    def signal_market_change(self) -> None:
+        """
+        Marks market data as changed, recording when the first unhandled change arrived.
+        """
+        if not self.market_changed.is_set():
+            self.market_changed_ns = time_ns()
+            self.market_changed.set()
+
+    async def close_http(self) -> None:
+        """
+        Closes the REST connection pools shared by every Bybit (and Binance) client.
+
+        Individual clients never close the pools, as one client closing would break the rest.
+        """
+        await self.bybit_http.close()
+
+        if self.binance_http is not None:
+            await self.binance_http.close()
+
     @property
     def binance_mid(self) -> float:
         return self.calculate_mid(self.binance_bba)
@@ -185,10 +264,10 @@ class SharedState:
         Calculates the Volume-Weighted Average Mid-Price (VAMP) over a specified depth from the order book.
 
         Steps:
-        1. Sum the quantities for the top `depth` bids and asks separately.
-        2. Calculate the weighted price for each bid and ask up to the specified depth, using their quantities as weights.
-        3. Compute the fair value for bids and asks by multiplying each price by its relative weight and summing the results.
-        4. Calculate the VAMP as the average of the bid and ask fair values.
+        1. Read the quantity and price * quantity sums for the top `depth` bids and asks, which the
+           book maintains incrementally for its tracked depths (other depths are summed on demand).
+        2. Compute the fair value for bids and asks by dividing each side's price * quantity sum by its quantity sum.
+        3. Calculate the VAMP as the average of the bid and ask fair values.
 
         Parameters
         ----------
@@ -202,9 +281,4 @@ class SharedState:
         float
             The calculated VAMP, representing an average price adjusted for volume at each depth level.
         """
-        bids_qty_sum = sum(bid[1] for bid in book.bids[:depth])
-        asks_qty_sum = sum(ask[1] for ask in book.asks[:depth])
-        bid_fair = sum(bid[0] * (bid[1] / bids_qty_sum) for bid in book.bids[:depth])
-        ask_fair = sum(ask[0] * (ask[1] / asks_qty_sum) for ask in book.asks[:depth])
-
-        return (bid_fair + ask_fair) / 2
\ No newline at end of file
+        return book.vamp(depth)
\ No newline at end of file
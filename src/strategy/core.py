@@ -1,44 +1,13 @@
 import asyncio
+from time import time_ns
 from src.utils.misc import datetime_now as dt_now
 from src.strategy.ws_feeds.bybitmarketdata import BybitMarketData
-from src.strategy.ws_feeds.binancemarketdata import BinanceMarketData
 from src.strategy.ws_feeds.bybitprivatedata import BybitPrivateData
-from src.strategy.marketmaker import MarketMaker
-from src.strategy.oms import OMS
 from src.sharedstate import SharedState
 
+# NOTE: The Binance feed, the quoting modules and the kernel warm-up are imported where
+# they are first used, so the feeds start without waiting on them (see benchmarks.import_time)
 
-import logging
-import logging.handlers
-from src.utils.misc import datetime_now as dt_now
-from src.strategy.ws_feeds.bybitprivatedata import log_event 
-
-
-async def log_event(event_type: str, message: str):
-    """Logs events asynchronously to avoid blocking the main trading loop."""
-    try:
-        logger = logging.getLogger('hft_logger')
-        logger.setLevel(logging.INFO)
-
-        # Rotating file handler for log management
-        handler = logging.handlers.RotatingFileHandler(
-            'hft_log.txt', maxBytes=10 * 1024 * 1024, backupCount=5
-        ) 
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if event_type == 'FILL':
-            logger.info(f"FILL - {dt_now()} - {message}")
-        elif event_type == 'REJECTION':
-            logger.warning(f"REJECTION - {dt_now()} - {message}")
-        elif event_type == 'RUNTIME_ERROR':
-            logger.error(f"RUNTIME_ERROR - {dt_now()} - {message}")
-        elif event_type == 'API_ERROR':
-            logger.error(f"API_ERROR - {dt_now()} - {message}")
-
-    except Exception as e:
-        print(f"Error during logging: {e}") #  Fallback to console if logging fails
 
 class DataFeeds:
     """
@@ -56,16 +25,23 @@ class DataFeeds:
         """
         self.ss = ss
 
+    async def _prewarm_http_(self) -> None:
+        self.ss.startup.begin("http_prewarm")
+        await self.ss.bybit_http.prewarm(self.ss.http_prewarm_connections)
+        self.ss.startup.done("http_prewarm")
+
     async def start_feeds(self) -> None:
         """
-        Starts the WebSocket data feeds asynchronously.
+        Starts the WebSocket data feeds asynchronously, pre-warming the REST connection pool alongside.
         """
         tasks = [
+            asyncio.create_task(self._prewarm_http_()),
             asyncio.create_task(BybitMarketData(self.ss).start_feed()),
             asyncio.create_task(BybitPrivateData(self.ss).start_feed())
         ]
 
         if self.ss.primary_data_feed == "BINANCE":
+            from src.strategy.ws_feeds.binancemarketdata import BinanceMarketData
             tasks.append(asyncio.create_task(BinanceMarketData(self.ss).start_feed()))
 
         await asyncio.gather(*tasks)
@@ -87,39 +63,173 @@ class Strategy:
         """
         self.ss = ss
 
-    async def _wait_for_ws_confirmation_(self) -> None:
+        # Created once the feeds have set the instrument's precision, then reused every cycle
+        self.market_maker = None
+        self.oms = None
+
+    @staticmethod
+    def _import_and_warmup_() -> str:
+        """
+        Imports the quoting modules and compiles (or loads from numba's cache) every kernel.
+
+        Returns
+        -------
+        str
+            The per-kernel warm-up report.
+        """
+        from src.utils import jit_warmup
+        return jit_warmup.report(jit_warmup.warmup())
+
+    async def _warm_kernels_(self) -> None:
         """
-        Waits for confirmation that the WebSocket connections are established.
+        Imports the quoting modules and warms up every kernel in a worker thread, alongside
+        the feeds' network I/O, so the first quote doesn't pay for either.
         """
-        while True: 
-            await asyncio.sleep(1)  # Check every second
+        self.ss.startup.begin("jit")
+        report = await asyncio.to_thread(self._import_and_warmup_)
+        self.ss.startup.done("jit")
+
+        print(f"{dt_now()}: Kernels warmed up:\n{report}")
+
+    async def _wait_until_ready_(self) -> None:
+        """
+        Waits until the market data of the quoted feeds is backfilled and streaming, the
+        open orders and position are synced, and the quoting kernels are compiled.
+        """
+        phases = ["bybit_backfill", "bybit_ws", "bybit_private_sync", "jit"]
+
+        if self.ss.primary_data_feed == "BINANCE":
+            phases += ["binance_backfill", "binance_ws"]
+
+        await self.ss.startup.wait(*phases)
 
-            if not self.ss.bybit_ws_connected:
+    def _books_synced_(self) -> bool:
+        """
+        Checks that no order book used for quoting is waiting on a snapshot resync.
+        """
+        if not self.ss.bybit_book.synced:
+            return False
+
+        if self.ss.primary_data_feed == "BINANCE" and not self.ss.binance_book.synced:
+            return False
+
+        return True
+
+    def _reference_price_(self) -> float:
+        """
+        The mid price whose moves trigger a requote in event-driven mode.
+        """
+        return self.ss.binance_mid if self.ss.primary_data_feed == "BINANCE" else self.ss.bybit_mid
+
+    async def _quote_(self) -> None:
+        """
+        Generates a new set of quotes and sends them to the OMS.
+        """
+        self.ss.startup.begin("first_quote")
+        new_orders, spread = self.market_maker.generate_quotes(debug=False)
+        await self.oms.run(new_orders, spread)
+        self.ss.startup.done("first_quote")
+
+    async def _timer_loop_(self) -> None:
+        """
+        Requotes at a fixed 1s interval, regardless of market activity.
+        """
+        while True:
+            await asyncio.sleep(1)  # Strategy iteration delay
+
+            # Never quote off a book that is waiting on a snapshot resync
+            if not self._books_synced_():
+                continue
+
+            await self._quote_()
+
+    async def _event_loop_(self) -> None:
+        """
+        Requotes as soon as market data changes by more than `requote_threshold_bps`, at most
+        once per `min_requote_interval_ms`, and at least once per `max_quote_staleness_ms`.
+
+        The time from the WS message that first signalled a change to the requote decision
+        is recorded in `ss.requote_latency_ns`.
+        """
+        last_quote_ns, last_price = 0, 0.0
+
+        while True:
+            staleness_ns = self.ss.max_quote_staleness_ms * 1_000_000
+            timeout = max(0.0, (last_quote_ns + staleness_ns - time_ns()) / 1e9)
+
+            try:
+                await asyncio.wait_for(self.ss.market_changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            # Throttle bursts of changes to the minimum requote interval
+            wait_ns = last_quote_ns + self.ss.min_requote_interval_ms * 1_000_000 - time_ns()
+            if wait_ns > 0:
+                await asyncio.sleep(wait_ns / 1e9)
+
+            changed = self.ss.market_changed.is_set()
+            self.ss.market_changed.clear()
+            now = time_ns()
+
+            # Never quote off a book that is waiting on a snapshot resync
+            if not self._books_synced_():
                 continue
 
-            if self.ss.primary_data_feed == "BINANCE" and not self.ss.binance_ws_connected:
+            price = self._reference_price_()
+            moved_bps = abs(price / last_price - 1) * 1e4 if last_price > 0 else float("inf")
+            stale = now - last_quote_ns >= staleness_ns
+
+            if not stale and moved_bps < self.ss.requote_threshold_bps:
                 continue
 
-            break
+            if changed:
+                self.ss.requote_latency_ns.append(now - self.ss.market_changed_ns)
+
+            last_quote_ns, last_price = now, price
+            await self._quote_()
 
     async def primary_loop(self) -> None:
         """
         The primary loop of the strategy, executing continuously after WebSocket confirmations.
+
+        Runs on a fixed timer by default, or event-driven when `quote_mode` is set to Event.
         """
         print(f"{dt_now()}: Starting data feeds...")
-        await self._wait_for_ws_confirmation_()
+        await self._wait_until_ready_()
         print(f"{dt_now()}: Starting strategy...")
 
-        while True:
-            await asyncio.sleep(1)  # Strategy iteration delay
-            new_orders, spread = MarketMaker(self.ss).generate_quotes(debug=False)
-            await OMS(self.ss).run(new_orders, spread)
+        # Already imported alongside the kernel warm-up
+        from src.strategy.marketmaker import MarketMaker
+        from src.strategy.oms import OMS
+
+        self.market_maker = MarketMaker(self.ss)
+        self.oms = OMS(self.ss)
+        asyncio.create_task(self._report_startup_())
+
+        if self.ss.quote_mode == "EVENT":
+            await self._event_loop_()
+        else:
+            await self._timer_loop_()
+
+    async def _report_startup_(self) -> None:
+        """
+        Prints the timing of every startup phase once the first quote has been sent.
+        """
+        await self.ss.startup.wait("first_quote")
+        print(f"{dt_now()}: Startup phases (ms since launch):\n{self.ss.startup.report()}")
 
     async def run(self) -> None:
         """
-        Runs the strategy by starting data feeds and entering the primary strategy loop.
+        Runs the strategy by starting data feeds, compiling the quoting kernels and entering
+        the primary strategy loop, all concurrently.
+
+        The shared REST connection pools are closed once, when the strategy stops.
         """
-        await asyncio.gather(
-            DataFeeds(self.ss).start_feeds(),
-            self.primary_loop()
-        )
\ No newline at end of file
+        try:
+            await asyncio.gather(
+                DataFeeds(self.ss).start_feeds(),
+                self._warm_kernels_(),
+                self.primary_loop()
+            )
+        finally:
+            await self.ss.close_http()
\ No newline at end of file
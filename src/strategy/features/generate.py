@@ -2,7 +2,6 @@ import numpy as np
 from src.strategy.features.mark_spread import log_price_difference
 from src.strategy.features.bba_imbalance import bba_imbalance
 from src.strategy.features.ob_imbalance import orderbook_imbalance
-from src.strategy.features.trades_imbalance import trades_imbalance
 from src.sharedstate import SharedState
 
 class Features:
@@ -10,11 +9,14 @@ class Features:
     WARNING: Some features are disabled for Bybit-only streams    
     """
     _orderbook_depths_ = np.array([10, 25, 50, 100, 200, 500], dtype=np.int64)
-    _trades_window_ = 1000
 
     def __init__(self, ss: SharedState) -> None:
         self.ss = ss
 
+        # Per-band imbalances from the last orderbook_imbalance call, for diagnostics
+        self.bybit_orderbook_bands = np.zeros(self._orderbook_depths_.size, dtype=np.float64)
+        self.binance_orderbook_bands = np.zeros(self._orderbook_depths_.size, dtype=np.float64)
+
     def bybit_mark_wmid_spread(self) -> float:
         return log_price_difference(
             follow=self.ss.bybit_mark_price, 
@@ -50,30 +52,32 @@ class Features:
         )
     
     def bybit_orderbook_imbalance(self) -> float:
-        return orderbook_imbalance(
-            bids=self.ss.bybit_book.bids,
-            asks=self.ss.bybit_book.asks,
-            depths=self._orderbook_depths_
+        book = self.ss.bybit_book
+        weighted, self.bybit_orderbook_bands = orderbook_imbalance(
+            bids=book.bids,
+            asks=book.asks,
+            depths=self._orderbook_depths_,
+            bid_cumqty=book.bid_cumqty,
+            ask_cumqty=book.ask_cumqty
         )
+        return weighted
 
     def binance_orderbook_imbalance(self) -> float:
-        return orderbook_imbalance(
-            bids=self.ss.binance_book.bids,
-            asks=self.ss.binance_book.asks,
-            depths=self._orderbook_depths_
+        book = self.ss.binance_book
+        weighted, self.binance_orderbook_bands = orderbook_imbalance(
+            bids=book.bids,
+            asks=book.asks,
+            depths=self._orderbook_depths_,
+            bid_cumqty=book.bid_cumqty,
+            ask_cumqty=book.ask_cumqty
         )
+        return weighted
     
     def bybit_trades_imbalance(self) -> float:
-        return trades_imbalance(
-            trades=self.ss.bybit_trades._unwrap(), 
-            window=self._trades_window_
-        )
+        return self.ss.bybit_trades_imb.value
 
     def binance_trades_imbalance(self) -> float:
-        return trades_imbalance(
-            trades=self.ss.binance_trades._unwrap(), 
-            window=self._trades_window_
-        )
+        return self.ss.binance_trades_imb.value
 
     def generate_skew(self) -> float:
         total_skew = 0
@@ -1,10 +1,28 @@
 import numpy as np
 from numba import njit
 from numpy.typing import NDArray
+from typing import Tuple
 from src.indicators.ema import ema_weights
 
 @njit(cache=True)
-def orderbook_imbalance(bids: NDArray, asks: NDArray, depths: NDArray) -> float:
+def _count_within_(prices: NDArray, bound: float, descending: bool) -> int:
+    """
+    Binary searches a price-sorted book side for the number of levels within a price bound.
+    """
+    lo, hi = 0, prices.size
+
+    while lo < hi:
+        mid = (lo + hi) >> 1
+
+        if (prices[mid] >= bound) if descending else (prices[mid] <= bound):
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return lo
+
+@njit(cache=True)
+def orderbook_imbalance(bids: NDArray, asks: NDArray, depths: NDArray, bid_cumqty: NDArray, ask_cumqty: NDArray) -> Tuple[float, NDArray]:
     """
     Calculates the geometrically weighted order book imbalance across different price depths.
 
@@ -14,6 +32,9 @@ def orderbook_imbalance(bids: NDArray, asks: NDArray, depths: NDArray) -> float:
     assumes the first entry in both bids and asks arrays represents the best (highest) bid and 
     the best (lowest) ask, respectively.
 
+    The size within each depth is read from the cumulative quantity prefixes of the book, so
+    each depth band costs a binary search for its boundary level and a single lookup.
+
     Parameters
     ----------
     bids : NDArray
@@ -22,11 +43,16 @@ def orderbook_imbalance(bids: NDArray, asks: NDArray, depths: NDArray) -> float:
         An array of ask prices and quantities.
     depths : NDArray
         An array of price depths (in basis points) at which to calculate imbalance.
+    bid_cumqty : NDArray
+        The cumulative bid quantity from the best bid outwards, aligned with `bids`.
+    ask_cumqty : NDArray
+        The cumulative ask quantity from the best ask outwards, aligned with `asks`.
 
     Returns
     -------
-    float
-        The geometrically weighted imbalance across specified price depths.
+    Tuple[float, NDArray]
+        The geometrically weighted imbalance across specified price depths, and the
+        imbalance of each depth band before weighting.
 
     Notes
     -----
@@ -50,7 +76,7 @@ def orderbook_imbalance(bids: NDArray, asks: NDArray, depths: NDArray) -> float:
     ...     [102.00, 0.97438]
     ... ])
     >>> depths = np.array([10, 20, 30, 40, 50])  
-    >>> orderbook_imbalance(bids, asks, depths)
+    >>> orderbook_imbalance(bids, asks, depths, np.cumsum(bids[:, 1]), np.cumsum(asks[:, 1]))[0]
     -0.24142990048382099
     """
     num_depths = depths.size
@@ -58,21 +84,21 @@ def orderbook_imbalance(bids: NDArray, asks: NDArray, depths: NDArray) -> float:
     weights = ema_weights(num_depths)
     imbalances = np.empty(num_depths, dtype=np.float64)
 
-    bid_p, bid_q = bids.T
-    ask_p, ask_q = asks.T
+    bid_p = bids[:, 0]
+    ask_p = asks[:, 0]
     best_bid_p, best_ask_p = bid_p[0], ask_p[0]
     
     for i in range(num_depths):
         min_bid = best_bid_p * (1 - depths[i])
         max_ask = best_ask_p * (1 + depths[i])
 
-        num_bids_within_depth = bid_p[bid_p >= min_bid].size
-        num_asks_within_depth = ask_p[ask_p <= max_ask].size
-        total_bid_size_within_depth = np.sum(bid_q[:num_bids_within_depth])
-        total_ask_size_within_depth = np.sum(ask_q[:num_asks_within_depth])
+        num_bids_within_depth = _count_within_(bid_p, min_bid, True)
+        num_asks_within_depth = _count_within_(ask_p, max_ask, False)
+        total_bid_size_within_depth = bid_cumqty[num_bids_within_depth - 1] if num_bids_within_depth else 0.0
+        total_ask_size_within_depth = ask_cumqty[num_asks_within_depth - 1] if num_asks_within_depth else 0.0
 
         imbalances[i] = np.log(total_bid_size_within_depth / total_ask_size_within_depth)
 
     weighted_imbalance = np.sum(imbalances * weights)
     
-    return weighted_imbalance
\ No newline at end of file
+    return weighted_imbalance, imbalances
@@ -1,3 +1,4 @@
+import math
 import numpy as np
 from numba import njit
 from numpy.typing import NDArray
@@ -58,4 +59,148 @@ def trades_imbalance(trades: NDArray, window: int) -> float:
         else:
             delta_sells += weighted_qty
 
-    return (delta_buys - delta_sells) / (delta_buys + delta_sells)
\ No newline at end of file
+    return (delta_buys - delta_sells) / (delta_buys + delta_sells)
+
+class StreamingTradesImbalance:
+    """
+    Maintains the trades imbalance incrementally, as trades arrive, so reading it is O(1).
+
+    The geometrically weighted buy and sell sums of `trades_imbalance` are kept as running
+    totals. On each trade, both totals decay by (1 - alpha), the new log(1 + qty) is added
+    with weight alpha, and the trade leaving the window is removed with its final weight of
+    alpha * (1 - alpha) ** window. A ring of the last `window` log quantities per side holds
+    the values to evict, and the totals are recomputed from it exactly once every `window`
+    trades to bound floating point drift.
+
+    Once at least `window` trades have been seen, `value` equals `trades_imbalance` over the
+    last `window` trades (to within float rounding). Before that, the batch function derives
+    alpha from the shorter window while the accumulator keeps the full window's alpha.
+    The equivalence is tested in tests/test_trades_imbalance.py.
+
+    Attributes
+    ----------
+    window : int
+        The number of most recent trades in the imbalance.
+    alpha : float
+        The decay factor of the weights, 3 / (window + 1) unless given.
+    count : int
+        The number of trades seen.
+    buys : float
+        The weighted sum of log(1 + qty) over buy trades in the window.
+    sells : float
+        The weighted sum of log(1 + qty) over sell trades in the window.
+
+    Methods
+    -------
+    update(side: float, qty: float) -> None:
+        Adds a single trade to the accumulator.
+    extend(sides: NDArray, qtys: NDArray) -> None:
+        Adds a batch of trades to the accumulator, oldest first.
+    value -> float:
+        The normalized imbalance, from -1 (sell dominance) to 1 (buy dominance).
+
+    Examples
+    --------
+    >>> rng = np.random.default_rng(0)
+    >>> trades = np.column_stack((np.zeros(2500), rng.integers(0, 2, 2500), np.ones(2500), rng.random(2500)))
+    >>> stream = StreamingTradesImbalance(window=1000)
+    >>> for trade in trades:
+    ...     stream.update(trade[1], trade[3])
+    >>> bool(abs(stream.value - trades_imbalance(trades[-1000:], 1000)) < 1e-12)
+    True
+    """
+
+    def __init__(self, window: int=1000, alpha: float=0) -> None:
+        """
+        Initializes the accumulator with empty sums.
+
+        Parameters
+        ----------
+        window : int, optional
+            The number of most recent trades in the imbalance, by default 1000.
+        alpha : float, optional
+            The decay factor of the weights. If not provided, it is calculated as 3 / (window + 1).
+        """
+        self.window = window
+        self.alpha = 3 / float(window + 1) if alpha == 0 else alpha
+        self._decay_ = 1 - self.alpha
+        self._evict_weight_ = self.alpha * self._decay_ ** window
+
+        self.count = 0
+        self.buys, self.sells = 0.0, 0.0
+
+        self._buys_ring_ = [0.0] * window
+        self._sells_ring_ = [0.0] * window
+        self._head_ = 0
+
+    def update(self, side: float, qty: float) -> None:
+        """
+        Adds a single trade, decaying the sums and evicting the trade leaving the window.
+
+        Parameters
+        ----------
+        side : float
+            The trade side, 0.0 for buys and 1.0 for sells.
+        qty : float
+            The trade quantity.
+        """
+        log_qty = math.log(1 + qty)
+        buy, sell = (log_qty, 0.0) if side == 0.0 else (0.0, log_qty)
+
+        head = self._head_
+        evicted_buy, evicted_sell = self._buys_ring_[head], self._sells_ring_[head]
+        self._buys_ring_[head], self._sells_ring_[head] = buy, sell
+        self._head_ = head + 1 if head + 1 < self.window else 0
+        self.count += 1
+
+        if self._head_ == 0:
+            self._rebase_()
+            return
+
+        self.buys = self._decay_ * self.buys + self.alpha * buy - self._evict_weight_ * evicted_buy
+        self.sells = self._decay_ * self.sells + self.alpha * sell - self._evict_weight_ * evicted_sell
+
+    def extend(self, sides: NDArray, qtys: NDArray) -> None:
+        """
+        Adds a batch of trades, oldest first.
+
+        Parameters
+        ----------
+        sides : NDArray
+            The trade sides, 0.0 for buys and 1.0 for sells.
+        qtys : NDArray
+            The trade quantities.
+        """
+        # A batch covering the whole window replaces the ring outright
+        if qtys.size >= self.window:
+            log_qtys = np.log(1 + qtys[-self.window:])
+            is_buy = sides[-self.window:] == 0.0
+            self._buys_ring_ = np.where(is_buy, log_qtys, 0.0).tolist()
+            self._sells_ring_ = np.where(is_buy, 0.0, log_qtys).tolist()
+            self._head_ = 0
+            self.count += qtys.size
+            self._rebase_()
+            return
+
+        for side, qty in zip(sides.tolist(), qtys.tolist()):
+            self.update(side, qty)
+
+    def _rebase_(self) -> None:
+        """
+        Recomputes both sums exactly from the ring, newest trade first.
+        """
+        buys, sells, weight = 0.0, 0.0, self.alpha
+        j = self._head_
+
+        for _ in range(self.window):
+            j = j - 1 if j > 0 else self.window - 1
+            buys += self._buys_ring_[j] * weight
+            sells += self._sells_ring_[j] * weight
+            weight *= self._decay_
+
+        self.buys, self.sells = buys, sells
+
+    @property
+    def value(self) -> float:
+        total = self.buys + self.sells
+        return (self.buys - self.sells) / total if total > 0 else 0.0
@@ -25,7 +25,7 @@ class MarketMaker:
     lot_size : float
         The minimum quantity movement of an asset.
     spread : float
-        The adjusted spread based on market volatility.
+        The adjusted spread based on market volatility, updated on every call to generate_quotes.
 
     Methods
     -------
@@ -44,11 +44,16 @@ class MarketMaker:
     max_orders = 8
 
     def __init__(self, ss: SharedState) -> None:
+        """
+        Initializes the MarketMaker once, to be reused across quote cycles.
+
+        The instrument's tick and lot sizes must already be set on the shared state.
+        """
         self.ss = ss
         self.features = Features(self.ss)
         self.tick_size = self.ss.bybit_tick_size
         self.lot_size = self.ss.bybit_lot_size
-        self.spread = self._adjusted_spread_()
+        self.spread = self.ss.base_spread
 
     def _skew_(self) -> Tuple[float, float]:
         """
@@ -162,8 +167,8 @@ class MarketMaker:
             bid_lower = best_bid - (base_range * (1 - bid_skew))
             ask_upper = best_ask + (base_range * (1 - ask_skew))
                 
-            bid_prices = nbgeomspace(best_bid, bid_lower, self.max_orders/2) + self.ss.price_offset
-            ask_prices = nbgeomspace(best_ask, ask_upper, self.max_orders/2) + self.ss.price_offset
+            bid_prices = nbgeomspace(best_bid, bid_lower, self.max_orders // 2) + self.ss.price_offset
+            ask_prices = nbgeomspace(best_ask, ask_upper, self.max_orders // 2) + self.ss.price_offset
 
             return bid_prices, ask_prices
         
@@ -222,13 +227,13 @@ class MarketMaker:
             bid_sizes = nbgeomspace(
                 start=bid_min if bid_skew >= ask_skew else self.ss.min_order_size, 
                 end=bid_upper, 
-                n=self.max_orders/2
+                n=self.max_orders // 2
             ) + self.ss.size_offset
 
             ask_sizes = nbgeomspace(
                 start=ask_min if ask_skew >= bid_skew else self.ss.min_order_size, 
                 end=ask_upper, 
-                n=self.max_orders/2
+                n=self.max_orders // 2
             ) + self.ss.size_offset
 
             return bid_sizes, ask_sizes
@@ -254,6 +259,7 @@ class MarketMaker:
             A list of quotes, where each quote is a tuple containing the side, price, and size.
         """
         try:
+            self.spread = self._adjusted_spread_()
             bid_skew, ask_skew = self._skew_()
             bid_prices, ask_prices = self._prices_(bid_skew, ask_skew)
             bid_sizes, ask_sizes = self._sizes_(bid_skew, ask_skew)
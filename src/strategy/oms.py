@@ -1,32 +1,46 @@
 import asyncio
-from typing import List, Tuple, Coroutine, Union
-from src.utils.jit_funcs import nbabs
+from typing import List, Tuple, Coroutine
 from src.exchanges.bybit.post.order import Order
+from src.exchanges.bybit.post.wsorder import WsOrder
+from src.exchanges.bybit.post.actionqueue import OrderActionQueue
+from src.strategy.orderdiff import diff_orders
 from src.sharedstate import SharedState
-from src.strategy.ws_feeds.bybitprivatedata import log_event 
+from src.strategy.ws_feeds.bybitprivatedata import log_event
 class OMS:
     """
-    Manages the order lifecycle for Bybit, including segregating, amending, and placing orders based on strategy needs.
+    Manages the order lifecycle for Bybit, diffing resting orders against the target quotes
+    and only amending, cancelling or creating the levels that changed.
 
     Attributes
     ----------
     ss : SharedState
         Shared state object to access and update application-wide data.
+    order : Union[Order, WsOrder]
+        The order client, kept for the lifetime of the OMS so its session is reused. Sends
+        orders over the WebSocket trade stream if `order_transport` is Ws, else over REST.
+    queue : OrderActionQueue
+        Merges the cycle's amends, cancels and creates into full batches sent through `order`.
+    tolerance_ticks : int
+        The price distance, in ticks, within which a resting order is left in place.
 
     Methods
     -------
-    segregate_current_orders(orders: Dict) -> Tuple[List, List]:
+    segregate_current_orders() -> Tuple[List, List]:
         Segregates and sorts current orders into buys and sells.
     segregate_new_orders(orders: List) -> Tuple[List, List]:
         Segregates and sorts new orders into buys and sells.
-    amend_orders(current_orders: List, new_orders: List) -> Coroutine:
-        Amends existing orders based on new order instructions.
-    run(new_orders: List) -> Coroutine:
-        Orchestrates the order management process, including order segregation, synchronization, and amendment.
+    diff(new_orders: List) -> Tuple[List, List, List]:
+        Computes the amends, cancels and creates that turn the current orders into the new ones.
+    run(new_orders: List, spread: float) -> Coroutine:
+        Diffs the new orders against the current ones and sends each category as a batch.
     """
 
+    tolerance_ticks = 1
+
     def __init__(self, ss: SharedState) -> None:
         self.ss = ss
+        self.order = WsOrder(self.ss) if self.ss.order_transport == "WS" else Order(self.ss)
+        self.queue = OrderActionQueue(self.order)
 
     def segregate_current_orders(self) -> Tuple[List, List]:
         buys, sells = [], []
@@ -49,75 +63,73 @@ class OMS:
         buys.sort(key=lambda x: x[1], reverse=True)
         sells.sort(key=lambda x: x[1])
         return buys, sells
-    
-    def _orders_within_spread_(self, orders: List, spread: float) -> Union[List]:
-        within_spread = []
-        lower, upper = self.ss.bybit_mid - spread, self.ss.bybit_mid + spread
 
-        for order in orders:
-            price = order[1] if isinstance(order[1], float) else order[2]
-            if price >= lower and price <= upper:
-                within_spread.append(order)
-        return within_spread
+    def diff(self, new_orders: List[Tuple[str, float, float]]) -> Tuple[List, List, List]:
+        """
+        Matches current orders to new orders by side and level, most aggressive first.
 
-    def _orders_outside_spread_(self, orders: List, spread: float) -> Union[List]:
-        outside_spread = []
-        lower, upper = self.ss.bybit_mid - spread, self.ss.bybit_mid + spread
+        Parameters
+        ----------
+        new_orders : List[Tuple[str, float, float]]
+            A list of new orders, where each order is represented as a tuple of side, price, and quantity.
 
-        for order in orders:
-            price = order[1] if isinstance(order[1], float) else order[2]
-            if price < lower or price > upper:
-                outside_spread.append(order)
-        return outside_spread
-
-    def _within_bounds_(self, new_delta: float, sensitivity: float = 0.1) -> bool:
-        """Truthy whether delta is within min/max limits to change"""
-        lower = self.__primary_delta__ * (1 - sensitivity)
-        upper = self.__primary_delta__ * (1 + sensitivity)
-        return lower < new_delta and upper > new_delta
-    
-    # async def amend_orders(self, current_orders: List, new_orders: List) -> Coroutine:
-    #     tasks = [
-    #         asyncio.create_task(Order(self.ss).amend((current[0], new[1], new[2])))
-    #         for current, new in zip(current_orders, new_orders)
-    #         if nbabs(current[2] - new[1]) > self.ss.buffer
-    #     ]
-    #     return await asyncio.gather(*tasks)
-
-    async def amend_orders(self, current_orders: List, new_orders: List) -> Coroutine:
-            tasks = []
-            for current, new in zip(current_orders, new_orders):
-                if nbabs(current[2] - new[1]) > self.ss.buffer:
-                    try:
-                        tasks.append(asyncio.create_task(Order(self.ss).amend((current[0], new[1], new[2]))))
-                    except Exception as e:
-                        message = f"Error amending order {current[0]}: {e}" 
-                        asyncio.create_task(log_event('RUNTIME_ERROR', message))
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    message = f"Error in amend_orders task {i}: {result}"
-                    asyncio.create_task(log_event('API_ERROR', message))
-            return results
-    
-    # async def replace_orders(self, to_cancel: List, to_send: List) -> Coroutine:
-    #     ids_to_cancel = [order[0] for order in to_cancel]
-    #     tasks = [Order(self.ss).cancel_batch(ids_to_cancel)]
-    #     tasks.append(Order(self.ss).order_limit_batch(to_send))
-    #     return await asyncio.gather(*tasks)
-
-    async def replace_orders(self, to_cancel: List, to_send: List) -> Coroutine:
-            ids_to_cancel = [order[0] for order in to_cancel]
-            try: 
-                await Order(self.ss).cancel_batch(ids_to_cancel)
-            except Exception as e:
-                message = f"Error cancelling orders: {ids_to_cancel}, Reason: {e}"
-                asyncio.create_task(log_event('API_ERROR', message))
-            
-            tasks = [asyncio.create_task(Order(self.ss).order_limit_batch(to_send))]
-            return await asyncio.gather(*tasks)
-
-    async def run(self, new_orders: List[Tuple[str, float, float]], spread: float) -> None:
+        Returns
+        -------
+        Tuple[List, List, List]
+            The amends as [orderId, price, qty], the orderIds to cancel, and the orders to
+            create as [side, price, qty], across both sides.
+        """
+        current_bids, current_asks = self.segregate_current_orders()
+        new_bids, new_asks = self.segregate_new_orders(new_orders)
+        amends, cancels, creates = [], [], []
+
+        for current, new in ((current_bids, new_bids), (current_asks, new_asks)):
+            side_amends, side_cancels, side_creates = diff_orders(
+                current=current,
+                new=new,
+                tick_size=self.ss.bybit_tick_size,
+                lot_size=self.ss.bybit_lot_size,
+                tolerance_ticks=self.tolerance_ticks
+            )
+            amends.extend(side_amends)
+            cancels.extend(side_cancels)
+            creates.extend(side_creates)
+
+        return amends, cancels, creates
+
+    @staticmethod
+    def _accepted_(ack) -> bool:
+        """
+        Checks that an action's ack carries an orderId and no per-order error code.
+        """
+        return isinstance(ack, dict) and bool(ack.get("orderId")) and not ack.get("code")
+
+    def _apply_(self, amends: List, cancels: List, creates: List, acks: List) -> None:
+        """
+        Applies the actions the exchange accepted to `current_orders`, so the next cycle diffs
+        against them before the private order stream confirms. `acks` holds the exchange's
+        acknowledgement of each cancel, amend and create, in that order. Rejected or failed
+        actions leave their order as it was, until the private stream or the next sync.
+        """
+        cancel_acks = acks[:len(cancels)]
+        amend_acks = acks[len(cancels):len(cancels) + len(amends)]
+        create_acks = acks[len(cancels) + len(amends):]
+
+        for order_id, ack in zip(cancels, cancel_acks):
+            if self._accepted_(ack):
+                self.ss.current_orders.pop(order_id, None)
+
+        for (order_id, price, qty), ack in zip(amends, amend_acks):
+            if self._accepted_(ack) and order_id in self.ss.current_orders:
+                self.ss.current_orders[order_id].update(price=price, qty=qty)
+
+        for (side, price, qty), ack in zip(creates, create_acks):
+            if self._accepted_(ack):
+                self.ss.current_orders.setdefault(
+                    ack["orderId"], {"side": side, "price": price, "qty": qty}
+                )
+
+    async def run(self, new_orders: List[Tuple[str, float, float]], spread: float) -> Coroutine:
         """
         Orchestrates the order management process by comparing new orders against current ones,
         determining necessary adjustments, and executing them.
@@ -126,86 +138,39 @@ class OMS:
         1. No current orders
             -> Cancel all (for safety), then send new orders
 
-        2. All are bids/asks and have changed (extreme scenario)
-            -> Cancel missing and send new in singles
-
-        3. Current and new sides dont match (switching from/to extreme scenario)
-            -> Cancel all and send all new
-
-        4. 4 close to BBA orders have changed
-            -> Amend changed orders to new price/qty
-
-        5. Outer orders have changed more than buffer
-            -> Cancel changed and send changed as batch
+        2. Otherwise, diff current and new orders per side and level
+            -> Leave unchanged levels in place to keep their queue priority
+            -> Amend changed levels, cancel surplus orders and create missing ones through
+               the action queue, which merges them into full batches
 
         Parameters
         ----------
         new_orders : List[Tuple[str, float, float]]
             A list of new orders, where each order is represented as a tuple of side, price, and quantity.
+        spread : float
+            The spread the new orders were generated with.
         """
+        if not self.ss.current_orders:
+            await self.order.cancel_all()
+            amends, cancels, creates = [], [], list(new_orders)
+        else:
+            amends, cancels, creates = self.diff(new_orders)
 
-        # 1st check
-        # if not self.ss.current_orders:
-        # print("1st check triggered here!")
-        await Order(self.ss).cancel_all()
-        await Order(self.ss).order_limit_batch(new_orders)
-        # print(f"New orders: {self._orders_within_spread_(new_orders, spread)}")
-        current_bids, current_asks = self.segregate_current_orders()
-        # print(f"Current orders: {self._orders_within_spread_(current_bids + current_asks, spread)}")
-        return None
+        if not (amends or cancels or creates):
+            return None
 
-        # Sorting/segregating current & new orders
-        current_bids, current_asks = self.segregate_current_orders()
-        current_best_bids, current_best_asks = current_bids[:2], current_asks[:2]
-        current_outer_bids, current_outer_asks = current_bids[2:], current_asks[2:]
+        futures = [self.queue.cancel(order_id) for order_id in cancels]
+        futures += [self.queue.amend(order) for order in amends]
+        futures += [self.queue.create(order) for order in creates]
+        await self.queue.flush()
 
-        new_bids, new_asks = self.segregate_new_orders(new_orders)
-        new_best_bids, new_best_asks = new_bids[:2], new_asks[:2]
-        new_outer_bids, new_outer_asks = new_bids[2:], new_asks[2:]
-
-        # 2nd check
-        current_sides_len = len(set(order[1][0] for order in current_bids + current_asks))
-        new_sides_len = len(set(order[0] for order in new_orders))
-
-        if (current_sides_len == 1) and (new_sides_len == 1):
-            print("2nd check triggered here!")
-            current_unique_prices = set(order[2] for order in current_bids + current_asks)
-            new_unique_prices = set(order[1] for order in new_orders)
-            prices_to_cancel = current_unique_prices - new_unique_prices
-            prices_to_send = new_unique_prices - current_unique_prices
-
-            if prices_to_cancel or prices_to_send:
-                batches_to_cancel = []
-                batches_to_send = []
-                for price in prices_to_cancel:
-                    batches_to_cancel.append(order[0] for order in current_bids + current_asks if order[2] == price)
-                for price in prices_to_send:
-                    batches_to_send.append(order for order in new_orders if order[1] == price)
-                await self.replace_orders(batches_to_cancel, batches_to_send)
-
-            return None 
-
-        # 3rd check
-        if current_sides_len - new_sides_len != 0:
-            print("3rd check triggered here!")
-            await Order(self.ss).cancel_all()
-            await Order(self.ss).order_limit_batch(new_orders)
-
-        # 4th check
-        if new_best_bids and new_best_asks:
-            print("4th check triggered here!")
-            await self.amend_orders(current_best_bids, new_best_bids)
-            await self.amend_orders(current_best_asks, new_best_asks)
-
-        # 5th check
-        print("5th check triggered here!")
-        amend_batches = []
-
-        for current, new in zip(current_outer_bids + current_outer_asks, new_outer_bids + new_outer_asks):
-            if nbabs(current[2] - new[1]) > self.ss.buffer:
-                amend_batches.append([current[0], new[1], new[2]])
-
-        if amend_batches:
-            await Order(self.ss).amend_batch(amend_batches)
-
-        return None
\ No newline at end of file
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                message = f"Error in OMS run: {result}"
+                asyncio.create_task(log_event('RUNTIME_ERROR', message))
+
+        self._apply_(amends, cancels, creates, results)
+
+        return None
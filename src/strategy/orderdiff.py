@@ -0,0 +1,144 @@
+from typing import List, Tuple
+
+
+def match_orders(
+    current: List[List],
+    new: List[List],
+    price_tolerance: float,
+    qty_tolerance: float
+) -> List[Tuple[int, int]]:
+    """
+    Matches one side's resting orders to its target quotes with the fewest order actions.
+
+    Leaving a matched order in place costs nothing, amending it costs one action, and an
+    unmatched order costs one cancel or one create. The cheapest order-preserving matching
+    is found by dynamic programming over both sorted lists (an edit distance), breaking ties
+    by the total price distance moved. Keeping the matching order-preserving means an
+    amend never moves an order past another resting order on the same side.
+
+    Parameters
+    ----------
+    current : List[List]
+        Resting orders as [orderId, side, price, qty], most aggressive price first.
+    new : List[List]
+        Target quotes as [side, price, qty], most aggressive price first.
+    price_tolerance : float
+        The price distance within which a resting order can be left in place.
+    qty_tolerance : float
+        The quantity difference within which a resting order can be left in place.
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        The matched (current index, new index) pairs, in order.
+    """
+    n, m = len(current), len(new)
+
+    # cost[i][j] is the (actions, price distance) to turn current[i:] into new[j:]
+    cost = [[(0, 0.0)] * (m + 1) for _ in range(n + 1)]
+
+    for i in range(n, -1, -1):
+        for j in range(m, -1, -1):
+            if i == n and j == m:
+                continue
+
+            options = []
+
+            if i < n:
+                actions, distance = cost[i + 1][j]
+                options.append((actions + 1, distance))
+
+            if j < m:
+                actions, distance = cost[i][j + 1]
+                options.append((actions + 1, distance))
+
+            if i < n and j < m:
+                moved = abs(current[i][2] - new[j][1])
+                kept = moved <= price_tolerance and abs(current[i][3] - new[j][2]) <= qty_tolerance
+                actions, distance = cost[i + 1][j + 1]
+                options.append((actions + (0 if kept else 1), distance + moved))
+
+            cost[i][j] = min(options)
+
+    pairs = []
+    i, j = 0, 0
+
+    while i < n and j < m:
+        if cost[i][j] == (cost[i + 1][j][0] + 1, cost[i + 1][j][1]):
+            i += 1
+        elif cost[i][j] == (cost[i][j + 1][0] + 1, cost[i][j + 1][1]):
+            j += 1
+        else:
+            pairs.append((i, j))
+            i, j = i + 1, j + 1
+
+    return pairs
+
+
+def diff_orders(
+    current: List[List],
+    new: List[List],
+    tick_size: float,
+    lot_size: float,
+    tolerance_ticks: int=1
+) -> Tuple[List[List], List[str], List[List]]:
+    """
+    Diffs one side's resting orders against its target quotes.
+
+    Both lists are expected in the same order, most aggressive price first. Resting orders
+    are matched to target quotes by `match_orders`. A matched order is left untouched if
+    its price is within `tolerance_ticks` and its quantity within half a lot, else amended.
+    Unmatched resting orders are cancelled and unmatched targets created.
+
+    Parameters
+    ----------
+    current : List[List]
+        Resting orders as [orderId, side, price, qty].
+    new : List[List]
+        Target quotes as [side, price, qty].
+    tick_size : float
+        The minimum price movement of the instrument.
+    lot_size : float
+        The minimum quantity movement of the instrument.
+    tolerance_ticks : int, optional
+        The price distance, in ticks, within which a resting order is left in place (default 1).
+
+    Returns
+    -------
+    Tuple[List[List], List[str], List[List]]
+        The amends as [orderId, price, qty], the orderIds to cancel, and the quotes to create
+        as [side, price, qty].
+
+    Examples
+    --------
+    >>> current = [["a", "Buy", 100.0, 1.0], ["b", "Buy", 99.0, 1.0], ["c", "Buy", 98.0, 1.0]]
+    >>> new = [["Buy", 100.01, 1.0], ["Buy", 98.7, 1.0]]
+    >>> diff_orders(current, new, tick_size=0.01, lot_size=0.01)
+    ([['b', 98.7, 1.0]], ['c'], [])
+
+    When the ladder shifts by one level, only the ends change:
+
+    >>> new = [["Buy", 99.0, 1.0], ["Buy", 98.0, 1.0], ["Buy", 97.0, 1.0]]
+    >>> diff_orders(current, new, tick_size=0.01, lot_size=0.01)
+    ([], ['a'], [['Buy', 97.0, 1.0]])
+    """
+    price_tolerance = tolerance_ticks * tick_size + tick_size * 1e-6
+    qty_tolerance = lot_size / 2
+
+    pairs = match_orders(current, new, price_tolerance, qty_tolerance)
+    matched_current = {i for i, _ in pairs}
+    matched_new = {j for _, j in pairs}
+    amends = []
+
+    for i, j in pairs:
+        resting, target = current[i], new[j]
+        price_moved = abs(resting[2] - target[1]) > price_tolerance
+        qty_changed = abs(resting[3] - target[2]) > qty_tolerance
+
+        if price_moved or qty_changed:
+            amends.append([resting[0], target[1], target[2]])
+
+    cancels = [resting[0] for i, resting in enumerate(current) if i not in matched_current]
+    creates = [list(target) for j, target in enumerate(new) if j not in matched_new]
+
+    return amends, cancels, creates
@@ -0,0 +1,94 @@
+import asyncio
+from time import time_ns
+from typing import Dict, List
+
+
+class StartupPhases:
+    """
+    A readiness barrier over the concurrent cold-start phases (REST backfills, WS connects,
+    kernel compilation...), recording when each one started and finished.
+
+    Every phase is backed by an `asyncio.Event`, so waiters wake as soon as the phases they
+    depend on finish instead of polling. Phases are created on first use, and marking one
+    done again (e.g. on a WS reconnect) keeps its first timing.
+
+    Attributes
+    ----------
+    origin_ns : int
+        The time the tracker was created, which timings are reported relative to.
+    started_ns : Dict[str, int]
+        The time each phase started, in nanoseconds.
+    finished_ns : Dict[str, int]
+        The time each phase finished, in nanoseconds.
+
+    Methods
+    -------
+    begin(phase: str) -> None:
+        Marks a phase as started.
+    done(phase: str) -> None:
+        Marks a phase as finished, waking its waiters.
+    is_done(phase: str) -> bool:
+        Checks whether a phase has finished.
+    wait(*phases: str) -> None:
+        Waits until all the given phases have finished.
+    report() -> str:
+        Formats the per-phase timings.
+    """
+
+    def __init__(self) -> None:
+        self.origin_ns = time_ns()
+        self.started_ns: Dict[str, int] = {}
+        self.finished_ns: Dict[str, int] = {}
+        self._events_: Dict[str, asyncio.Event] = {}
+
+    def _event_(self, phase: str) -> asyncio.Event:
+        if phase not in self._events_:
+            self._events_[phase] = asyncio.Event()
+
+        return self._events_[phase]
+
+    def begin(self, phase: str) -> None:
+        self.started_ns.setdefault(phase, time_ns())
+
+    def done(self, phase: str) -> None:
+        if phase not in self.finished_ns:
+            self.finished_ns[phase] = time_ns()
+            self._event_(phase).set()
+
+    def is_done(self, phase: str) -> bool:
+        return phase in self.finished_ns
+
+    async def wait(self, *phases: str) -> None:
+        """
+        Waits until all the given phases have finished, in any order.
+
+        Parameters
+        ----------
+        *phases : str
+            The names of the phases to wait on.
+        """
+        for phase in phases:
+            await self._event_(phase).wait()
+
+    def report(self) -> str:
+        """
+        Formats when each finished phase started and finished, and how long it took, in
+        milliseconds since the tracker was created, ordered by finish time.
+
+        Returns
+        -------
+        str
+            One line per phase.
+        """
+        lines: List[str] = []
+
+        for phase, finished in sorted(self.finished_ns.items(), key=lambda item: item[1]):
+            end_ms = (finished - self.origin_ns) / 1e6
+
+            if phase in self.started_ns:
+                start_ms = (self.started_ns[phase] - self.origin_ns) / 1e6
+                lines.append(f"{phase:>18}: {start_ms:>9.1f} -> {end_ms:>9.1f} ms ({end_ms - start_ms:>8.1f} ms)")
+            else:
+                lines.append(f"{phase:>18}: {'':>9} -> {end_ms:>9.1f} ms")
+
+        return "\n".join(lines)
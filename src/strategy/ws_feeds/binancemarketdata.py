@@ -1,14 +1,16 @@
-import orjson
+import asyncio
 import websockets
-from typing import Coroutine, Union
+from typing import Coroutine, Dict, Union
 
 from src.utils.misc import datetime_now as dt_now
 from src.exchanges.binance.get.client import BinancePublicGet
 from src.exchanges.binance.websockets.handlers.orderbook import BinanceBBAHandler
 from src.exchanges.binance.websockets.handlers.trades import BinanceTradesHandler
 from src.exchanges.binance.websockets.public import BinancePublicWs
+from src.exchanges.common.wsdispatch import WsDispatcher
 from src.sharedstate import SharedState
-from src.strategy.ws_feeds.bybitprivatedata import log_event 
+from src.strategy.ws_feeds.bybitprivatedata import log_event, log_handler_error
+
 class BinanceMarketData:
     """
     Handles market data streams from Binance, including order book, BBA, and trades.
@@ -19,17 +21,27 @@ class BinanceMarketData:
         An instance of SharedState for managing and sharing application data.
     public_ws : BinancePublicWs
         A BinancePublicWs instance for WebSocket connections.
+    client : BinancePublicGet
+        The REST client used for the startup data and book resync snapshots.
     ws_url : str
         The WebSocket URL for subscribing to the market data streams.
     ws_topics : list
         A list of topics for which the WebSocket connection is established.
-    stream_handler_map : dict
-        A mapping of topics to their corresponding handler functions.
+    dispatcher : WsDispatcher
+        Routes messages to their stream's handler, keeping per-stream counts and processing times.
 
     Methods
     -------
     _initialize_() -> Coroutine:
-        Initializes the market data by fetching the latest order book and trades.
+        Initializes the market data by concurrently fetching the order book, trades and instrument info.
+    _set_precision_(info: Dict) -> None:
+        Assigns the symbol's tick & lot size from its instrument info.
+    _process_book_(recv: Dict) -> None:
+        Applies an order book message and signals the market change.
+    _handler_error_(topic: str, e: Exception) -> None:
+        Logs a handler's exception.
+    _fetch_snapshot_() -> Dict:
+        Fetches an order book snapshot for resyncing the local book.
     _stream_():
         Establishes a WebSocket connection and listens for incoming messages.
     start_feed() -> Coroutine:
@@ -49,61 +61,100 @@ class BinanceMarketData:
         """
         self.ss = ss
         self.public_ws = BinancePublicWs(self.ss)
+        self.client = BinancePublicGet(self.ss)
         self.ws_url, self.ws_topics = self.public_ws.multi_stream_request(topics=self._topics_)
 
-        self.stream_handler_map = {
-            self.ws_topics[0]: self.ss.binance_book.process,
-            self.ws_topics[1]: BinanceBBAHandler(self.ss).process,
-            self.ws_topics[2]: BinanceTradesHandler(self.ss).process,
-        }
+        self.dispatcher = WsDispatcher(
+            key="stream",
+            routes={
+                self.ws_topics[0]: self._process_book_,
+                self.ws_topics[1]: BinanceBBAHandler(self.ss).process,
+                self.ws_topics[2]: BinanceTradesHandler(self.ss).process,
+            },
+            on_error=self._handler_error_
+        )
+
+        self.ss.binance_book.snapshot_fetcher = self._fetch_snapshot_
+
+    def _process_book_(self, recv: Dict) -> None:
+        """
+        Applies an order book message to the local book and signals the market change.
+        """
+        self.ss.binance_book.process(recv)
+        self.ss.signal_market_change()
+
+    def _handler_error_(self, topic: str, e: Exception) -> None:
+        """
+        Logs a handler's exception, leaving the connection up. Repeated errors on a topic are
+        throttled by its error count.
+        """
+        log_handler_error("Binance Public Feed", topic, self.dispatcher.stats[topic].errors, e)
+
+    async def _fetch_snapshot_(self) -> Dict:
+        """
+        Fetches a REST order book snapshot, used by the local book to resync after a sequence gap.
+        """
+        return await self.client.orderbook(500)
 
     async def _initialize_(self) -> None:
         """
-        Fetches the latest order book and trades data to initialize the market data before streaming.
+        Fetches the order book, trades and instrument info concurrently, then applies them to
+        the shared market data before streaming.
         """
-        book = await BinancePublicGet(self.ss).orderbook(500)
-        trades = await BinancePublicGet(self.ss).trades(1000)
+        self.ss.startup.begin("binance_backfill")
+
+        book, trades, info = await asyncio.gather(
+            self._fetch_snapshot_(),
+            self.client.trades(1000),
+            self.client.instrument_info()
+        )
+
         self.ss.binance_book.process_snapshot(book)
         BinanceTradesHandler(self.ss).initialize(trades)
+        self._set_precision_(info)
+
+        self.ss.startup.done("binance_backfill")
 
-    async def _get_precision_(self) -> None:
+    def _set_precision_(self, info: Dict) -> None:
         """
-        Fetches and assigns the symbol's tick & lot size to the shared market data before streaming.
+        Assigns the symbol's tick & lot size to the shared market data.
         """
-        info = await BinancePublicGet(self.ss).instrument_info()
         self.ss.binance_tick_size = float(info["filters"][0]["tickSize"])
         self.ss.binance_lot_size = float(info["filters"][1]["stepSize"])
 
-async def _stream_(self) -> Union[Coroutine, None]:
+        if self.ss.orderbook_mode == "TICKS":
+            self.ss.binance_book.use_tick_ladder(self.ss.binance_tick_size)
+
+    async def _stream_(self) -> Union[Coroutine, None]:
         """
         Asynchronously listens for messages on the WebSocket and dispatches them to the appropriate handlers.
+
+        The REST backfill runs while the connection is opened, and messages received meanwhile
+        are buffered until it has been applied, so depth updates are sequenced against the snapshot.
         """
-        await self._initialize_()
-        await self._get_precision_()
+        initialized = asyncio.create_task(self._initialize_())
+        self.ss.startup.begin("binance_ws")
 
         async for websocket in websockets.connect(self.ws_url):
-            print(f"{dt_now()}: Connected to {self.ws_topics} binance feeds...")
-            self.ss.binance_ws_connected = True
-
             try:
-                while True:
-                    recv = orjson.loads(await websocket.recv())
+                self.ss.startup.done("binance_ws")
+                await initialized
 
-                    if "success" in recv:
-                        continue
+                print(f"{dt_now()}: Connected to {self.ws_topics} binance feeds...")
+                self.ss.binance_ws_connected = True
 
-                    handler = self.stream_handler_map.get(recv["stream"])
-
-                    if handler:
-                        try:  # Wrap message processing in a try...except block
-                            handler(recv)
-                        except Exception as e:
-                            asyncio.create_task(log_event('API_ERROR', f"Binance Public Feed - Stream: {recv['stream']} - Error: {e}"))
-                            raise e  # Re-raise to handle the error appropriately
+                while True:
+                    self.dispatcher.dispatch(await websocket.recv())
 
             except websockets.ConnectionClosed:
                 continue
 
             except Exception as e:
                 asyncio.create_task(log_event('API_ERROR', f"Binance Public Feed - General Error: {e}"))
-                raise e
\ No newline at end of file
+                raise e
+
+    async def start_feed(self) -> Coroutine:
+        """
+        Starts the WebSocket stream to receive live market data from Binance.
+        """
+        await self._stream_()
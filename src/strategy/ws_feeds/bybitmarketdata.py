@@ -1,6 +1,6 @@
-import orjson
+import asyncio
 import websockets
-from typing import Coroutine, Union
+from typing import Coroutine, Dict, Union
 
 from src.utils.misc import datetime_now as dt_now
 from src.exchanges.bybit.get.public import BybitPublicClient
@@ -10,8 +10,10 @@ from src.exchanges.bybit.websockets.handlers.orderbook import BybitBBAHandler
 from src.exchanges.bybit.websockets.handlers.ticker import BybitTickerHandler
 from src.exchanges.bybit.websockets.handlers.trades import BybitTradesHandler
 from src.exchanges.bybit.websockets.public import BybitPublicWs
+from src.exchanges.common.wsdispatch import WsDispatcher
 from src.sharedstate import SharedState
-from src.strategy.ws_feeds.bybitprivatedata import log_event 
+from src.strategy.ws_feeds.bybitprivatedata import log_event, log_handler_error
+
 class BybitMarketData:
     """
     Manages market data streams from Bybit, including order book, BBA, trades, ticker, and kline.
@@ -22,17 +24,27 @@ class BybitMarketData:
         An instance of SharedState for managing and sharing application data.
     public_ws : BybitPublicWs
         A BybitPublicWs instance for WebSocket connections.
+    client : BybitPublicClient
+        The REST client used for the startup data and book resync snapshots.
     ws_req : str
         The WebSocket request payload for subscribing to the market data streams.
     ws_topics : list
         A list of topics for which the WebSocket connection is established.
-    topic_handler_map : dict
-        A mapping of topics to their corresponding handler functions.
+    dispatcher : WsDispatcher
+        Routes messages to their topic's handler, keeping per-topic counts and processing times.
 
     Methods
     -------
     _initialize_():
-        Initializes the market data by fetching the latest klines and trades.
+        Initializes the market data by concurrently fetching the latest klines, trades and instrument info.
+    _set_precision_(info: Dict) -> None:
+        Assigns the symbol's tick & lot size from its instrument info.
+    _process_book_(recv: Dict) -> None:
+        Applies an order book message and signals the market change.
+    _handler_error_(topic: str, e: Exception) -> None:
+        Logs a handler's exception.
+    _fetch_snapshot_() -> Dict:
+        Fetches an order book snapshot for resyncing the local book.
     _stream_():
         Establishes a WebSocket connection and listens for incoming messages.
     start_feed() -> Coroutine:
@@ -52,69 +64,109 @@ class BybitMarketData:
         """
         self.ss = ss
         self.public_ws = BybitPublicWs(self.ss)
+        self.client = BybitPublicClient(self.ss)
         self.ws_req, self.ws_topics = self.public_ws.multi_stream_request(
             topics=self._topics_, 
             depth=500, 
             interval=1
         )
 
-        self.topic_handler_map = {
-            self.ws_topics[0]: self.ss.bybit_book.process,
-            self.ws_topics[1]: BybitBBAHandler(self.ss).process,
-            self.ws_topics[2]: BybitTradesHandler(self.ss).process,
-            self.ws_topics[3]: BybitTickerHandler(self.ss).process,
-            self.ws_topics[4]: BybitKlineHandler(self.ss).process,
-        }
+        self.dispatcher = WsDispatcher(
+            key="topic",
+            routes={
+                self.ws_topics[0]: self._process_book_,
+                self.ws_topics[1]: BybitBBAHandler(self.ss).process,
+                self.ws_topics[2]: BybitTradesHandler(self.ss).process,
+                self.ws_topics[3]: BybitTickerHandler(self.ss).process,
+                self.ws_topics[4]: BybitKlineHandler(self.ss).process,
+            },
+            on_error=self._handler_error_
+        )
+
+        self.ss.bybit_book.snapshot_fetcher = self._fetch_snapshot_
+
+    def _process_book_(self, recv: Dict) -> None:
+        """
+        Applies an order book message to the local book and signals the market change.
+        """
+        self.ss.bybit_book.process(recv)
+        self.ss.signal_market_change()
+
+    def _handler_error_(self, topic: str, e: Exception) -> None:
+        """
+        Logs a handler's exception, leaving the connection up. Repeated errors on a topic are
+        throttled by its error count.
+        """
+        log_handler_error("Bybit Public Feed", topic, self.dispatcher.stats[topic].errors, e)
+
+    async def _fetch_snapshot_(self) -> Dict:
+        """
+        Fetches a REST order book snapshot, used by the local book to resync after a sequence gap.
+        """
+        return (await self.client.orderbook(500))["result"]
 
     async def _initialize_(self) -> None:
         """
-        Fetches the latest klines and trades data to initialize the market data before streaming.
+        Fetches the latest klines, trades and instrument info concurrently, then applies them to
+        the shared market data before streaming.
+
+        The local book is seeded by the stream's own snapshot message.
         """
-        klines = await BybitPublicClient(self.ss).klines(1, 500)
-        trades = await BybitPublicClient(self.ss).trades(1000)
+        self.ss.startup.begin("bybit_backfill")
+
+        klines, trades, info = await asyncio.gather(
+            self.client.klines(1, 500),
+            self.client.trades(1000),
+            self.client.instrument_info()
+        )
+
         BybitKlineHandler(self.ss).initialize(klines["result"]["list"])
         BybitTradesHandler(self.ss).initialize(trades["result"]["list"])
+        self._set_precision_(info["result"]["list"][0])
 
-    async def _get_precision_(self) -> None:
+        self.ss.startup.done("bybit_backfill")
+
+    def _set_precision_(self, info: Dict) -> None:
         """
-        Fetches and assigns the symbol's tick & lot size to the shared market data before streaming.
+        Assigns the symbol's tick & lot size to the shared market data.
         """
-        info = (await BybitPublicClient(self.ss).instrument_info())["result"]["list"][0]
         self.ss.bybit_tick_size = float(info["priceFilter"]["tickSize"])
         self.ss.bybit_lot_size = float(info["lotSizeFilter"]["qtyStep"])
 
+        if self.ss.orderbook_mode == "TICKS":
+            self.ss.bybit_book.use_tick_ladder(self.ss.bybit_tick_size)
+
     async def _stream_(self) -> Union[Coroutine, None]:
         """
         Asynchronously listens for messages on the WebSocket and dispatches them to the appropriate handlers.
+
+        The REST backfill runs while the connection is opened, and messages received meanwhile
+        are buffered until it has been applied.
         """
-        await self._initialize_()
-        await self._get_precision_()
+        initialized = asyncio.create_task(self._initialize_())
+        self.ss.startup.begin("bybit_ws")
 
         async for websocket in websockets.connect(WsStreamLinks.FUTURES_PUBLIC_STREAM):
-            print(f"{dt_now()}: Connected to {self.ws_topics} bybit feeds...")
-            self.ss.bybit_ws_connected = True
-
             try:
                 await websocket.send(self.ws_req)
+                self.ss.startup.done("bybit_ws")
+                await initialized
 
-                while True:
-                    recv = orjson.loads(await websocket.recv())
+                print(f"{dt_now()}: Connected to {self.ws_topics} bybit feeds...")
+                self.ss.bybit_ws_connected = True
 
-                    if "success" in recv:
-                        continue
-
-                    handler = self.topic_handler_map.get(recv["topic"])
-
-                    if handler:
-                        try:  # Wrap message processing in a try...except block
-                            handler(recv)
-                        except Exception as e:
-                            asyncio.create_task(log_event('API_ERROR', f"Bybit Public Feed - Topic: {recv['topic']} - Error: {e}"))
-                            raise e  # Re-raise to handle the error appropriately
+                while True:
+                    self.dispatcher.dispatch(await websocket.recv())
 
             except websockets.ConnectionClosed:
                 continue
 
             except Exception as e:
                 asyncio.create_task(log_event('API_ERROR', f"Bybit Public Feed - General Error: {e}"))
-                raise e
\ No newline at end of file
+                raise e
+
+    async def start_feed(self) -> Coroutine:
+        """
+        Starts the WebSocket stream to receive live market data from Bybit.
+        """
+        await self._stream_()
@@ -1,5 +1,6 @@
 import asyncio
-import orjson
+import logging
+import logging.handlers
 import websockets
 from typing import Coroutine, Union
 
@@ -9,8 +10,59 @@ from src.exchanges.bybit.endpoints import WsStreamLinks
 from src.exchanges.bybit.websockets.handlers.order import BybitOrderHandler
 from src.exchanges.bybit.websockets.handlers.position import BybitPositionHandler
 from src.exchanges.bybit.websockets.private import BybitPrivateWs
+from src.exchanges.common.wsdispatch import WsDispatcher
 from src.sharedstate import SharedState
-from src.strategy.ws_feeds.bybitprivatedata import log_event 
+
+
+# Configured once on import, as a handler added per event leaks a file and duplicates every line
+logger = logging.getLogger('hft_logger')
+logger.setLevel(logging.INFO)
+
+if not logger.handlers:
+    # Rotating file handler for log management, opening the file on the first event
+    handler = logging.handlers.RotatingFileHandler(
+        'hft_log.txt', maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
+    )
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    logger.addHandler(handler)
+
+
+async def log_event(event_type: str, message: str):
+    """Logs events asynchronously to avoid blocking the main trading loop."""
+    try:
+        if event_type == 'FILL':
+            logger.info(f"FILL - {dt_now()} - {message}")
+        elif event_type == 'REJECTION':
+            logger.warning(f"REJECTION - {dt_now()} - {message}")
+        elif event_type == 'RUNTIME_ERROR':
+            logger.error(f"RUNTIME_ERROR - {dt_now()} - {message}")
+        elif event_type == 'API_ERROR':
+            logger.error(f"API_ERROR - {dt_now()} - {message}")
+
+    except Exception as e:
+        print(f"Error during logging: {e}") #  Fallback to console if logging fails
+
+
+def log_handler_error(feed: str, topic: str, errors: int, e: Exception) -> None:
+    """
+    Logs a feed handler's exception on the 1st, 2nd, 4th, 8th... error of its topic, so a
+    handler failing on every message logs a handful of lines rather than one per message.
+
+    Parameters
+    ----------
+    feed : str
+        The feed's name, e.g. "Bybit Public Feed".
+    topic : str
+        The topic whose handler raised.
+    errors : int
+        The topic's error count so far, including this one (the dispatcher's `TopicStats.errors`).
+    e : Exception
+        The exception raised.
+    """
+    if errors & (errors - 1) == 0:
+        asyncio.create_task(log_event('API_ERROR', f"{feed} - Topic: {topic} - Error: {e} - Errors so far: {errors}"))
+
+
 class BybitPrivateData:
     """
     Manages private data streams from Bybit, including position, execution, and order updates.
@@ -31,11 +83,13 @@ class BybitPrivateData:
         Handles order-related updates and synchronization.
     position_handler : BybitPositionHandler
         Handles position-related updates and synchronization.
-    topic_handler_map : dict
-        A mapping of topics to their corresponding handler functions.
+    dispatcher : WsDispatcher
+        Routes messages' data to their topic's handler, keeping per-topic counts and processing times.
 
     Methods
     -------
+    _handler_error_(topic: str, e: Exception) -> None:
+        Logs a handler's exception.
     _sync_() -> Coroutine:
         Periodically synchronizes the latest open orders and current positions.
     _stream_() -> Coroutine:
@@ -66,47 +120,56 @@ class BybitPrivateData:
         self.order_handler = BybitOrderHandler(self.ss)
         self.position_handler = BybitPositionHandler(self.ss)
 
-        self.topic_handler_map = {
-            self.ws_topics[0]: self.position_handler.process,
-            self.ws_topics[1]: self.order_handler.process,
-        }
+        # Routed by prefix, as topics carry a category suffix (e.g. "order.linear") when subscribed per category
+        self.dispatcher = WsDispatcher(
+            key="topic",
+            routes={},
+            prefixes={
+                self.ws_topics[0]: self.position_handler.process,
+                self.ws_topics[1]: self.order_handler.process,
+            },
+            payload="data",
+            on_error=self._handler_error_
+        )
+
+    def _handler_error_(self, topic: str, e: Exception) -> None:
+        """
+        Logs a handler's exception, leaving the connection up. Repeated errors on a topic are
+        throttled by its error count.
+        """
+        log_handler_error("Bybit Private Feed", topic, self.dispatcher.stats[topic].errors, e)
 
     async def _sync_(self) -> Coroutine:
         """
         Synchronizes open orders and current positions at regular intervals.
         """
+        self.ss.startup.begin("bybit_private_sync")
+
         while True:
-            open_orders = await self.private_client.open_orders()
-            current_position = await self.private_client.current_position()
+            open_orders, current_position = await asyncio.gather(
+                self.private_client.open_orders(),
+                self.private_client.current_position()
+            )
             self.order_handler.sync(open_orders)
             self.position_handler.sync(current_position)
+            self.ss.startup.done("bybit_private_sync")
             await asyncio.sleep(10)
 
-async def _stream_(self) -> Union[Coroutine, None]:
+    async def _stream_(self) -> Union[Coroutine, None]:
         """
         Connects to Bybit's combined private WebSocket stream and handles incoming updates.
         """
-        print(f"{dt_now()}: Connected to {self.ws_topics} bybit feeds...")
+        self.ss.startup.begin("bybit_private_ws")
 
         async for websocket in websockets.connect(WsStreamLinks.COMBINED_PRIVATE_STREAM):
             try:
                 await websocket.send(self.private_ws.authentication())
                 await websocket.send(self.ws_req)
+                print(f"{dt_now()}: Connected to {self.ws_topics} bybit feeds...")
+                self.ss.startup.done("bybit_private_ws")
 
                 while True:
-                    recv = orjson.loads(await websocket.recv())
-
-                    if "success" in recv:
-                        continue
-
-                    handler = self.topic_handler_map.get(recv["topic"])
-
-                    if handler:
-                        try:  # Wrap message processing in a try...except block
-                            handler(recv["data"])
-                        except Exception as e:
-                            asyncio.create_task(log_event('API_ERROR', f"Bybit Private Feed - Topic: {recv['topic']} - Error: {e}"))
-                            raise e  # Re-raise to handle the error appropriately
+                    self.dispatcher.dispatch(await websocket.recv())
 
             except websockets.ConnectionClosed:
                 continue
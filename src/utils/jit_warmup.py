@@ -0,0 +1,98 @@
+"""
+Compiles every numba kernel in `src/indicators`, `src/strategy/features` and
+`src/utils/jit_funcs.py` ahead of the first quote, on representative arguments of the
+dtypes, layouts and scalar types used live, so that a live call never compiles a new
+specialization.
+
+With `cache=True`, the compiled code is written to numba's on-disk cache, so this can also
+run as a build step and later starts only load it:
+    $ python -m src.utils.jit_warmup
+"""
+import numpy as np
+from numba.core.registry import CPUDispatcher
+from time import perf_counter_ns
+from typing import List, Tuple
+from src.indicators.bbw import bbw
+from src.indicators.ema import ema, ema_weights
+from src.strategy.features.generate import Features
+from src.strategy.features.mark_spread import log_price_difference
+from src.strategy.features.ob_imbalance import _count_within_, orderbook_imbalance
+from src.strategy.features.trades_imbalance import trades_imbalance
+from src.utils.jit_funcs import nbabs, nbclip, nbgeomspace, nblinspace, nbround
+
+
+def representative_calls() -> List[Tuple[str, CPUDispatcher, Tuple]]:
+    """
+    Builds a call of each kernel, for every argument signature it is called with.
+
+    Returns
+    -------
+    List[Tuple[str, CPUDispatcher, Tuple]]
+        The name, kernel and arguments of each call.
+    """
+    closes = np.linspace(100.0, 101.0, 20)
+    bids = np.column_stack((np.linspace(100.0, 99.0, 10), np.ones(10)))
+    asks = np.column_stack((np.linspace(100.1, 101.1, 10), np.ones(10)))
+    cumqty = np.cumsum(bids[:, 1])
+    trades = np.column_stack((np.zeros(10), np.arange(10) % 2.0, closes[:10], np.ones(10)))
+
+    return [
+        # Windows are ring buffer slices, and the multiplier an integer setting
+        ("bbw", bbw, (closes[:0], closes, 2)),
+        ("ema", ema, (closes, 10)),
+        ("ema_weights", ema_weights, (10, True)),
+        ("trades_imbalance", trades_imbalance, (trades, 10)),
+        ("_count_within_", _count_within_, (bids[:, 0], 99.5, True)),
+        ("orderbook_imbalance", orderbook_imbalance, (bids, asks, Features._orderbook_depths_, cumqty, cumqty)),
+        ("log_price_difference", log_price_difference, (100.0, 100.1)),
+        # Declared signatures, compiled (or loaded from cache) on import
+        ("nblinspace", nblinspace, (100.0, 99.0, 8)),
+        ("nbgeomspace", nbgeomspace, (100.0, 99.0, 4)),
+        ("nbround", nbround, (0.123, 2)),
+        ("nbabs", nbabs, (-0.5,)),
+        ("nbclip", nbclip, (0.5, 0.0, 1.0)),
+    ]
+
+
+def warmup() -> List[Tuple[str, float, str]]:
+    """
+    Calls every kernel once, compiling it or loading it from numba's on-disk cache.
+
+    Returns
+    -------
+    List[Tuple[str, float, str]]
+        The name of each call, the milliseconds it took, and whether the kernel was
+        "compiled", "cached" (loaded from disk) or "ready" (already loaded).
+    """
+    timings = []
+
+    for name, kernel, args in representative_calls():
+        signatures, hits = len(kernel.signatures), sum(kernel.stats.cache_hits.values())
+
+        start = perf_counter_ns()
+        kernel(*args)
+        elapsed_ms = (perf_counter_ns() - start) / 1e6
+
+        if sum(kernel.stats.cache_hits.values()) > hits:
+            source = "cached"
+        elif len(kernel.signatures) > signatures:
+            source = "compiled"
+        else:
+            source = "ready"
+
+        timings.append((name, elapsed_ms, source))
+
+    return timings
+
+
+def report(timings: List[Tuple[str, float, str]]) -> str:
+    """
+    Formats the timings returned by `warmup`, one line per call and a total.
+    """
+    total_ms = sum(elapsed_ms for _, elapsed_ms, _ in timings)
+    lines = [f"{name:>26}: {elapsed_ms:>8.1f} ms ({source})" for name, elapsed_ms, source in timings]
+    return "\n".join(lines + [f"{'total':>26}: {total_ms:>8.1f} ms"])
+
+
+if __name__ == "__main__":
+    print(report(warmup()))
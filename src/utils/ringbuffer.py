@@ -0,0 +1,146 @@
+import numpy as np
+from numpy.typing import NDArray
+from typing import Sequence, Tuple
+
+class ColumnarRingBuffer:
+    """
+    A fixed capacity ring buffer storing each column in its own contiguous float64 array.
+
+    Rows are written in place, so appends never allocate, and the most recent values of a
+    column are read as (at most) two non-copying slices instead of an unwrapped copy.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of rows held, after which the oldest rows are overwritten.
+    columns : Tuple[str, ...]
+        The names of the columns, in row order.
+    dtype : np.dtype
+        A structured float64 dtype with one field per column, for parsing batches of rows.
+    data : NDArray
+        A (len(columns), capacity) array, whose rows are the contiguous column arrays.
+    head : int
+        The index the next row will be written to.
+    size : int
+        The number of rows currently held.
+
+    Methods
+    -------
+    append(row: Sequence[float]) -> None:
+        Writes a single row, overwriting the oldest row if full.
+    extend(rows: NDArray) -> None:
+        Bulk writes a (k, len(columns)) array, or a structured array of `dtype`, oldest first.
+    pop() -> NDArray:
+        Removes and returns a copy of the most recent row.
+    column(name: str) -> NDArray:
+        Returns the full, physically ordered array of a column.
+    last(name: str, n: int) -> Tuple[NDArray, NDArray]:
+        Returns the last `n` values of a column as two chronological, non-copying slices.
+    latest(name: str) -> float:
+        Returns the most recent value of a column.
+    to_array() -> NDArray:
+        Returns a (size, len(columns)) copy of the rows, oldest first.
+    """
+
+    def __init__(self, capacity: int, columns: Sequence[str]) -> None:
+        """
+        Initializes the ring buffer with preallocated, zeroed columns.
+
+        Parameters
+        ----------
+        capacity : int
+            The maximum number of rows held.
+        columns : Sequence[str]
+            The names of the columns, in row order.
+        """
+        self.capacity = capacity
+        self.columns = tuple(columns)
+        self.dtype = np.dtype([(name, np.float64) for name in self.columns])
+        self.data = np.zeros((len(self.columns), capacity), dtype=np.float64)
+        self.head = 0
+        self.size = 0
+        self._index_ = {name: i for i, name in enumerate(self.columns)}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, row: Sequence[float]) -> None:
+        self.data[:, self.head] = row
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def extend(self, rows: NDArray) -> None:
+        """
+        Bulk writes rows in at most two slice copies, keeping only the last `capacity` rows.
+
+        Parameters
+        ----------
+        rows : NDArray
+            A (k, len(columns)) array of rows, or a structured array of `dtype`, oldest first.
+        """
+        if rows.dtype.names is not None:
+            rows = rows.view(np.float64).reshape(-1, len(self.columns))
+
+        count = rows.shape[0]
+
+        if count == 0:
+            return
+
+        if count > self.capacity:
+            rows = rows[-self.capacity:]
+            count = self.capacity
+
+        first = min(count, self.capacity - self.head)
+        self.data[:, self.head:self.head + first] = rows[:first].T
+        self.data[:, :count - first] = rows[first:].T
+
+        self.head = (self.head + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def pop(self) -> NDArray:
+        if self.size == 0:
+            raise IndexError("pop from an empty ring buffer")
+
+        self.head = (self.head - 1) % self.capacity
+        self.size -= 1
+        return self.data[:, self.head].copy()
+
+    def column(self, name: str) -> NDArray:
+        return self.data[self._index_[name]]
+
+    def last(self, name: str, n: int) -> Tuple[NDArray, NDArray]:
+        """
+        Returns the last `n` values of a column, without copying.
+
+        Parameters
+        ----------
+        name : str
+            The column name.
+        n : int
+            The number of most recent values, capped at the number of rows held.
+
+        Returns
+        -------
+        Tuple[NDArray, NDArray]
+            The older and newer slices, in chronological order. The older slice is
+            empty unless the values wrap around the end of the buffer.
+        """
+        column = self.data[self._index_[name]]
+        n = min(n, self.size)
+        start = self.head - n
+
+        if start >= 0:
+            return column[start:start], column[start:self.head]
+
+        return column[self.capacity + start:], column[:self.head]
+
+    def latest(self, name: str) -> float:
+        if self.size == 0:
+            raise IndexError("latest from an empty ring buffer")
+
+        return self.data[self._index_[name], self.head - 1]
+
+    def to_array(self) -> NDArray:
+        start = (self.head - self.size) % self.capacity
+        order = (start + np.arange(self.size)) % self.capacity
+        return self.data[:, order].T.copy()
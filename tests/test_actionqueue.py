@@ -0,0 +1,92 @@
+"""
+Checks that OrderActionQueue sends nothing until flushed, merges intents on the same
+orderId, and resolves each intent with its own ack from batches of 10.
+
+Run from the project root:
+    $ python -m pytest tests
+"""
+import asyncio
+from typing import Dict, List
+
+from src.exchanges.bybit.post.actionqueue import OrderActionQueue
+
+
+class MockOrder:
+    """
+    Records every batch sent, and acknowledges each order with its id.
+    """
+
+    def __init__(self) -> None:
+        self.calls: List = []
+
+    def _acks_(self, order_ids: List[str]) -> List[Dict]:
+        return [
+            {"result": {"list": [{"orderId": oid} for oid in order_ids[i:i+10]]}}
+            for i in range(0, len(order_ids), 10)
+        ]
+
+    async def cancel_batch(self, order_ids: List[str]) -> List[Dict]:
+        self.calls.append(("cancel_batch", list(order_ids)))
+        return self._acks_(order_ids)
+
+    async def amend_batch(self, orders: List) -> List[Dict]:
+        self.calls.append(("amend_batch", list(orders)))
+        return self._acks_([order[0] for order in orders])
+
+    async def order_limit_batch(self, orders: List) -> List[Dict]:
+        self.calls.append(("order_limit_batch", list(orders)))
+        return self._acks_([f"new-{i}" for i in range(len(orders))])
+
+
+def test_nothing_is_sent_until_flush():
+    order = MockOrder()
+    queue = OrderActionQueue(order)
+
+    async def run() -> None:
+        future = queue.cancel("a")
+        await asyncio.sleep(0.01)
+        assert order.calls == [] and not future.done()
+
+        await queue.flush()
+        assert (await future) == {"orderId": "a"}
+
+    asyncio.run(run())
+    assert order.calls == [("cancel_batch", ["a"])]
+
+
+def test_intents_on_the_same_order_are_merged():
+    order = MockOrder()
+    queue = OrderActionQueue(order)
+
+    async def run() -> List:
+        futures = [
+            queue.amend(("a", 100.0, 1.0)),
+            queue.cancel("a"),
+            queue.amend(("b", 100.0, 1.0)),
+            queue.amend(("b", 101.0, 1.0)),
+            queue.cancel("c"),
+            queue.cancel("c"),
+        ]
+        await queue.flush()
+        return await asyncio.gather(*futures)
+
+    acks = asyncio.run(run())
+
+    assert sorted(order.calls) == [("amend_batch", [("b", 101.0, 1.0)]), ("cancel_batch", ["a", "c"])]
+    assert [ack["orderId"] for ack in acks] == ["a", "a", "b", "b", "c", "c"]
+    assert queue.deduped == 3
+
+
+def test_each_create_gets_its_own_ack_across_batches():
+    order = MockOrder()
+    queue = OrderActionQueue(order)
+
+    async def run() -> List:
+        futures = [queue.create(("Buy", 100.0 - i, 1.0)) for i in range(23)]
+        await queue.flush()
+        return await asyncio.gather(*futures)
+
+    acks = asyncio.run(run())
+
+    assert [len(call[1]) for call in order.calls] == [23]
+    assert [ack["orderId"] for ack in acks] == [f"new-{i}" for i in range(23)]
@@ -0,0 +1,48 @@
+"""
+Checks that orderbook_imbalance, reading depth bands from cumulative quantity prefixes,
+matches the boolean-filter-and-sum implementation it replaced.
+
+Run from the project root:
+    $ python -m pytest tests
+"""
+import numpy as np
+import pytest
+
+from src.indicators.ema import ema_weights
+from src.strategy.features.ob_imbalance import orderbook_imbalance
+
+DEPTHS = np.array([10, 25, 50, 100, 200, 500], dtype=np.int64)
+
+
+def filtered_imbalance(bids: np.ndarray, asks: np.ndarray, depths: np.ndarray):
+    """
+    The previous implementation, filtering and summing each side for every depth band.
+    """
+    depths = depths / 1e-4
+    imbalances = np.empty(depths.size, dtype=np.float64)
+    bid_p, bid_q = bids.T
+    ask_p, ask_q = asks.T
+
+    for i in range(depths.size):
+        num_bids = bid_p[bid_p >= bid_p[0] * (1 - depths[i])].size
+        num_asks = ask_p[ask_p <= ask_p[0] * (1 + depths[i])].size
+        imbalances[i] = np.log(np.sum(bid_q[:num_bids]) / np.sum(ask_q[:num_asks]))
+
+    return np.sum(imbalances * ema_weights(depths.size)), imbalances
+
+
+def book(levels: int, tick: float, seed: int):
+    rng = np.random.default_rng(seed)
+    bids = np.column_stack((3000.0 - tick * np.arange(levels), rng.random(levels) * 10))
+    asks = np.column_stack((3000.0 + tick * np.arange(1, levels + 1), rng.random(levels) * 10))
+    return bids, asks
+
+
+@pytest.mark.parametrize("levels, tick, seed", [(5, 0.25, 0), (50, 0.01, 1), (500, 0.01, 2), (500, 1.0, 3)])
+def test_matches_filtered_implementation(levels, tick, seed):
+    bids, asks = book(levels, tick, seed)
+    weighted, bands = orderbook_imbalance(bids, asks, DEPTHS, np.cumsum(bids[:, 1]), np.cumsum(asks[:, 1]))
+    expected_weighted, expected_bands = filtered_imbalance(bids, asks, DEPTHS)
+
+    assert weighted == pytest.approx(expected_weighted, abs=1e-12)
+    np.testing.assert_allclose(bands, expected_bands, atol=1e-12)
@@ -0,0 +1,127 @@
+"""
+Checks OMS.run against a mocked order transport, without connecting to Bybit.
+
+Run from the project root:
+    $ python -m pytest tests
+"""
+import asyncio
+import itertools
+from types import SimpleNamespace
+from typing import Dict, List, Set
+import pytest
+
+import src.strategy.oms as oms_module
+from src.strategy.oms import OMS
+
+
+class MockOrder:
+    """
+    Records every call, and acknowledges batches the way Bybit does: a list of acks in
+    "result" and a per-order code in "retExtInfo". Orders whose id is in `rejected` get an
+    empty orderId and a non-zero code.
+    """
+
+    def __init__(self, ss) -> None:
+        self.calls: List = []
+        self.rejected: Set[str] = set()
+        self._ids_ = (f"new-{i}" for i in itertools.count())
+
+    def _batches_(self, order_ids: List[str]) -> List[Dict]:
+        results = []
+
+        for i in range(0, len(order_ids), 10):
+            batch = order_ids[i:i+10]
+            results.append({
+                "result": {"list": [{"orderId": "" if oid in self.rejected else oid} for oid in batch]},
+                "retExtInfo": {"list": [
+                    {"code": 110001, "msg": "order not exists"} if oid in self.rejected else {"code": 0, "msg": "OK"}
+                    for oid in batch
+                ]},
+            })
+
+        return results
+
+    async def cancel_all(self) -> Dict:
+        self.calls.append(("cancel_all",))
+        return {"result": {}}
+
+    async def cancel_batch(self, order_ids: List[str]) -> List[Dict]:
+        self.calls.append(("cancel_batch", list(order_ids)))
+        return self._batches_(order_ids)
+
+    async def amend_batch(self, orders: List) -> List[Dict]:
+        self.calls.append(("amend_batch", list(orders)))
+        return self._batches_([order[0] for order in orders])
+
+    async def order_limit_batch(self, orders: List) -> List[Dict]:
+        self.calls.append(("order_limit_batch", list(orders)))
+        return self._batches_([next(self._ids_) for _ in orders])
+
+
+@pytest.fixture
+def oms(monkeypatch) -> OMS:
+    monkeypatch.setattr(oms_module, "Order", MockOrder)
+    ss = SimpleNamespace(order_transport="REST", current_orders={}, bybit_tick_size=0.1, bybit_lot_size=0.01)
+    return OMS(ss)
+
+
+def resting(oms: OMS, orders: Dict[str, tuple]) -> None:
+    oms.ss.current_orders = {
+        order_id: {"side": side, "price": price, "qty": qty}
+        for order_id, (side, price, qty) in orders.items()
+    }
+
+
+def call_names(oms: OMS) -> List[str]:
+    return [call[0] for call in oms.order.calls]
+
+
+def test_no_resting_orders_cancels_all_then_sends_every_order(oms):
+    new = [("Buy", 99.0, 1.0), ("Sell", 101.0, 1.0)]
+    asyncio.run(oms.run(new, spread=2.0))
+
+    assert call_names(oms) == ["cancel_all", "order_limit_batch"]
+    assert oms.order.calls[1][1] == new
+    assert sorted(o["price"] for o in oms.ss.current_orders.values()) == [99.0, 101.0]
+
+
+def test_levels_within_tolerance_are_left_alone(oms):
+    resting(oms, {"b1": ("Buy", 99.0, 1.0), "s1": ("Sell", 101.0, 1.0)})
+    asyncio.run(oms.run([("Buy", 99.05, 1.0), ("Sell", 100.95, 1.0)], spread=2.0))
+
+    assert oms.order.calls == []
+    assert set(oms.ss.current_orders) == {"b1", "s1"}
+
+
+def test_surplus_orders_are_cancelled(oms):
+    resting(oms, {"b1": ("Buy", 99.0, 1.0), "b2": ("Buy", 98.0, 1.0), "s1": ("Sell", 101.0, 1.0)})
+    asyncio.run(oms.run([("Buy", 99.0, 1.0), ("Sell", 101.0, 1.0)], spread=2.0))
+
+    assert oms.order.calls == [("cancel_batch", ["b2"])]
+    assert set(oms.ss.current_orders) == {"b1", "s1"}
+
+
+def test_missing_orders_are_created(oms):
+    resting(oms, {"b1": ("Buy", 99.0, 1.0)})
+    asyncio.run(oms.run([("Buy", 99.0, 1.0), ("Sell", 101.0, 1.0)], spread=2.0))
+
+    assert oms.order.calls == [("order_limit_batch", [["Sell", 101.0, 1.0]])]
+    assert oms.ss.current_orders["new-0"] == {"side": "Sell", "price": 101.0, "qty": 1.0}
+
+
+def test_moved_levels_are_amended(oms):
+    resting(oms, {"b1": ("Buy", 99.0, 1.0), "s1": ("Sell", 101.0, 1.0)})
+    asyncio.run(oms.run([("Buy", 98.0, 1.0), ("Sell", 101.0, 1.0)], spread=2.0))
+
+    assert call_names(oms) == ["amend_batch"]
+    assert oms.ss.current_orders["b1"]["price"] == 98.0
+
+
+def test_rejected_cancels_and_amends_leave_state_unchanged(oms):
+    resting(oms, {"b1": ("Buy", 99.0, 1.0), "b2": ("Buy", 98.0, 1.0), "s1": ("Sell", 101.0, 1.0)})
+    oms.order.rejected = {"b2", "s1"}
+    asyncio.run(oms.run([("Buy", 99.0, 1.0), ("Sell", 102.0, 1.0)], spread=2.0))
+
+    assert call_names(oms) == ["cancel_batch", "amend_batch"]
+    assert "b2" in oms.ss.current_orders
+    assert oms.ss.current_orders["s1"]["price"] == 101.0
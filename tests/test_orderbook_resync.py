@@ -0,0 +1,87 @@
+"""
+Checks the buffered REST resync of the local order books: the backoff and logging of
+failed attempts, and a WebSocket snapshot superseding a resync still in flight.
+
+Run from the project root:
+    $ python -m pytest tests
+"""
+import asyncio
+from typing import Dict, List
+
+import src.exchanges.common.localorderbook as localorderbook
+import src.strategy.ws_feeds.bybitprivatedata as bybitprivatedata
+from src.exchanges.bybit.websockets.handlers.orderbook import OrderBookBybit
+
+
+def snapshot(update_id: int, bid: str, ask: str) -> Dict:
+    return {"a": [[ask, "1"]], "b": [[bid, "1"]], "u": update_id, "seq": update_id}
+
+
+def delta(update_id: int, bid: str) -> Dict:
+    return {"type": "delta", "data": {"a": [], "b": [[bid, "2"]], "u": update_id, "seq": update_id}}
+
+
+def test_failed_resyncs_back_off_exponentially_and_are_logged(monkeypatch):
+    sleeps: List[float] = []
+    logged: List[str] = []
+    yield_once = asyncio.sleep
+
+    async def sleep(delay: float) -> None:
+        sleeps.append(delay)
+        await yield_once(0)
+
+    async def log_event(event_type: str, message: str) -> None:
+        logged.append(event_type)
+
+    monkeypatch.setattr(localorderbook.asyncio, "sleep", sleep)
+    monkeypatch.setattr(bybitprivatedata, "log_event", log_event)
+
+    book = OrderBookBybit(capacity=10)
+    book.process({"type": "snapshot", "data": snapshot(1, "99", "101")})
+    attempts = []
+
+    async def fetcher() -> Dict:
+        attempts.append(None)
+        if len(attempts) <= 8:
+            raise ConnectionError("unreachable")
+        return snapshot(5, "98", "101")
+
+    async def run() -> None:
+        book.snapshot_fetcher = fetcher
+        book.process(delta(5, "98.5"))
+        await book._resync_task_
+
+    asyncio.run(run())
+
+    assert sleeps == [1, 2, 4, 8, 16, 32, 60, 60]
+    assert logged == ["API_ERROR"] * 8
+    assert book.synced and book.last_update_id == 5
+
+
+def test_ws_snapshot_cancels_a_pending_resync():
+    book = OrderBookBybit(capacity=10)
+    book.process({"type": "snapshot", "data": snapshot(1, "99", "101")})
+
+    async def run() -> None:
+        released = asyncio.Event()
+
+        async def fetcher() -> Dict:
+            await released.wait()
+            return snapshot(3, "97", "103")
+
+        book.snapshot_fetcher = fetcher
+        book.process(delta(3, "98.5"))
+        task = book._resync_task_
+        await asyncio.sleep(0)
+
+        # The exchange pushes a newer snapshot before the REST one returns
+        book.process({"type": "snapshot", "data": snapshot(10, "99.5", "100.5")})
+        released.set()
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+
+    asyncio.run(run())
+
+    assert book.synced and book.last_update_id == 10
+    assert book.best_bid == 99.5 and book.best_ask == 100.5
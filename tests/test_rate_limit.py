@@ -0,0 +1,86 @@
+"""
+Checks that private POST requests rejected by Bybit's rate limit back off a full window
+between attempts, even without limit headers, and raise once the retries are exhausted.
+
+Run from the project root:
+    $ python -m pytest tests
+"""
+import asyncio
+from types import SimpleNamespace
+from typing import Dict, List
+
+import orjson
+import pytest
+
+import src.exchanges.common.ratelimit as ratelimit
+from src.exchanges.bybit.post.client import BybitPrivatePostClient
+from src.exchanges.common.ratelimit import RateGovernor
+
+ENDPOINT = "/v5/order/create-batch"
+
+
+class MockResponse:
+    def __init__(self, body: Dict, headers: Dict) -> None:
+        self.body, self.headers = body, headers
+
+    async def read(self) -> bytes:
+        return orjson.dumps(self.body)
+
+
+class MockSession:
+    """
+    Answers every request with the queued bodies in turn, without rate limit headers.
+    """
+
+    def __init__(self, bodies: List[Dict]) -> None:
+        self.bodies = bodies
+        self.requests = 0
+
+    async def request(self, method: str, url: str, **kwargs) -> MockResponse:
+        body = self.bodies[min(self.requests, len(self.bodies) - 1)]
+        self.requests += 1
+        return MockResponse(body, headers={})
+
+
+RATE_LIMITED = {"retCode": 10006, "retMsg": "Too many visits!", "result": {}, "time": 0}
+OK = {"retCode": 0, "retMsg": "OK", "result": {"list": []}, "retExtInfo": {"list": []}, "time": 0}
+
+
+@pytest.fixture
+def waits(monkeypatch) -> List[float]:
+    """
+    Records the token bucket's waits instead of sleeping through them.
+    """
+    waits, now = [], [0.0]
+
+    async def sleep(delay: float) -> None:
+        waits.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(ratelimit, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", sleep)
+    return waits
+
+
+def client() -> BybitPrivatePostClient:
+    ss = SimpleNamespace(api_key="key", api_secret="secret", bybit_rate_limits=RateGovernor({}))
+    return BybitPrivatePostClient(ss)
+
+
+def test_rate_limited_retry_waits_for_the_next_window(waits):
+    session = MockSession([RATE_LIMITED, OK])
+    result = asyncio.run(client().submit(session, ENDPOINT, b"{}"))
+
+    assert session.requests == 2
+    assert result["result"] == {"list": []}
+    assert sum(waits) == pytest.approx(1.0)
+
+
+def test_exhausted_rate_limited_retries_raise(waits):
+    session = MockSession([RATE_LIMITED])
+
+    with pytest.raises(Exception, match="Rate limited after 3 attempts"):
+        asyncio.run(client().submit(session, ENDPOINT, b"{}"))
+
+    assert session.requests == 3
+    assert sum(waits) == pytest.approx(2.0)
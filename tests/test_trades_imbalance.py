@@ -0,0 +1,105 @@
+"""
+Checks that StreamingTradesImbalance matches the batch trades_imbalance over the same
+trade stream, once at least a full window of trades has been seen.
+
+Run from the project root:
+    $ python -m pytest tests
+"""
+import numpy as np
+import pytest
+
+from src.strategy.features.trades_imbalance import StreamingTradesImbalance, trades_imbalance
+
+TOLERANCE = 1e-12
+
+
+def trade_stream(count: int, seed: int=0) -> np.ndarray:
+    """
+    Builds `count` trades in the [time, side, price, size] format of the trades buffers,
+    oldest first.
+    """
+    rng = np.random.default_rng(seed)
+    return np.column_stack((
+        np.arange(count, dtype=np.float64),
+        rng.integers(0, 2, count).astype(np.float64),
+        np.full(count, 100.0),
+        rng.random(count) * 10,
+    ))
+
+
+def batch(trades: np.ndarray, window: int) -> float:
+    """
+    The batch imbalance over the last `window` trades, as the features computed it before.
+    """
+    return trades_imbalance(trades[-window:], window)
+
+
+@pytest.mark.parametrize("count", [50, 51, 99, 100, 101, 137])
+def test_update_matches_batch_around_the_window_boundary(count):
+    trades = trade_stream(count)
+    stream = StreamingTradesImbalance(window=50)
+
+    for trade in trades:
+        stream.update(trade[1], trade[3])
+
+    assert stream.count == count
+    assert stream.value == pytest.approx(batch(trades, 50), abs=TOLERANCE)
+
+
+def test_update_matches_batch_after_every_trade_past_the_first_window():
+    trades = trade_stream(300)
+    stream = StreamingTradesImbalance(window=50)
+
+    for i, trade in enumerate(trades, start=1):
+        stream.update(trade[1], trade[3])
+
+        if i >= 50:
+            assert stream.value == pytest.approx(batch(trades[:i], 50), abs=TOLERANCE)
+
+
+def test_rebase_keeps_many_updates_in_line_with_batch(monkeypatch):
+    trades = trade_stream(25007, seed=1)
+    stream = StreamingTradesImbalance(window=1000)
+    rebases = []
+
+    rebase = stream._rebase_
+    monkeypatch.setattr(stream, "_rebase_", lambda: (rebases.append(stream.count), rebase()))
+
+    for trade in trades:
+        stream.update(trade[1], trade[3])
+
+    # Once per full lap of the ring, and the 7 trades since the last one are decayed in place
+    assert rebases == list(range(1000, 25001, 1000))
+    assert stream.value == pytest.approx(batch(trades, 1000), abs=TOLERANCE)
+
+
+def test_evicted_trade_no_longer_counts():
+    stream = StreamingTradesImbalance(window=10)
+
+    # A large buy, then a full window of small sells pushes it out
+    stream.update(0.0, 1000.0)
+    for _ in range(9):
+        stream.update(1.0, 0.1)
+    assert stream.value > 0
+
+    stream.update(1.0, 0.1)
+    assert stream.value == pytest.approx(-1.0, abs=TOLERANCE)
+
+
+def test_extend_matches_update_and_batch():
+    trades = trade_stream(1234, seed=2)
+    extended = StreamingTradesImbalance(window=100)
+    updated = StreamingTradesImbalance(window=100)
+
+    # Batches shorter than the window, then one covering it, then shorter ones again
+    for start, stop in [(0, 30), (30, 90), (90, 400), (400, 1200), (1200, 1234)]:
+        extended.extend(trades[start:stop, 1], trades[start:stop, 3])
+
+        for trade in trades[start:stop]:
+            updated.update(trade[1], trade[3])
+
+        assert extended.count == updated.count == stop
+
+        if stop >= 100:
+            assert extended.value == pytest.approx(updated.value, abs=TOLERANCE)
+            assert extended.value == pytest.approx(batch(trades[:stop], 100), abs=TOLERANCE)